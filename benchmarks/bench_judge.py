@@ -0,0 +1,127 @@
+# benchmarks/bench_judge.py
+"""
+Drives AnswerSatisfactionVerifier's judge path through the mock ollama
+server (benchmarks/mock_ollama_server.py) at several concurrency levels,
+so pooling, batching and caching can be measured offline:
+  - thread:        verify() per answer on a thread pool, sync ollama.chat
+  - async:         averify() per answer through the pooled JudgeClient
+  - async+batch:   averify_batch() per GRPO group (one call per group)
+  - cached rerun:  averify_batch() again over the same dataset, with a
+                   JudgeCache filled by a first pass (no judge calls)
+
+Scores are deterministic, so every mode must agree; the table shows
+wall time, answers per second, judge requests and TCP connections.
+
+Usage:
+    python benchmarks/bench_judge.py [--groups 32] [--group-size 16] [--concurrency 4,16,64]
+                                     [--latency-ms 50] [--per-answer-ms 5] [--capacity 0]
+                                     [--error-rate 0] [--malformed-rate 0]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ollama import Client
+
+from benchmarks.mock_ollama_server import MockOllamaServer
+from verifiers.reasoning import answer_satisfaction_verifier
+from verifiers.reasoning.answer_satisfaction_verifier import AnswerSatisfactionVerifier
+from verifiers.reasoning.helpers.judge_cache import JudgeCache
+from verifiers.reasoning.helpers.judge_client import JudgeClient
+
+def make_groups(groups: int, group_size: int) -> list:
+    """(question, gold answer, completions) per group; about one answer in four repeats another."""
+    dataset = []
+    for g in range(groups):
+        a, b = 17 + g, 29 + 3 * g
+        texts = [
+            f"<think>{a} + {b}</think><answer>{a} + {b} = {a + b + (i if i % 4 else 0)}</answer>"
+            for i in range(group_size)
+        ]
+        dataset.append((f"What is {a} + {b}?", str(a + b), texts))
+    return dataset
+
+def run_thread(server: MockOllamaServer, dataset: list, concurrency: int) -> list:
+    # The sync path calls the module's ollama.chat; point it at the mock server
+    answer_satisfaction_verifier.chat = Client(host=server.url).chat
+    verifier = AnswerSatisfactionVerifier(cache=None)
+    jobs = [(text, question, gold) for question, gold, texts in dataset for text in texts]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(lambda job: verifier.verify(job[0], question=job[1], gold_answer=job[2]), jobs))
+
+async def run_async(server: MockOllamaServer, dataset: list, concurrency: int,
+                    batched: bool, cache: JudgeCache = None) -> list:
+    judge = JudgeClient(host=server.url, max_concurrency=concurrency, retries=3, backoff=0.05)
+    verifier = AnswerSatisfactionVerifier(judge=judge, cache=cache)
+    try:
+        if batched:
+            results = await asyncio.gather(*[
+                verifier.averify_batch(texts, question=question, gold_answer=gold)
+                for question, gold, texts in dataset
+            ])
+            return [score for scores in results for score in scores]
+        return list(await asyncio.gather(*[
+            verifier.averify(text, question=question, gold_answer=gold)
+            for question, gold, texts in dataset for text in texts
+        ]))
+    finally:
+        await judge.aclose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the LLM judge path against a mock ollama server.")
+    parser.add_argument("--groups", type=int, default=32, help="Number of questions (GRPO groups)")
+    parser.add_argument("--group-size", type=int, default=16, help="Completions per question")
+    parser.add_argument("--concurrency", default="4,16,64", help="Comma-separated concurrency levels")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Mock judge mean latency per call")
+    parser.add_argument("--per-answer-ms", type=float, default=5.0, help="Mock judge latency per answer")
+    parser.add_argument("--capacity", type=int, default=0, help="Mock judge parallel slots (0 = unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of HTTP 503 replies")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of invalid JSON replies")
+    args = parser.parse_args()
+
+    # Only the cached-rerun mode uses a verdict cache
+    os.environ.pop("JUDGE_CACHE_PATH", None)
+    dataset = make_groups(args.groups, args.group_size)
+    answers = sum(len(texts) for _, _, texts in dataset)
+
+    server = MockOllamaServer(
+        latency_ms=args.latency_ms, per_answer_ms=args.per_answer_ms, capacity=args.capacity,
+        error_rate=args.error_rate, malformed_rate=args.malformed_rate,
+    )
+    with server, tempfile.TemporaryDirectory() as tmp:
+        print(f"{answers} answers in {args.groups} groups; mock judge at {server.url} "
+              f"({args.latency_ms:g} ms + {args.per_answer_ms:g} ms/answer)")
+        print(f"{'mode':<14} {'conc':>5} {'time':>9} {'answers/s':>10} {'requests':>9} {'conns':>6}")
+        reference = None
+        for concurrency in [int(c) for c in args.concurrency.split(",")]:
+            cache = JudgeCache(os.path.join(tmp, f"judge_{concurrency}.sqlite"))
+            modes = [
+                ("thread", lambda: run_thread(server, dataset, concurrency)),
+                ("async", lambda: asyncio.run(run_async(server, dataset, concurrency, batched=False))),
+                ("async+batch", lambda: asyncio.run(run_async(server, dataset, concurrency, batched=True))),
+                ("cached rerun", lambda: asyncio.run(run_async(server, dataset, concurrency, batched=True, cache=cache))),
+            ]
+            # Fill the cache for the rerun
+            asyncio.run(run_async(server, dataset, concurrency, batched=True, cache=cache))
+
+            for name, run in modes:
+                server.reset_stats()
+                start = time.perf_counter()
+                scores = run()
+                elapsed = time.perf_counter() - start
+                stats = server.stats()
+                if not args.error_rate and not args.malformed_rate:
+                    reference = reference or scores
+                    assert scores == reference, f"{name} scores differ from the other modes"
+                print(f"{name:<14} {concurrency:>5} {elapsed * 1000:>7.0f}ms {answers / elapsed:>10.0f} "
+                      f"{stats['requests']:>9} {stats['connections']:>6}")
+
+if __name__ == "__main__":
+    main()
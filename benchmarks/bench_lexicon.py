@@ -0,0 +1,131 @@
+# benchmarks/bench_lexicon.py
+"""
+Compares the compiled, memory-mapped lexicon with pronouncing's dict.
+
+  1) Cold start: time and memory to make the first lookup, each measured
+     in a fresh subprocess so neither side sees the other's data.
+  2) Lookups, for a mix of known and unknown words:
+       - raw:      pronouncing's dict lookup of a word's phone strings vs
+                   Lexicon.lookup() (decoded Entry, hash probe in Python)
+       - features: the cost of getting (syllables, rhyme tail), the values
+                   the poetry verifiers need, which pronouncing has to parse
+                   from the phones on every call
+
+The lexicon is faster on the features path, the one the verifiers use.
+A raw lookup remains a few times slower than a plain dict lookup, since its
+hash probe runs in Python. Repeated words are served by word_cache either way.
+
+Usage:
+    python benchmarks/bench_lexicon.py [--words N] [--repeat R]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+COLD_START = {
+    "pronouncing": "import pronouncing; pronouncing.phones_for_word('cat')",
+    "lexicon": (
+        "from verifiers.poetry.helpers.lexicon import get_lexicon; "
+        "get_lexicon().lookup('cat')"
+    ),
+}
+
+def _rss_kb() -> int:
+    """Resident set size of this process in kB (Linux), or 0 if unknown."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+def cold_start(name: str) -> dict:
+    code = (
+        "import json, time, sys\n"
+        f"sys.path.insert(0, {ROOT!r})\n"
+        f"from benchmarks.bench_lexicon import _rss_kb\n"
+        "before = _rss_kb()\n"
+        "start = time.perf_counter()\n"
+        f"{COLD_START[name]}\n"
+        "print(json.dumps({'seconds': time.perf_counter() - start, 'rss_kb': _rss_kb() - before}))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(output.stdout)
+
+def bench_lookups(word_count: int, repeat: int) -> dict:
+    import pronouncing
+    from verifiers.poetry.helpers.lexicon import (
+        get_lexicon,
+        rhyme_tail_from_phones,
+        syllables_from_phones
+    )
+
+    pronouncing.init_cmu()
+    lexicon = get_lexicon()
+
+    # Every k-th dictionary word plus 10% unknown words
+    known = list(pronouncing.lookup)
+    words = known[::max(1, len(known) // word_count)][:word_count]
+    words += [f"zq{i}x" for i in range(len(words) // 10)]
+
+    def dict_path(word):
+        phones = pronouncing.phones_for_word(word)
+        if not phones:
+            return None
+        return syllables_from_phones(phones[0]), rhyme_tail_from_phones(phones[0])
+
+    def lexicon_path(word):
+        entry = lexicon.lookup(word)
+        if entry is None:
+            return None
+        return entry[0], entry[1]
+
+    results = {}
+    for name, fn in [
+        ("dict_raw", pronouncing.phones_for_word),
+        ("lexicon_raw", lexicon.lookup),
+        ("dict_features", dict_path),
+        ("lexicon_features", lexicon_path),
+    ]:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for word in words:
+                fn(word)
+            best = min(best, time.perf_counter() - start)
+        results[name] = best / len(words) * 1e9
+    return {"words": len(words), "ns_per_word": results, "file_bytes": lexicon.size_bytes}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the compiled lexicon against pronouncing.")
+    parser.add_argument("--words", type=int, default=5000, help="Number of dictionary words to look up")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    # Make sure the compiled file exists so the cold start measures loading, not building
+    from verifiers.poetry.helpers.lexicon import get_lexicon
+    get_lexicon()
+
+    print("Cold start (fresh process):")
+    for name in COLD_START:
+        stats = cold_start(name)
+        print(f"  {name:<12} {stats['seconds'] * 1000:8.1f} ms  {stats['rss_kb'] / 1024:6.1f} MB RSS")
+
+    lookups = bench_lookups(args.words, args.repeat)
+    print(f"\nLookups ({lookups['words']} words, file {lookups['file_bytes'] / 1e6:.1f} MB):")
+    ns_per_word = lookups["ns_per_word"]
+    for name, ns in ns_per_word.items():
+        print(f"  {name:<17} {ns:8.0f} ns/word")
+    print(f"  features: lexicon {ns_per_word['dict_features'] / ns_per_word['lexicon_features']:.1f}x faster; "
+          f"raw: dict {ns_per_word['lexicon_raw'] / ns_per_word['dict_raw']:.1f}x faster")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_meter.py
+"""
+Scores the same poems with the meter verifier's verify() loop and its
+verify_batch(), next to the haiku verifier's verify_batch() as the
+throughput reference. The poems are the seeded 3-5 line poems of
+bench_poem_batch.py; the word cache and the meter distance cache are
+cleared before each run, and each time is the best of --repeat runs.
+
+The meter verifier reads every line while the haiku verifier reads only
+the first three, so throughput is compared in lines per second as well.
+
+Usage:
+    python benchmarks/bench_meter.py [--rows N] [--repeat N]
+"""
+import argparse
+import time
+
+from bench_poem_batch import load_poems
+
+from verifiers.poetry.haiku_verifier import HaikuVerifier
+from verifiers.poetry.meter_verifier import MeterVerifier
+from verifiers.poetry.helpers.lexicon import get_lexicon
+from verifiers.poetry.helpers.meter import meter_distance
+from verifiers.poetry.helpers.word_cache import word_cache
+
+def timed(fn, poems: list, repeat: int):
+    best = None
+    for _ in range(repeat):
+        word_cache.clear()
+        meter_distance.cache_clear()
+        start = time.perf_counter()
+        scores = fn(poems)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, scores
+
+def count_lines(poems: list, max_lines: int = None) -> int:
+    counts = [sum(1 for line in p.strip().split("\n") if line.strip()) for p in poems]
+    return sum(counts) if max_lines is None else sum(min(c, max_lines) for c in counts)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark meter scoring.")
+    parser.add_argument("--rows", type=int, default=100000, help="Size of the dataset-sized batch")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (the best is shown)")
+    args = parser.parse_args()
+
+    get_lexicon()
+    haiku, meter = HaikuVerifier(), MeterVerifier()
+    # (name, scoring function, lines read per poem: None for all)
+    runs = [
+        ("meter loop", lambda poems: [meter.verify(p) for p in poems], None),
+        ("meter batch", meter.verify_batch, None),
+        ("haiku batch", haiku.verify_batch, 3),
+    ]
+    for rows in (64, args.rows):
+        poems = load_poems(rows)
+        results = {name: (*timed(fn, poems, args.repeat), count_lines(poems, max_lines))
+                   for name, fn, max_lines in runs}
+        assert results["meter loop"][1] == results["meter batch"][1], "verify_batch() disagrees with verify()"
+        print(f"{rows:>7} poems: " + " | ".join(
+            f"{name} {seconds * 1000:8.1f} ms ({lines / seconds / 1000:5.0f}k lines/s)"
+            for name, (seconds, _, lines) in results.items()
+        ))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# benchmarks/bench_tag_scanner.py
+"""
+Times the reasoning format checks on malformed completions of growing
+length, with the anchored lazy regexes the verifiers used to run next to
+the tag scanner that replaced them. The regexes backtrack over the rest
+of the text at every candidate boundary, so their time grows with the
+square of the length; the scanner's grows linearly.
+
+Usage:
+    python benchmarks/bench_tag_scanner.py [--max-kb N]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from verifiers.reasoning.helpers.tag_scanner import find_section, match_layout
+
+STRICT_PATTERN = re.compile(r"^\s*<think>(.*?)</think>\s*<answer>(.*?)</answer>\s*$", re.DOTALL)
+VERIFIER_ANSWER_PATTERN = re.compile(r"<verifier_answer>\s*(.*?)\s*</verifier_answer>", re.DOTALL | re.IGNORECASE)
+
+# Worst cases: every </think> is followed by <answer> but </answer> never comes,
+# and a <verifier_answer> tag is repeated but never closed
+CASES = [
+    ("missing </answer>", lambda n: "<think>a" + "</think><answer>b" * (n // 17),
+     lambda text: STRICT_PATTERN.match(text), lambda text: match_layout(text).ok),
+    ("unclosed <verifier_answer>", lambda n: "<verifier_answer>" * (n // 17),
+     lambda text: VERIFIER_ANSWER_PATTERN.search(text), lambda text: find_section(text, "verifier_answer") is not None),
+]
+
+def timed(fn, text: str) -> float:
+    start = time.perf_counter()
+    fn(text)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the reasoning tag scanner.")
+    parser.add_argument("--max-kb", type=int, default=64, help="Largest completion size, in KB")
+    args = parser.parse_args()
+
+    for name, make, regex, scanner in CASES:
+        print(name)
+        size = 4
+        while size <= args.max_kb:
+            text = make(size * 1024)
+            assert (regex(text) is not None) == scanner(text), "scanner disagrees with the regex"
+            print(f"  {size:>5} KB: regex {timed(regex, text) * 1000:9.1f} ms | "
+                  f"scanner {timed(scanner, text) * 1000:7.2f} ms")
+            size *= 2
+
+if __name__ == "__main__":
+    main()
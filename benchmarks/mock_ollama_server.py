@@ -0,0 +1,267 @@
+# benchmarks/mock_ollama_server.py
+"""
+A stand-in for ollama's /api/chat, so the LLM judge path can be
+benchmarked (and tested) offline and reproducibly.
+
+It speaks the non-streaming structured-output contract the judge uses:
+the request's "format" is a JSON schema, and the reply's message content
+is JSON matching it. An object schema gets {"score", "feedback"}; an
+array schema (a batched call) gets one {"index", "score", "feedback"}
+per "### ANSWER n" section of the prompt. Scores are a hash of the
+answer text, so every run gives the same verdicts.
+
+Latency, capacity and failures are configurable:
+  - latency: "fixed", "uniform" (0..2x mean) or "lognormal" around
+    latency_ms, plus per_answer_ms for each answer of a batched call
+  - capacity: requests served at once (like OLLAMA_NUM_PARALLEL); the
+    rest queue. 0 means unlimited.
+  - error_rate: fraction of requests answered with HTTP 503
+  - malformed_rate: fraction of replies whose content is not valid JSON
+Random draws come from one seeded generator.
+
+It is a plain asyncio HTTP/1.1 server with keep-alive and no
+dependencies, and it counts TCP connections, so connection pooling shows
+up in its stats.
+
+Usage:
+    python benchmarks/mock_ollama_server.py [--port 11434] [--latency-ms 200] ...
+    OLLAMA_HOST=http://127.0.0.1:11434 uvicorn main:app
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+_SINGLE_ANSWER = re.compile(r"### USER’S ANSWER\n(.*?)\n\n### INSTRUCTIONS", re.DOTALL)
+_BATCH_ANSWER = re.compile(r"^### ANSWER (\d+)\n(.*?)(?=\n\n### )", re.DOTALL | re.MULTILINE)
+
+
+def verdict_score(answer: str) -> float:
+    """The deterministic score of an answer: a hash of its text mapped to 0.00..1.00."""
+    digest = hashlib.sha256(answer.strip().encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big") % 101 / 100
+
+
+class MockOllamaServer:
+    """
+    The mock judge. Use start()/stop() (or a with block) to run it on a
+    background thread; 'url' is then its base URL for ollama clients.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency_ms: float = 50.0, latency: str = "lognormal", per_answer_ms: float = 5.0,
+                 capacity: int = 0, error_rate: float = 0.0, malformed_rate: float = 0.0,
+                 seed: int = 0):
+        if latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"latency must be one of {LATENCY_DISTRIBUTIONS}, got {latency!r}")
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.latency = latency
+        self.per_answer_ms = per_answer_ms
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self._random = random.Random(seed)
+        self._counters = {"connections": 0, "requests": 0, "answers": 0, "errors": 0, "malformed": 0}
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._semaphore = None
+        self._loop = None
+        self._task = None
+        self._server = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def stats(self) -> dict:
+        return {**self._counters, "max_in_flight": self._max_in_flight}
+
+    def reset_stats(self):
+        self._counters = dict.fromkeys(self._counters, 0)
+        self._max_in_flight = 0
+
+    # Replies
+
+    def _delay(self, answers: int) -> float:
+        """Seconds to wait before replying to a call judging 'answers' answers."""
+        mean = self.latency_ms
+        if self.latency == "uniform":
+            base = self._random.uniform(0, 2 * mean)
+        elif self.latency == "lognormal" and mean > 0:
+            # sigma=0.5 gives a long right tail with the requested mean
+            base = self._random.lognormvariate(0, 0.5) * mean / 1.1331
+        else:
+            base = mean
+        return (base + self.per_answer_ms * answers) / 1000
+
+    def _content(self, request: dict) -> tuple:
+        """(message content, number of answers judged) for a chat request."""
+        prompt = "\n".join(message.get("content", "") for message in request.get("messages", []))
+        schema = request.get("format") or {}
+        if isinstance(schema, dict) and schema.get("type") == "array":
+            answers = _BATCH_ANSWER.findall(prompt)
+            verdicts = [
+                {"index": int(index), "score": verdict_score(answer), "feedback": f"Mock verdict for answer {index}."}
+                for index, answer in answers
+            ]
+            return json.dumps(verdicts), len(answers)
+        match = _SINGLE_ANSWER.search(prompt)
+        answer = match.group(1) if match else prompt
+        return json.dumps({"score": verdict_score(answer), "feedback": "Mock verdict."}), 1
+
+    async def _chat(self, body: bytes) -> tuple:
+        """(HTTP status, response JSON) for a POST /api/chat body."""
+        try:
+            request = json.loads(body)
+        except ValueError:
+            return 400, {"error": "invalid JSON body"}
+        content, answers = self._content(request)
+        self._counters["answers"] += answers
+
+        delay = self._delay(answers)
+        failed = self._random.random() < self.error_rate
+        malformed = self._random.random() < self.malformed_rate
+        if self._semaphore is not None:
+            async with self._semaphore:
+                await asyncio.sleep(delay)
+        else:
+            await asyncio.sleep(delay)
+
+        if failed:
+            self._counters["errors"] += 1
+            return 503, {"error": "mock server overloaded"}
+        if malformed:
+            self._counters["malformed"] += 1
+            content = content[:len(content) // 2]
+        return 200, {
+            "model": request.get("model", ""),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "message": {"role": "assistant", "content": content},
+            "done": True,
+            "done_reason": "stop",
+        }
+
+    # HTTP
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._counters["connections"] += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                self._counters["requests"] += 1
+                self._in_flight += 1
+                self._max_in_flight = max(self._max_in_flight, self._in_flight)
+                try:
+                    if method == "POST" and path == "/api/chat":
+                        status, payload = await self._chat(body)
+                    elif method == "GET" and path == "/stats":
+                        status, payload = 200, self.stats()
+                    else:
+                        status, payload = 404, {"error": f"{method} {path} not found"}
+                finally:
+                    self._in_flight -= 1
+
+                data = json.dumps(payload).encode("utf-8")
+                reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 503: "Service Unavailable"}[status]
+                writer.write(
+                    f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\nConnection: keep-alive\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # The server is stopping; end the connection quietly
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self):
+        """Runs the server on the current event loop until cancelled."""
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        self._semaphore = asyncio.Semaphore(self.capacity) if self.capacity > 0 else None
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start(self):
+        """Starts the server on a background thread and waits until it accepts connections."""
+        def run():
+            try:
+                asyncio.run(self.serve())
+            except asyncio.CancelledError:
+                pass
+
+        self._thread = threading.Thread(target=run, name="mock-ollama", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(10):
+            raise RuntimeError("mock ollama server did not start")
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._task.cancel)
+            self._thread.join(10)
+        self._server = self._loop = self._task = self._thread = None
+        self._ready.clear()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock ollama /api/chat server for judge benchmarks.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Mean latency of one call")
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--per-answer-ms", type=float, default=5.0, help="Extra latency per answer judged")
+    parser.add_argument("--capacity", type=int, default=0, help="Requests served at once (0 = unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of HTTP 503 replies")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of invalid JSON replies")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockOllamaServer(
+        host=args.host, port=args.port, latency_ms=args.latency_ms, latency=args.latency,
+        per_answer_ms=args.per_answer_ms, capacity=args.capacity, error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate, seed=args.seed,
+    )
+    print(f"Mock ollama listening on {server.url}")
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,14 @@
 import argparse
 import sys
 
-from registry_loader import load_registry, load_verifier_class, add_verifier_arguments
+from registry_loader import get_registry, add_verifier_arguments
 
 def main():
     base_parser = argparse.ArgumentParser(
         description="Check poems with dynamically loaded verifiers & CLI arguments from JSON."
     )
-    base_parser.add_argument("file", type=str, help="Path to the text file containing the poem.")
+    base_parser.add_argument("files", type=str, nargs="+", metavar="file",
+                             help="Path(s) to the text file(s) containing the poem.")
     base_parser.add_argument("--registry", type=str, default="verifier_registry.json",
                              help="Path to the JSON registry of verifiers.")
     base_parser.add_argument("--verifier", type=str, required=True,
@@ -20,8 +21,9 @@ def main():
     # Then we'll load the registry and parse the chosen verifier's arguments
     partial_args, _ = base_parser.parse_known_args()
 
-    # 1) Load the registry
-    registry_data = load_registry(partial_args.registry)
+    # 1) Load the registry (parsed once; verifier instances are shared)
+    registry = get_registry(partial_args.registry)
+    registry_data = registry.data
 
     # 2) Is the chosen verifier known?
     if partial_args.verifier not in registry_data:
@@ -38,7 +40,8 @@ def main():
     parser = argparse.ArgumentParser(
         description=f"Verifier: {partial_args.verifier}. {verifier_info.get('description','')}"
     )
-    parser.add_argument("file", type=str, help="Path to the text file containing the poem.")
+    parser.add_argument("files", type=str, nargs="+", metavar="file",
+                        help="Path(s) to the text file(s) containing the poem.")
     parser.add_argument("--registry", type=str, default="verifier_registry.json",
                         help="Path to the JSON registry of verifiers.")
     parser.add_argument("--verifier", type=str, required=True,
@@ -52,15 +55,10 @@ def main():
     # Now parse all arguments
     args = parser.parse_args()
 
-    # 5) Load & instantiate the verifier class
-    verifier_cls = load_verifier_class(args.verifier, registry_data)
-    verifier = verifier_cls()
+    # 5) Get the shared verifier instance
+    verifier = registry.get_verifier(args.verifier)
 
-    # 6) Read the poem
-    with open(args.file, "r", encoding="utf-8") as f:
-        poem_text = f.read()
-
-    # 7) Build a dictionary of relevant args for the verifier
+    # 6) Build a dictionary of relevant args for the verifier
     #    We'll gather them from the JSON's argument definitions
     verifier_kwargs = {}
     for argdef in verifier_info.get("arguments", []):
@@ -69,18 +67,25 @@ def main():
         # If the name is "--tolerance", the attribute on 'args' is 'tolerance'
         verifier_kwargs[arg_name] = getattr(args, arg_name)
 
-    # 8) Call verify or verify_with_feedback
-    if args.feedback:
-        result = verifier.verify_with_feedback(poem_text, **verifier_kwargs)
-        score = result["score"]
-        feedback_list = result["feedback"]
-        print(f"Score: {score:.2f}")
-        print("Feedback:")
-        for msg in feedback_list:
-            print(" -", msg)
-    else:
-        score = verifier.verify(poem_text, **verifier_kwargs)
-        print(f"Score: {score:.2f}")
+    # 7) Read each poem and call verify or verify_with_feedback
+    for path in args.files:
+        with open(path, "r", encoding="utf-8") as f:
+            poem_text = f.read()
+
+        if len(args.files) > 1:
+            print(f"== {path}")
+
+        if args.feedback:
+            result = verifier.verify_with_feedback(poem_text, **verifier_kwargs)
+            score = result["score"]
+            feedback_list = result["feedback"]
+            print(f"Score: {score:.2f}")
+            print("Feedback:")
+            for msg in feedback_list:
+                print(" -", msg)
+        else:
+            score = verifier.verify(poem_text, **verifier_kwargs)
+            print(f"Score: {score:.2f}")
 
 if __name__ == "__main__":
     main()
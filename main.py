@@ -1,13 +1,106 @@
 # fastapi_server.py
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
 from typing import List, Union, Dict, Any
 
 # Import your existing logic
-from registry_loader import load_registry, load_verifier_class
+from registry_loader import get_registry, build_verifier_kwargs, run_verifier_jobs, run_verifier_jobs_async
+from result_cache import ResultCaches
+from verifier_pool import VerifierPool
+from verifiers.poetry.helpers.word_cache import word_cache_stats
+
+REGISTRY_PATH = "verifier_registry.json"
+
+# Max number of items /verify/stream works on at once (bounds its memory use)
+STREAM_MAX_IN_FLIGHT = int(os.environ.get("VERIFY_STREAM_MAX_IN_FLIGHT", "64"))
+
+# Process pool for CPU-bound verifiers (None unless VERIFIER_PROCESS_POOL=1)
+pool: Union[VerifierPool, None] = None
+# Guards 'pool' between the warm-up thread and shutdown
+_pool_lock = threading.Lock()
+
+# Per-verifier caches of recent results
+result_caches = ResultCaches()
+
+# Uvicorn's logger, so startup messages show up in the server log
+logger = logging.getLogger("uvicorn.error")
+
+# Filled in by the startup warm-up; /ready reports 503 until "ready" is set
+warmup_state = {"ready": False, "phases": {}, "errors": {}}
+
+def _warm_up(stopping: threading.Event) -> dict:
+    """
+    Imports every registry module, instantiates each verifier and forces
+    lazily-loaded data (e.g. the pronouncing lexicon) to load, then starts
+    the process pool if one is configured. Returns the per-phase timings.
 
-app = FastAPI()
+    Cancelling the warm-up task does not stop this thread, so if the
+    server shut down meanwhile ('stopping' is set) the new pool is shut
+    down instead of being published.
+    """
+    global pool
+    report = get_registry(REGISTRY_PATH).warm_up()
+
+    new_pool = None if stopping.is_set() else VerifierPool.from_env(REGISTRY_PATH)
+    if new_pool is not None:
+        start = time.perf_counter()
+        new_pool.start()
+        report["phases"]["process_pool"] = time.perf_counter() - start
+        with _pool_lock:
+            published = not stopping.is_set()
+            if published:
+                pool = new_pool
+        if not published:
+            new_pool.shutdown()
+    return report
+
+async def _startup_warm_up(stopping: threading.Event):
+    start = time.perf_counter()
+    report = await run_in_threadpool(_warm_up, stopping)
+    total = time.perf_counter() - start
+
+    for name, error in report["errors"].items():
+        logger.error(f"Warm-up of verifier '{name}' failed: {error}")
+    breakdown = ", ".join(f"{phase}={seconds * 1000:.0f}ms" for phase, seconds in report["phases"].items())
+    logger.info(f"Warm-up done in {total * 1000:.0f}ms ({breakdown}).")
+
+    warmup_state.update(report)
+    warmup_state["total"] = total
+    warmup_state["ready"] = True
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global pool
+    # Warm up in the background so the server can answer /ready meanwhile
+    stopping = threading.Event()
+    warmup_task = asyncio.create_task(_startup_warm_up(stopping))
+    try:
+        yield
+    finally:
+        warmup_task.cancel()
+        with _pool_lock:
+            stopping.set()
+            running_pool, pool = pool, None
+        # The judge client (and ollama) is only imported with the judge verifier
+        judge_client = sys.modules.get("verifiers.reasoning.helpers.judge_client")
+        if judge_client is not None:
+            await judge_client.close_default_judge_client()
+        if running_pool is not None:
+            running_pool.shutdown()
+
+app = FastAPI(lifespan=lifespan)
 
 # Updated request model
 class VerifyRequest(BaseModel):
@@ -20,8 +113,78 @@ class VerifyResponse(BaseModel):
     score: float
     feedback: Union[List[str], None] = None
 
+class BatchVerifyRequest(BaseModel):
+    items: List[VerifyRequest]
+
+class BatchItemResult(BaseModel):
+    score: float
+    feedback: Union[List[str], None] = None
+    error: Union[str, None] = None
+
+class BatchVerifyResponse(BaseModel):
+    results: List[BatchItemResult]
+
+async def _verify_group(registry, verifier_name: str, items: List[VerifyRequest]) -> list:
+    """
+    Runs items that share a verifier, serving repeats from the verifier's
+    result cache. Cache misses run according to the registry's "execution" mode:
+      - "inline":  directly on the event loop (latency-trivial verifiers)
+      - "process": in the process pool, if one is running
+      - "async":   awaited concurrently on the event loop (I/O-bound
+                   verifiers such as the LLM judge)
+      - "thread" (default): in Starlette's threadpool
+    """
+    verifier_info = registry.get_info(verifier_name)
+    execution = verifier_info.get("execution", "thread")
+    verifier_obj = registry.get_verifier(verifier_name)
+    cache = result_caches.for_verifier(verifier_name, verifier_info)
+
+    results: List[Union[dict, None]] = [None] * len(items)
+    pending = []  # (index, cache key, job)
+    pending_by_key = {}  # cache key -> index of the pending item computing it
+    duplicates = []  # (index, index of the identical pending item)
+    for idx, item in enumerate(items):
+        try:
+            verifier_kwargs = build_verifier_kwargs(verifier_info, item.args)
+        except Exception as e:
+            results[idx] = {"score": 0.0, "error": f"{type(e).__name__}: {e}"}
+            continue
+
+        key = None
+        if cache is not None:
+            key = cache.make_key(verifier_name, verifier_obj.VERSION, verifier_kwargs, item.text, item.feedback)
+            if key in pending_by_key:
+                duplicates.append((idx, pending_by_key[key]))
+                continue
+            cached = cache.get(key)
+            if cached is not None:
+                results[idx] = cached
+                continue
+            pending_by_key[key] = idx
+        pending.append((idx, key, (item.text, verifier_kwargs, item.feedback)))
+
+    jobs = [job for _, _, job in pending]
+    if not jobs:
+        job_results = []
+    elif execution == "process" and pool is not None:
+        job_results = await pool.run_many(verifier_name, jobs)
+    elif execution == "inline":
+        job_results = run_verifier_jobs(verifier_obj, jobs)
+    elif execution == "async":
+        job_results = await run_verifier_jobs_async(verifier_obj, jobs)
+    else:
+        job_results = await run_in_threadpool(run_verifier_jobs, verifier_obj, jobs)
+
+    for (idx, key, _), result in zip(pending, job_results):
+        results[idx] = result
+        if key is not None and "error" not in result:
+            cache.put(key, result)
+    for idx, source_idx in duplicates:
+        results[idx] = results[source_idx]
+    return results
+
 @app.post("/verify", response_model=VerifyResponse)
-def verify(req: VerifyRequest):
+async def verify(req: VerifyRequest):
     """
     POST a JSON payload like:
     {
@@ -34,62 +197,185 @@ def verify(req: VerifyRequest):
     }
     """
 
-    # 1) Load the registry
-    registry_data = load_registry("verifier_registry.json")
+    # 1) Get the (cached) registry
+    registry = get_registry(REGISTRY_PATH)
 
     # 2) Check if requested verifier is known
-    if req.verifier not in registry_data:
+    if req.verifier not in registry:
         return {
             "score": 0.0,
             "feedback": [f"Unknown verifier: {req.verifier}"]
         }
 
-    # 3) Load & instantiate the chosen verifier
-    verifier_cls = load_verifier_class(req.verifier, registry_data)
-    verifier_obj = verifier_cls()
-
-    # 4) Collect & cast dynamic arguments from registry defaults + request args
-    #    (only if the registry defines "arguments" for this verifier)
-    dynamic_args = {}
-    verifier_info = registry_data[req.verifier]
-    registry_args = verifier_info.get("arguments", [])  # list of { name, type, default, help, ... }
-    user_args = req.args or {}
-
-    for arg_def in registry_args:
-        # Trim leading '--'
-        arg_name = arg_def["name"].lstrip("--")
-        arg_type = arg_def["type"]
-        default_val = arg_def.get("default", None)
-
-        # If user provided the arg, use that; otherwise fallback to default
-        val = user_args.get(arg_name, default_val)
-
-        # Cast to the correct type
-        if val is not None:
-            if arg_type == "int":
-                val = int(val)
-            elif arg_type == "float":
-                val = float(val)
-            elif arg_type == "str":
-                val = str(val)
-            # add other cases if needed (bool, etc.)
-
-        dynamic_args[arg_name] = val
-
-    # 5) Call the verifier with optional arguments
-    if req.feedback:
-        # Pass `req.text` plus any dynamic arguments
-        result = verifier_obj.verify_with_feedback(req.text, **dynamic_args)
-        return {
-            "score": result["score"],
-            "feedback": result["feedback"]
-        }
-    else:
-        score = verifier_obj.verify(req.text, **dynamic_args)
-        return {
-            "score": score,
-            "feedback": None
-        }
+    # 3) Cast the arguments and call the verifier (inline, threadpool or process pool)
+    [result] = await _verify_group(registry, req.verifier, [req])
+    if "error" in result:
+        raise HTTPException(status_code=500, detail=result["error"])
+    return result
+
+@app.post("/verify/batch", response_model=BatchVerifyResponse)
+async def verify_batch(batch: BatchVerifyRequest):
+    """
+    POST many verification items at once, e.g. every completion of a GRPO group:
+    {
+      "items": [
+        {"text": "...", "verifier": "limerick"},
+        {"text": "...", "verifier": "boxed_answer", "args": {"gold_solution": "\\(\\boxed{4}\\)"}}
+      ]
+    }
+
+    Results come back in the same order as the items. Items are grouped by
+    verifier so each verifier is resolved once per batch, and the groups run
+    concurrently. A failing item gets score=0.0 and an "error" message
+    instead of failing the whole batch.
+    """
+    registry = get_registry(REGISTRY_PATH)
+    results: List[Union[dict, None]] = [None] * len(batch.items)
+
+    # Group item indices by verifier name
+    groups: Dict[str, List[int]] = {}
+    for idx, item in enumerate(batch.items):
+        groups.setdefault(item.verifier, []).append(idx)
+
+    async def run_group(verifier_name: str, indices: List[int]):
+        if verifier_name not in registry:
+            for idx in indices:
+                results[idx] = {"score": 0.0, "error": f"Unknown verifier: {verifier_name}"}
+            return
+        try:
+            group_results = await _verify_group(
+                registry, verifier_name, [batch.items[idx] for idx in indices]
+            )
+        except Exception as e:
+            group_results = [
+                {"score": 0.0, "error": f"Could not run verifier '{verifier_name}': {e}"}
+            ] * len(indices)
+        for idx, result in zip(indices, group_results):
+            results[idx] = result
+
+    await asyncio.gather(*[run_group(name, indices) for name, indices in groups.items()])
+    return {"results": results}
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that streams while the request body is still being read.
+
+    The stock class listens for client disconnects by consuming receive(),
+    which would swallow the request body chunks our generator is reading;
+    here a disconnect surfaces through request.stream() instead.
+    """
+
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+
+@app.get("/ready")
+async def ready():
+    """
+    Readiness probe: 503 until the startup warm-up has finished, then 200
+    with the per-phase startup timings (seconds).
+    """
+    status_code = 200 if warmup_state["ready"] else 503
+    return JSONResponse(warmup_state, status_code=status_code)
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """Hit/miss counters and sizes of each verifier's result cache."""
+    return result_caches.stats()
+
+@app.get("/cache/words")
+async def word_cache_statistics():
+    """
+    Hit/miss counters of the poetry helpers' per-word cache. With the
+    process pool enabled, the workers' caches are not included.
+    """
+    return word_cache_stats()
+
+@app.get("/judge/stats")
+async def judge_statistics():
+    """
+    Calls, retries, failures and calls in flight of the async LLM judge
+    client, and the verdict cache's counters ("cache" is null if disabled).
+    503 if the judge's dependencies (ollama) are not installed.
+    """
+    try:
+        from verifiers.reasoning.helpers.judge_cache import default_judge_cache
+        from verifiers.reasoning.helpers.judge_client import default_judge_client
+    except ImportError as e:
+        raise HTTPException(status_code=503, detail=f"LLM judge unavailable: {e}")
+    cache = default_judge_cache()
+    return {**default_judge_client().stats(), "cache": cache.stats() if cache is not None else None}
+
+async def _iter_ndjson_lines(chunks):
+    """Yields the non-blank lines of a chunked NDJSON body as they arrive."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+async def _verify_stream_item(registry, index: int, line: bytes) -> dict:
+    result = {"index": index, "score": 0.0, "feedback": None, "error": None}
+    try:
+        item = VerifyRequest.model_validate_json(line)
+    except ValidationError as e:
+        result["error"] = f"Invalid item: {e.errors()[0]['msg']}"
+        return result
+
+    if item.verifier not in registry:
+        result["error"] = f"Unknown verifier: {item.verifier}"
+        return result
+    try:
+        [item_result] = await _verify_group(registry, item.verifier, [item])
+    except Exception as e:
+        item_result = {"score": 0.0, "error": f"{type(e).__name__}: {e}"}
+    result.update(item_result)
+    return result
+
+async def _stream_results(request: Request):
+    registry = get_registry(REGISTRY_PATH)
+    in_flight = set()
+    index = 0
+
+    try:
+        async for line in _iter_ndjson_lines(request.stream()):
+            # Keep at most STREAM_MAX_IN_FLIGHT items in memory at a time
+            if len(in_flight) >= STREAM_MAX_IN_FLIGHT:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield json.dumps(task.result()) + "\n"
+            in_flight.add(asyncio.create_task(_verify_stream_item(registry, index, line)))
+            index += 1
+
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield json.dumps(task.result()) + "\n"
+    finally:
+        # The client went away or the generator was closed: nobody will read
+        # the remaining results, so stop the work behind them
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+@app.post("/verify/stream")
+async def verify_stream(request: Request):
+    """
+    POST a (chunked) NDJSON body with one /verify item per line:
+      {"text": "...", "verifier": "limerick"}
+      {"text": "...", "verifier": "haiku", "args": {"tolerance": 2}}
+
+    Streams back one NDJSON result per item as soon as it completes:
+      {"index": 1, "score": 1.0, "feedback": null, "error": null}
+
+    "index" is the 0-based position of the item among the non-blank input
+    lines; results may arrive out of order. Only a bounded number of items
+    is held in memory, so large jobs run in constant memory.
+    """
+    return _DuplexStreamingResponse(_stream_results(request), media_type="application/x-ndjson")
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,7 +1,10 @@
 import json
 import importlib
 import argparse
+import asyncio
 import os
+import threading
+import time
 
 def load_registry(json_path: str) -> dict:
     """
@@ -34,6 +37,34 @@ def load_verifier_class(verifier_name: str, registry_data: dict):
     verifier_cls = getattr(module, class_name)
     return verifier_cls
 
+def build_verifier_kwargs(verifier_info: dict, user_args: dict = None) -> dict:
+    """
+    Collects the keyword arguments for a verifier call from the registry
+    argument definitions, using the caller's value when present and the
+    registry default otherwise. Values are cast to the declared type
+    ("int", "float" or "str"); a bad value raises ValueError.
+    """
+    user_args = user_args or {}
+    kwargs = {}
+    for arg_def in verifier_info.get("arguments", []):
+        # Trim leading '--'
+        arg_name = arg_def["name"].lstrip("-")
+        arg_type = arg_def.get("type", "str")
+        val = user_args.get(arg_name, arg_def.get("default", None))
+
+        # Cast to the correct type
+        if val is not None:
+            if arg_type == "int":
+                val = int(val)
+            elif arg_type == "float":
+                val = float(val)
+            elif arg_type == "str":
+                val = str(val)
+            # add other cases if needed (bool, etc.)
+
+        kwargs[arg_name] = val
+    return kwargs
+
 def add_verifier_arguments(parser: argparse.ArgumentParser, verifier_info: dict):
     """
     Dynamically adds arguments from verifier_info["arguments"] to the parser.
@@ -64,3 +95,247 @@ def add_verifier_arguments(parser: argparse.ArgumentParser, verifier_info: dict)
             default=default_val,
             help=help_text
         )
+
+def run_verifier(verifier_obj, text: str, verifier_kwargs: dict, feedback: bool = False) -> dict:
+    """
+    Calls verify (or verify_with_feedback if 'feedback' is set) and
+    returns {"score": float, "feedback": list[str] or None}.
+    """
+    if feedback:
+        result = verifier_obj.verify_with_feedback(text, **verifier_kwargs)
+        return {
+            "score": result["score"],
+            "feedback": result["feedback"]
+        }
+    score = verifier_obj.verify(text, **verifier_kwargs)
+    return {
+        "score": score,
+        "feedback": None
+    }
+
+def _run_job(verifier_obj, job: tuple) -> dict:
+    text, verifier_kwargs, feedback = job
+    try:
+        return run_verifier(verifier_obj, text, verifier_kwargs, feedback)
+    except Exception as e:
+        return {"score": 0.0, "error": f"{type(e).__name__}: {e}"}
+
+def run_verifier_jobs(verifier_obj, jobs: list) -> list:
+    """
+    Runs a list of (text, verifier_kwargs, feedback) jobs against one verifier.
+    Each job yields either {"score", "feedback"} or {"score": 0.0, "error"},
+    so one bad job does not fail the others.
+
+    Score-only jobs that share their kwargs are scored together with one
+    verify_batch() call; if that raises, they are retried one by one so
+    the error lands on the job that caused it.
+    """
+    results = [None] * len(jobs)
+    batches = {}  # kwargs key -> indices of score-only jobs
+    for idx, job in enumerate(jobs):
+        text, verifier_kwargs, feedback = job
+        if feedback:
+            results[idx] = _run_job(verifier_obj, job)
+        else:
+            key = json.dumps(verifier_kwargs, sort_keys=True, default=str)
+            batches.setdefault(key, []).append(idx)
+
+    for indices in batches.values():
+        if len(indices) == 1:
+            results[indices[0]] = _run_job(verifier_obj, jobs[indices[0]])
+            continue
+        try:
+            scores = verifier_obj.verify_batch(
+                [jobs[idx][0] for idx in indices], **jobs[indices[0]][1]
+            )
+        except Exception:
+            for idx in indices:
+                results[idx] = _run_job(verifier_obj, jobs[idx])
+            continue
+        for idx, score in zip(indices, scores):
+            results[idx] = {"score": score, "feedback": None}
+    return results
+
+async def run_verifier_async(verifier_obj, text: str, verifier_kwargs: dict, feedback: bool = False) -> dict:
+    """Async run_verifier(), through the verifier's averify / averify_with_feedback."""
+    if feedback:
+        result = await verifier_obj.averify_with_feedback(text, **verifier_kwargs)
+        return {
+            "score": result["score"],
+            "feedback": result["feedback"]
+        }
+    score = await verifier_obj.averify(text, **verifier_kwargs)
+    return {
+        "score": score,
+        "feedback": None
+    }
+
+async def _run_job_async(verifier_obj, job: tuple) -> dict:
+    text, verifier_kwargs, feedback = job
+    try:
+        return await run_verifier_async(verifier_obj, text, verifier_kwargs, feedback)
+    except Exception as e:
+        return {"score": 0.0, "error": f"{type(e).__name__}: {e}"}
+
+async def _run_batch_async(verifier_obj, jobs: list, indices: list) -> list:
+    if len(indices) == 1:
+        return [await _run_job_async(verifier_obj, jobs[indices[0]])]
+    try:
+        scores = await verifier_obj.averify_batch(
+            [jobs[idx][0] for idx in indices], **jobs[indices[0]][1]
+        )
+    except Exception:
+        return list(await asyncio.gather(*[_run_job_async(verifier_obj, jobs[idx]) for idx in indices]))
+    return [{"score": score, "feedback": None} for score in scores]
+
+async def run_verifier_jobs_async(verifier_obj, jobs: list) -> list:
+    """
+    run_verifier_jobs() for I/O-bound verifiers: jobs are awaited
+    concurrently on the event loop (the verifier bounds its own
+    concurrency), with the same per-job error handling. Score-only jobs
+    that share their kwargs go to one averify_batch() call, so e.g. a
+    judge can score a whole GRPO group at once.
+    """
+    results = [None] * len(jobs)
+    batches = {}  # kwargs key -> indices of score-only jobs
+    singles = []
+    for idx, job in enumerate(jobs):
+        text, verifier_kwargs, feedback = job
+        if feedback:
+            singles.append(idx)
+        else:
+            key = json.dumps(verifier_kwargs, sort_keys=True, default=str)
+            batches.setdefault(key, []).append(idx)
+
+    async def run_single(idx: int):
+        results[idx] = await _run_job_async(verifier_obj, jobs[idx])
+
+    async def run_batch(indices: list):
+        for idx, result in zip(indices, await _run_batch_async(verifier_obj, jobs, indices)):
+            results[idx] = result
+
+    await asyncio.gather(*[run_single(idx) for idx in singles],
+                         *[run_batch(indices) for indices in batches.values()])
+    return results
+
+class VerifierRegistry:
+    """
+    Process-wide view of a registry file.
+
+    The JSON is parsed once and each verifier class is imported and
+    instantiated once; the shared instances are handed out on every call.
+    The file's mtime is checked on access and, if it changed, the registry
+    is re-read and the instance cache dropped so edits are picked up
+    without a restart.
+    """
+
+    def __init__(self, json_path: str):
+        self.json_path = json_path
+        self._lock = threading.Lock()
+        self._mtime_ns = None
+        self._data = {}
+        self._instances = {}
+
+    def _refresh(self):
+        try:
+            mtime_ns = os.stat(self.json_path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Registry file not found: {self.json_path}")
+
+        if mtime_ns == self._mtime_ns:
+            return
+        with self._lock:
+            if mtime_ns == self._mtime_ns:
+                return
+            self._data = load_registry(self.json_path)
+            self._instances = {}
+            self._mtime_ns = mtime_ns
+
+    @property
+    def data(self) -> dict:
+        """The parsed registry dict (reloaded if the file changed)."""
+        self._refresh()
+        return self._data
+
+    def __contains__(self, verifier_name: str) -> bool:
+        return verifier_name in self.data
+
+    def get_info(self, verifier_name: str) -> dict:
+        data = self.data
+        if verifier_name not in data:
+            raise KeyError(f"Verifier '{verifier_name}' not in registry.")
+        return data[verifier_name]
+
+    def get_verifier(self, verifier_name: str):
+        """Returns the shared instance of the named verifier."""
+        self._refresh()
+        verifier_obj = self._instances.get(verifier_name)
+        if verifier_obj is None:
+            with self._lock:
+                verifier_obj = self._instances.get(verifier_name)
+                if verifier_obj is None:
+                    verifier_cls = load_verifier_class(verifier_name, self._data)
+                    verifier_obj = verifier_cls()
+                    self._instances[verifier_name] = verifier_obj
+        return verifier_obj
+
+    def warm_up(self, verifier_names: list = None) -> dict:
+        """
+        Imports, instantiates and warms up the given verifiers (default: all),
+        so the first real request does not pay for it. Returns
+        {"phases": {phase: seconds}, "errors": {verifier_name: message}};
+        a verifier that fails to load is reported and skipped.
+        """
+        phases = {}
+        errors = {}
+
+        start = time.perf_counter()
+        data = self.data
+        if verifier_names is None:
+            verifier_names = list(data)
+        phases["registry"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for name in verifier_names:
+            try:
+                importlib.import_module(data[name]["module"])
+            except Exception as e:
+                errors[name] = f"import failed: {e}"
+        phases["imports"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        verifiers = []
+        for name in verifier_names:
+            if name in errors:
+                continue
+            try:
+                verifiers.append((name, self.get_verifier(name)))
+            except Exception as e:
+                errors[name] = f"instantiation failed: {e}"
+        phases["instantiate"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for name, verifier_obj in verifiers:
+            try:
+                verifier_obj.warm_up()
+            except Exception as e:
+                errors[name] = f"warm-up failed: {e}"
+        phases["warm_up"] = time.perf_counter() - start
+
+        return {"phases": phases, "errors": errors}
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+def get_registry(json_path: str = "verifier_registry.json") -> VerifierRegistry:
+    """
+    Returns the process-wide VerifierRegistry for 'json_path',
+    creating it on first use.
+    """
+    key = os.path.abspath(json_path)
+    registry = _registries.get(key)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.setdefault(key, VerifierRegistry(json_path))
+    return registry
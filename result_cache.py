@@ -0,0 +1,112 @@
+# result_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+class ResultCache:
+    """
+    In-process LRU cache of verification results.
+
+    Keys are content hashes of (verifier name, verifier version, normalized
+    args, text, feedback flag), so identical requests share one entry no
+    matter how the args were spelled. Entries older than 'ttl' seconds
+    (if set) are treated as misses.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(verifier_name: str, version: str, verifier_kwargs: dict, text: str, feedback: bool) -> str:
+        payload = json.dumps(
+            [verifier_name, version, verifier_kwargs, text, bool(feedback)],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Returns the cached result for 'key', or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, result = entry
+                if self.ttl is None or time.monotonic() - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: dict):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class ResultCaches:
+    """
+    One ResultCache per verifier, configured by the registry entry's
+    optional "cache" object:
+
+      "cache": {"enabled": true, "max_entries": 10000, "ttl": 3600}
+
+    Missing keys fall back to RESULT_CACHE_MAX_ENTRIES / RESULT_CACHE_TTL
+    (seconds; unset means no expiry). "enabled": false opts a verifier out.
+    """
+
+    def __init__(self):
+        self.default_max_entries = int(os.environ.get("RESULT_CACHE_MAX_ENTRIES", "10000"))
+        ttl = os.environ.get("RESULT_CACHE_TTL")
+        self.default_ttl = float(ttl) if ttl else None
+        self._caches = {}
+        self._lock = threading.Lock()
+
+    def for_verifier(self, verifier_name: str, verifier_info: dict):
+        """Returns the verifier's ResultCache, or None if caching is disabled for it."""
+        config = verifier_info.get("cache", {})
+        if not config.get("enabled", True):
+            return None
+        max_entries = config.get("max_entries", self.default_max_entries)
+        ttl = config.get("ttl", self.default_ttl)
+
+        cache = self._caches.get(verifier_name)
+        if cache is None or cache.max_entries != max_entries or cache.ttl != ttl:
+            # First use, or the registry entry's settings changed
+            with self._lock:
+                cache = ResultCache(max_entries=max_entries, ttl=ttl)
+                self._caches[verifier_name] = cache
+        return cache
+
+    def stats(self) -> dict:
+        return {name: cache.stats() for name, cache in self._caches.items()}
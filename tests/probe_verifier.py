@@ -0,0 +1,30 @@
+# tests/probe_verifier.py
+import os
+
+from verifiers.base_verifier import BaseVerifier
+
+
+class ProbeVerifier(BaseVerifier):
+    """
+    A verifier for process pool tests:
+      - score 1.0 if warm_up() ran in the worker before the call, else 0.5
+      - feedback is "<text> in pid <worker pid>"
+      - text "fail" raises, text "crash" kills the worker process
+    """
+
+    def __init__(self):
+        super().__init__(name="probe", description="Reports which worker ran it.")
+        self.warmed = False
+
+    def warm_up(self):
+        self.warmed = True
+
+    def verify(self, text: str, **kwargs) -> float:
+        return self.verify_with_feedback(text, **kwargs)["score"]
+
+    def verify_with_feedback(self, text: str, **kwargs) -> dict:
+        if text == "fail":
+            raise ValueError("probe failure")
+        if text == "crash":
+            os._exit(1)
+        return {"score": 1.0 if self.warmed else 0.5, "feedback": [f"{text} in pid {os.getpid()}"]}
@@ -0,0 +1,188 @@
+# tests/test_main.py
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+
+ROOT = Path(__file__).resolve().parents[1]
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+LIMERICK = """\
+There once was a fellow named Lee
+Who was stung on the arm by a bee
+   When asked, "Does it hurt?"
+   "No, it doesn't," he spurt
+It’s a good thing it wasn’t a flea.
+"""
+
+def test_verify_single(client):
+    response = client.post("/verify", json={"text": LIMERICK, "verifier": "limerick"})
+    assert response.status_code == 200
+    assert response.json()["score"] == 1.0
+
+def test_verify_unknown_verifier(client):
+    response = client.post("/verify", json={"text": "hi", "verifier": "nope"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["score"] == 0.0
+    assert any("Unknown verifier" in msg for msg in body["feedback"])
+
+def test_verify_batch_preserves_order(client):
+    items = [
+        {"text": LIMERICK, "verifier": "limerick"},
+        {"text": "<verifier_answer>4</verifier_answer>", "verifier": "verifier_answer",
+         "args": {"gold_solution": "4"}},
+        {"text": "Meow", "verifier": "limerick", "feedback": True},
+        {"text": "<verifier_answer>5</verifier_answer>", "verifier": "verifier_answer",
+         "args": {"gold_solution": "4"}},
+    ]
+    response = client.post("/verify/batch", json={"items": items})
+    assert response.status_code == 200
+    results = response.json()["results"]
+
+    assert len(results) == 4
+    assert results[0]["score"] == 1.0
+    assert results[1]["score"] == 1.0
+    assert results[2]["score"] < 1.0 and results[2]["feedback"]
+    assert results[3]["score"] == 0.0
+    assert all(r["error"] is None for r in results)
+
+def test_verify_batch_per_item_errors(client):
+    items = [
+        {"text": "x", "verifier": "nope"},
+        {"text": "An old silent pond\nA frog\nSplash!", "verifier": "haiku",
+         "args": {"tolerance": "not-an-int"}},
+        {"text": "<verifier_answer>4</verifier_answer>", "verifier": "verifier_answer",
+         "args": {"gold_solution": "4"}},
+    ]
+    response = client.post("/verify/batch", json={"items": items})
+    assert response.status_code == 200
+    results = response.json()["results"]
+
+    assert "Unknown verifier" in results[0]["error"]
+    assert results[1]["score"] == 0.0 and results[1]["error"]
+    assert results[2]["score"] == 1.0 and results[2]["error"] is None
+
+def test_verify_stream_ndjson(client):
+    lines = [
+        json.dumps({"text": LIMERICK, "verifier": "limerick"}),
+        "",
+        "not json",
+        json.dumps({"text": "x", "verifier": "nope"}),
+        json.dumps({"text": "<verifier_answer>4</verifier_answer>", "verifier": "verifier_answer",
+                    "args": {"gold_solution": "4"}, "feedback": True}),
+    ]
+
+    def body():
+        # Send the body in small chunks that split lines mid-way
+        payload = "\n".join(lines).encode()
+        for i in range(0, len(payload), 7):
+            yield payload[i:i + 7]
+
+    response = client.post("/verify/stream", content=body(),
+                           headers={"Content-Type": "application/x-ndjson"})
+    assert response.status_code == 200
+
+    results = sorted((json.loads(l) for l in response.text.splitlines()), key=lambda r: r["index"])
+    assert [r["index"] for r in results] == [0, 1, 2, 3]
+    assert results[0]["score"] == 1.0 and results[0]["error"] is None
+    assert results[1]["error"].startswith("Invalid item")
+    assert "Unknown verifier" in results[2]["error"]
+    assert results[3]["score"] == 1.0 and results[3]["feedback"]
+
+def test_repeated_items_are_served_from_cache(client):
+    item = {"text": "<think>a</think><answer>b</answer>", "verifier": "reasoning_format",
+            "args": {"unused": 1}}
+    before = client.get("/cache/stats").json().get("reasoning_format", {"hits": 0})["hits"]
+
+    response = client.post("/verify/batch", json={"items": [item, item, item]})
+    assert [r["score"] for r in response.json()["results"]] == [1.0, 1.0, 1.0]
+    client.post("/verify", json=item)
+
+    after = client.get("/cache/stats").json()["reasoning_format"]["hits"]
+    assert after - before >= 1
+
+def test_word_cache_stats(client):
+    client.post("/verify", json={"text": LIMERICK, "verifier": "limerick"})
+    client.post("/verify", json={"text": LIMERICK, "verifier": "limerick", "feedback": True})
+    stats = client.get("/cache/words").json()
+    assert stats["hits"] > 0
+    assert {"size", "max_entries", "misses", "evictions", "hit_rate"} <= set(stats)
+
+def test_ready_after_warm_up():
+    with TestClient(app) as client:
+        for _ in range(200):
+            response = client.get("/ready")
+            if response.status_code == 200:
+                break
+            time.sleep(0.05)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["ready"] is True
+        assert {"registry", "imports", "instantiate", "warm_up"} <= set(body["phases"])
+
+def test_app_loads_without_ollama():
+    # ollama is not in requirements.txt; only the judge verifier needs it
+    code = "import sys; sys.modules['ollama'] = None; import main"
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+def test_closing_the_stream_cancels_pending_items(monkeypatch):
+    cancelled = []
+
+    async def fake_item(registry, index, line):
+        try:
+            await asyncio.sleep(0 if index == 0 else 60)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return {"index": index}
+
+    async def body():
+        for i in range(3):
+            yield json.dumps({"text": "x", "verifier": "limerick"}).encode() + b"\n"
+
+    async def run():
+        monkeypatch.setattr(main, "_verify_stream_item", fake_item)
+        stream = main._stream_results(SimpleNamespace(stream=body))
+        first = await stream.__anext__()
+        await stream.aclose()
+        # Cancelled by the time aclose() returns, not when the loop shuts down
+        return first, sorted(cancelled)
+
+    first, cancelled_on_close = asyncio.run(run())
+    assert json.loads(first) == {"index": 0}
+    assert cancelled_on_close == [1, 2]
+
+def test_pool_started_after_shutdown_is_not_leaked(monkeypatch):
+    starting = threading.Event()
+    release = threading.Event()
+    stopped = threading.Event()
+
+    class SlowPool:
+        def start(self):
+            starting.set()
+            release.wait(10)
+
+        def shutdown(self):
+            stopped.set()
+
+    monkeypatch.setattr(main.VerifierPool, "from_env", classmethod(lambda cls, path: SlowPool()))
+    with TestClient(app):
+        assert starting.wait(10)
+    # The warm-up thread finishes starting its pool only after shutdown
+    release.set()
+    assert stopped.wait(10)
+    assert main.pool is None
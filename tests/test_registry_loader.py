@@ -0,0 +1,94 @@
+# tests/test_registry_loader.py
+import asyncio
+import json
+import os
+
+from registry_loader import VerifierRegistry, get_registry, build_verifier_kwargs, run_verifier_jobs, run_verifier_jobs_async
+from verifiers.math.arithmetic_verifier import ArithmeticVerifier
+
+def _write_registry(path, entries, mtime_ns):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+HAIKU_ENTRY = {
+    "module": "verifiers.poetry.haiku_verifier",
+    "class": "HaikuVerifier",
+    "arguments": [{"name": "--tolerance", "type": "int", "default": 1}]
+}
+
+def test_shared_instance_until_file_changes(tmp_path):
+    path = tmp_path / "registry.json"
+    _write_registry(path, {"haiku": HAIKU_ENTRY}, 1_000_000_000)
+    registry = VerifierRegistry(str(path))
+
+    first = registry.get_verifier("haiku")
+    assert registry.get_verifier("haiku") is first
+    assert "tanka" not in registry
+
+    _write_registry(path, {
+        "haiku": HAIKU_ENTRY,
+        "tanka": {"module": "verifiers.poetry.tanka_verifier", "class": "TankaVerifier"}
+    }, 2_000_000_000)
+
+    assert "tanka" in registry
+    assert registry.get_verifier("haiku") is not first
+
+def test_get_registry_is_process_wide():
+    assert get_registry("verifier_registry.json") is get_registry("./verifier_registry.json")
+
+def test_build_verifier_kwargs_casts_and_defaults():
+    kwargs = build_verifier_kwargs(HAIKU_ENTRY, {"tolerance": "2", "ignored": 1})
+    assert kwargs == {"tolerance": 2}
+    assert build_verifier_kwargs(HAIKU_ENTRY) == {"tolerance": 1}
+
+class _CountingVerifier:
+    """Scores len(text) / 10 and records how it was called."""
+
+    def __init__(self):
+        self.batch_calls = []
+
+    def verify(self, text, **kwargs):
+        if text == "boom":
+            raise ValueError("bad text")
+        return len(text) / 10
+
+    def verify_with_feedback(self, text, **kwargs):
+        return {"score": self.verify(text), "feedback": ["ok"]}
+
+    def verify_batch(self, texts, **kwargs):
+        self.batch_calls.append((list(texts), kwargs))
+        return [self.verify(t) for t in texts]
+
+def test_run_verifier_jobs_batches_score_only_jobs():
+    verifier = _CountingVerifier()
+    jobs = [
+        ("a", {"x": 1}, False),
+        ("bb", {"x": 1}, True),
+        ("ccc", {"x": 1}, False),
+        ("dddd", {"x": 2}, False),
+    ]
+    results = run_verifier_jobs(verifier, jobs)
+    assert [r["score"] for r in results] == [0.1, 0.2, 0.3, 0.4]
+    assert results[1]["feedback"] == ["ok"]
+    # Only the two score-only jobs with equal kwargs share a batch call
+    assert verifier.batch_calls == [(["a", "ccc"], {"x": 1})]
+
+def test_run_verifier_jobs_isolates_batch_errors():
+    results = run_verifier_jobs(_CountingVerifier(), [("a", {}, False), ("boom", {}, False), ("cc", {}, False)])
+    assert results[0] == {"score": 0.1, "feedback": None}
+    assert results[1]["score"] == 0.0 and results[1]["error"] == "ValueError: bad text"
+    assert results[2] == {"score": 0.2, "feedback": None}
+
+def test_run_verifier_jobs_async_uses_thread_default():
+    # ArithmeticVerifier has no async methods of its own: BaseVerifier runs it in a thread
+    verifier = ArithmeticVerifier()
+    jobs = [
+        ("<answer>7</answer>", {"expression": "3 + 4"}, False),
+        ("<answer>8</answer>", {"expression": "3 + 4"}, True),
+        (None, {"expression": "3 + 4"}, False),
+    ]
+    results = asyncio.run(run_verifier_jobs_async(verifier, jobs))
+    assert results[0] == {"score": 1.0, "feedback": None}
+    assert results[1]["score"] == 0.0 and results[1]["feedback"]
+    assert results[2]["score"] == 0.0 and results[2]["error"].startswith("TypeError")
@@ -0,0 +1,36 @@
+# tests/test_result_cache.py
+import time
+
+from result_cache import ResultCache, ResultCaches
+
+def test_key_ignores_arg_order_but_not_content():
+    key = ResultCache.make_key("haiku", "1", {"a": 1, "b": 2}, "text", False)
+    assert key == ResultCache.make_key("haiku", "1", {"b": 2, "a": 1}, "text", False)
+    assert key != ResultCache.make_key("haiku", "2", {"a": 1, "b": 2}, "text", False)
+    assert key != ResultCache.make_key("haiku", "1", {"a": 1, "b": 2}, "text", True)
+    assert key != ResultCache.make_key("tanka", "1", {"a": 1, "b": 2}, "text", False)
+
+def test_lru_eviction_and_counters():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", {"score": 1.0})
+    cache.put("b", {"score": 0.5})
+    assert cache.get("a") == {"score": 1.0}   # "a" is now most recent
+    cache.put("c", {"score": 0.0})            # evicts "b"
+
+    assert cache.get("b") is None
+    assert cache.get("c") == {"score": 0.0}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (2, 1, 1, 2)
+
+def test_ttl_expiry():
+    cache = ResultCache(ttl=0.01)
+    cache.put("a", {"score": 1.0})
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+def test_per_verifier_opt_out():
+    caches = ResultCaches()
+    assert caches.for_verifier("answer_satisfaction", {"cache": {"enabled": False}}) is None
+    haiku_cache = caches.for_verifier("haiku", {})
+    assert haiku_cache is caches.for_verifier("haiku", {})
+    assert caches.for_verifier("haiku", {"cache": {"ttl": 5}}).ttl == 5
@@ -0,0 +1,76 @@
+# tests/test_verifier_pool.py
+import asyncio
+import json
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import main
+from main import VerifyRequest, _verify_group
+from registry_loader import get_registry
+from verifier_pool import VerifierPool
+
+PROBE = {"module": "tests.probe_verifier", "class": "ProbeVerifier", "execution": "process"}
+
+@pytest.fixture
+def registry_path(tmp_path):
+    path = tmp_path / "registry.json"
+    path.write_text(json.dumps({"probe": PROBE}))
+    return str(path)
+
+def _pid(result: dict) -> int:
+    return int(result["feedback"][0].rsplit(" ", 1)[1])
+
+def test_run_many_order_errors_and_prewarm(registry_path):
+    pool = VerifierPool(registry_path, max_workers=2)
+    pool.start()
+    try:
+        # start() spawned every worker up front
+        workers = set(pool._executor._processes)
+        assert len(workers) == 2
+        jobs = [(f"text {i}", {}, True) for i in range(5)]
+        jobs[2] = ("fail", {}, True)
+        results = asyncio.run(pool.run_many("probe", jobs))
+    finally:
+        pool.shutdown()
+
+    assert len(results) == 5
+    assert "probe failure" in results[2]["error"] and results[2]["score"] == 0.0
+    scored = [r for i, r in enumerate(results) if i != 2]
+    assert [r["feedback"][0].split(" in ")[0] for r in scored] == ["text 0", "text 1", "text 3", "text 4"]
+    # The workers ran warm_up() before their first job
+    assert all(r["score"] == 1.0 for r in scored)
+    assert {_pid(r) for r in scored} <= workers
+
+def test_workers_are_recycled(registry_path):
+    pool = VerifierPool(registry_path, max_workers=1, max_tasks_per_child=2)
+    pool.start()
+    try:
+        pids = {_pid(asyncio.run(pool.run("probe", f"text {i}", {}, feedback=True))) for i in range(4)}
+    finally:
+        pool.shutdown()
+    assert len(pids) >= 2
+
+def test_restarts_after_a_worker_dies(registry_path):
+    pool = VerifierPool(registry_path, max_workers=1)
+    pool.start()
+    try:
+        with pytest.raises(BrokenProcessPool):
+            asyncio.run(pool.run("probe", "crash", {}))
+        result = asyncio.run(pool.run("probe", "after the crash", {}, feedback=True))
+    finally:
+        pool.shutdown()
+    assert result["score"] == 1.0
+
+def test_verify_group_uses_the_pool(registry_path, monkeypatch):
+    pool = VerifierPool(registry_path, max_workers=1)
+    pool.start()
+    monkeypatch.setattr(main, "pool", pool)
+    items = [VerifyRequest(text=f"group {i}", verifier="probe", feedback=True) for i in range(3)]
+    try:
+        results = asyncio.run(_verify_group(get_registry(registry_path), "probe", items))
+    finally:
+        pool.shutdown()
+    assert [r["score"] for r in results] == [1.0] * 3
+    assert {_pid(r) for r in results} != {os.getpid()}
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from verifiers.helpers.alignment import align, edit_distance, format_diff, similarity
+
+def _dp_distance(a, b):
+    """Reference Wagner-Fischer DP."""
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i]
+        for j in range(1, len(b) + 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1])))
+        previous = current
+    return previous[-1]
+
+def test_known_distances():
+    assert edit_distance("kitten", "sitting") == 3
+    assert edit_distance("", "abc") == edit_distance("abc", "") == 3
+    assert edit_distance("same", "same") == 0
+    assert edit_distance([".-", "-..."], ["-..."]) == 1
+
+def test_matches_dp_on_random_strings():
+    rng = random.Random(0)
+    for _ in range(500):
+        a = "".join(rng.choices("abc", k=rng.randint(0, 80)))
+        b = "".join(rng.choices("abc", k=rng.randint(0, 80)))
+        assert edit_distance(a, b) == _dp_distance(a, b), (a, b)
+
+def test_bound():
+    assert edit_distance("kitten", "sitting", bound=3) == 3
+    assert edit_distance("kitten", "sitting", bound=1) == 2
+    assert edit_distance("a", "abcdef", bound=2) == 3
+
+def test_similarity():
+    assert similarity("HELLO", "HELLU") == pytest.approx(0.8)
+    assert similarity("", "") == 1.0
+    assert similarity("abc", "xyz") == 0.0
+
+def test_alignment_ops():
+    ops = align("HELLO", "HELO!")
+    assert sum(op != "=" for op, _, _ in ops) == edit_distance("HELLO", "HELO!")
+    assert "".join(x for _, x, _ in ops if x is not None) == "HELLO"
+    assert "".join(y for _, _, y in ops if y is not None) == "HELO!"
+
+def test_format_diff():
+    ops = align(".... . .-.. .-.. ---".split(), ". .-.. .-.. --- -.-".split())
+    assert format_diff(ops) == "[-....] . .-.. .-.. --- [+-.-]"
+    assert format_diff(align("night", "knight"), separator="") == "[+k]night"
+    assert format_diff(align("cat", "cut"), separator="") == "c[a→u]t"
+
+def test_long_transcripts():
+    rng = random.Random(1)
+    reference = [rng.choice([".-", "-...", "-.-.", "/", "---"]) for _ in range(5000)]
+    candidate = reference[1:2500] + ["..."] + reference[2500:]
+    assert edit_distance(reference, candidate) == 2
+    ops = align(reference, candidate)
+    assert [(op, x, y) for op, x, y in ops if op != "="] == [("-", reference[0], None), ("+", None, "...")]
+    # Too different to align within the cell budget
+    assert align(reference, candidate[::-1], max_cells=10_000) is None
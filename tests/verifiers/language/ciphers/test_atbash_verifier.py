@@ -0,0 +1,25 @@
+# test_atbash_verifier.py
+import pytest
+
+from verifiers.language.ciphers.atbash_verifier import AtbashVerifier, atbash
+
+
+@pytest.fixture
+def verifier():
+    return AtbashVerifier()
+
+
+def test_atbash_is_its_own_inverse():
+    assert atbash("Hello, World!") == "Svool, Dliow!"
+    assert atbash(atbash("Hello, World!")) == "Hello, World!"
+
+
+def test_encode_and_decode(verifier):
+    assert verifier.verify("Svool", original_text="Hello") == 1.0
+    assert verifier.verify("hello", original_text="Svool", verify_mode="decode") == 1.0
+
+
+def test_missing_character(verifier):
+    result = verifier.verify_with_feedback("Svol", original_text="Hello")
+    assert result["score"] == pytest.approx(0.8)
+    assert "Character count mismatch: reference has 5, candidate has 4." in result["feedback"]
@@ -0,0 +1,42 @@
+# test_base64_verifier.py
+import pytest
+
+from verifiers.language.ciphers.base64_verifier import Base64Verifier, base64_to_text, text_to_base64
+
+
+@pytest.fixture
+def verifier():
+    return Base64Verifier()
+
+
+def test_round_trip():
+    assert text_to_base64("hello") == "aGVsbG8="
+    assert base64_to_text("aGVs\nbG8=") == "hello"
+    assert base64_to_text(text_to_base64("naïve café")) == "naïve café"
+
+
+def test_invalid_base64_raises():
+    with pytest.raises(ValueError):
+        base64_to_text("not base64!")
+
+
+def test_encode_is_case_sensitive(verifier):
+    assert verifier.verify("aGVsbG8=", original_text="hello") == 1.0
+    assert verifier.verify("AGVSBG8=", original_text="hello") < 1.0
+
+
+def test_encode_ignores_line_wrapping(verifier):
+    assert verifier.verify("aGVs\nbG8=\n", original_text="hello") == 1.0
+
+
+def test_decode(verifier):
+    assert verifier.verify("Hello", original_text="aGVsbG8=", verify_mode="decode") == pytest.approx(1.0)
+    result = verifier.verify_with_feedback("help", original_text="aGVsbG8=", verify_mode="decode")
+    assert result["score"] == pytest.approx(0.6)
+    assert "(Decode) Decoded as: 'hello'" in result["feedback"]
+
+
+def test_decode_invalid_original_scores_zero(verifier):
+    assert verifier.verify("hello", original_text="not base64!", verify_mode="decode") == 0.0
+    result = verifier.verify_with_feedback("hello", original_text="aGVsbG8", verify_mode="decode")
+    assert result == {"score": 0.0, "feedback": ["Original text is not valid base64 => score=0.0."]}
@@ -0,0 +1,46 @@
+# test_caesar_verifier.py
+import pytest
+
+from verifiers.language.ciphers.caesar_verifier import CaesarVerifier, caesar_shift, caesar_unshift
+
+
+@pytest.fixture
+def verifier():
+    return CaesarVerifier()
+
+
+def test_shift_round_trip():
+    assert caesar_shift("Hello, World!", 3) == "Khoor, Zruog!"
+    assert caesar_shift("xyz", 3) == "abc"
+    assert caesar_shift(caesar_shift("Hello", 13), 13) == "Hello"
+    assert caesar_unshift(caesar_shift("The quick brown fox", 29), 29) == "The quick brown fox"
+
+
+def test_encode_exact_match(verifier):
+    result = verifier.verify_with_feedback("Khoor, Zruog!", original_text="Hello, World!")
+    assert result["score"] == 1.0
+    assert not any("mismatch" in line.lower() for line in result["feedback"])
+
+
+def test_rot13(verifier):
+    assert verifier.verify("Uryyb", original_text="Hello", shift=13) == 1.0
+    # The default shift of 3 gives a different ciphertext
+    assert verifier.verify("Uryyb", original_text="Hello") < 1.0
+
+
+def test_decode_ignores_case(verifier):
+    assert verifier.verify("HELLO", original_text="Khoor", verify_mode="decode") == 1.0
+
+
+def test_partial_credit(verifier):
+    # One wrong letter out of five
+    result = verifier.verify_with_feedback("Khoos", original_text="Hello")
+    assert result["score"] == pytest.approx(0.8)
+    assert "Character mismatch at index 4: expected 'R', got 'S'" in result["feedback"]
+    assert "(Encode) Diff: KHOO[R→S]" in result["feedback"]
+
+
+def test_invalid_mode(verifier):
+    result = verifier.verify_with_feedback("Khoor", original_text="Hello", verify_mode="bogus")
+    assert result["score"] == 0.0
+    assert verifier.verify("Khoor", original_text="Hello", verify_mode="bogus") == 0.0
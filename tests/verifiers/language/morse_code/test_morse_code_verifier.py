@@ -2,7 +2,7 @@
 import pytest
 
 # imports
-from verifiers.language.morse_code.morse_code_verifier import MorseCodeVerifier
+from verifiers.language.morse_code.morse_code_verifier import MorseCodeVerifier, text_to_morse
 
 
 @pytest.fixture
@@ -129,3 +129,44 @@ def test_decode_length_mismatch(verifier):
         f"Expected 0.75 score, got {result['score']}"
     assert any("character count mismatch" in line.lower() for line in result["feedback"]), \
         "Feedback should mention character count mismatch."
+
+
+def test_encode_dropped_token_keeps_alignment(verifier):
+    """
+    A token dropped near the start costs one edit, not every token after it.
+    """
+    original_text = "HELLO WORLD"
+    # Morse for "HELLO WORLD" without the leading "...."
+    candidate_morse = ". .-.. .-.. --- / .-- --- .-. .-.. -.."
+
+    result = verifier.verify_with_feedback(
+        text=candidate_morse,
+        original_text=original_text,
+        verify_mode="encode"
+    )
+    assert pytest.approx(result["score"], 0.01) == 10 / 11
+    assert "Missing token at index 0: expected '....'" in result["feedback"]
+    assert "(Encode) Diff: [-....] . .-.. .-.. --- / .-- --- .-. .-.. -.." in result["feedback"]
+    assert verifier.verify(candidate_morse, original_text=original_text) == result["score"]
+
+
+def test_decode_dropped_character(verifier):
+    """'HELO WORLD' against 'HELLO WORLD' is one missing character."""
+    result = verifier.verify_with_feedback(
+        text="HELO WORLD",
+        original_text=".... . .-.. .-.. --- / .-- --- .-. .-.. -..",
+        verify_mode="decode"
+    )
+    assert pytest.approx(result["score"], 0.01) == 10 / 11
+    assert "(Decode) Diff: HE[-L]LO WORLD" in result["feedback"]
+
+
+def test_long_transcript(verifier):
+    """Multi-kilobyte transcripts with a few slips still score near 1."""
+    original_text = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG " * 40
+    tokens = text_to_morse(original_text).split()
+    candidate = " ".join(tokens[1:500] + ["..."] + tokens[500:])
+    assert len(candidate) > 5000
+    result = verifier.verify_with_feedback(candidate, original_text=original_text)
+    assert result["score"] == pytest.approx(1 - 2 / len(tokens))
+    assert sum("mismatch at index" in m or "Missing token" in m or "Extra token" in m for m in result["feedback"]) == 2
@@ -0,0 +1,33 @@
+# test_nato_phonetic_verifier.py
+import pytest
+
+from verifiers.language.nato_phonetic.nato_phonetic_verifier import (
+    NatoPhoneticVerifier, nato_to_text, text_to_nato
+)
+
+
+@pytest.fixture
+def verifier():
+    return NatoPhoneticVerifier()
+
+
+def test_spelling_round_trip():
+    assert text_to_nato("Hi 5!") == "HOTEL INDIA / FIVE ?"
+    assert nato_to_text("Hotel India / Five") == "HI 5"
+    assert nato_to_text("alpha x-ray niner") == "AX9"
+
+
+def test_encode_ignores_case_and_aliases(verifier):
+    assert verifier.verify("Alpha Bravo / X-ray", original_text="ab x") == 1.0
+
+
+def test_encode_partial_credit(verifier):
+    result = verifier.verify_with_feedback("Hotel Echo Lima Lima Oscar", original_text="HELP")
+    # One extra code word and one wrong one, out of 5
+    assert result["score"] == pytest.approx(0.6)
+    assert "Extra token at candidate index 2: got 'LIMA'" in result["feedback"]
+    assert "Token mismatch at index 3: expected 'PAPA', got 'OSCAR'" in result["feedback"]
+
+
+def test_decode(verifier):
+    assert verifier.verify("hello", original_text="Hotel Echo Lima Lima Oscar", verify_mode="decode") == 1.0
@@ -0,0 +1,20 @@
+# tests/verifiers/language/test_transform_verifier.py
+import pytest
+
+from verifiers.language.transform_verifier import TransformVerifier
+
+
+class Upper(TransformVerifier):
+    encode = staticmethod(str.upper)
+
+
+def test_transforms_must_implement_encode_and_decode():
+    with pytest.raises(TypeError, match="decode"):
+        Upper(name="upper", description="Upper-case transform.")
+
+    class Complete(Upper):
+        decode = staticmethod(str.lower)
+
+    verifier = Complete(name="upper", description="Upper-case transform.")
+    assert verifier.reference("abc") == "ABC"
+    assert verifier.reference("ABC", verify_mode="decode") == "abc"
@@ -0,0 +1,103 @@
+# tests/verifiers/math/test_arithmetic_verifier.py
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from verifiers.math.arithmetic_verifier import ArithmeticVerifier
+from verifiers.math.helpers.arithmetic import evaluate, find_expression
+
+ROOT = Path(__file__).resolve().parents[3]
+
+@pytest.fixture
+def verifier():
+    return ArithmeticVerifier()
+
+def test_evaluate_is_exact():
+    assert evaluate("-8584 * 9952 - 6132 * 2741") == -102235780
+    assert evaluate("(-7957 * -1161 + 8834) / 9353") * 9353 == -7957 * -1161 + 8834
+    assert evaluate("2^10 - 3 × 4 ÷ 2") == 1018
+    assert evaluate("0.1 + 0.2") * 10 == 3
+
+@pytest.mark.parametrize("expression", [
+    "__import__('os').system('true')",
+    "(1).__class__",
+    "[1, 2]",
+    "x + 1",
+    "1 / 0",
+    "2 ** 1000",
+    "((9 ** 99) ** 99) ** 99",
+    "(9 ** 100) ** 100 - 1",
+    "((9 ** 100) ** 40) * ((9 ** 100) ** 40)",
+    "1 + " * 200 + "1",
+])
+def test_evaluate_rejects(expression):
+    with pytest.raises(ValueError):
+        evaluate(expression)
+
+def test_find_expression_in_prompt():
+    assert find_expression("Evaluate: -8584 * 9952 - 6132 * 2741.").text == "-8584 * 9952 - 6132 * 2741"
+    assert find_expression("(-2780 - 1084) * -8682 + -8814: what's the answer?").value == (-2780 - 1084) * -8682 - 8814
+    assert find_expression("Name three Greek gods.") is None
+    assert find_expression("What is 5 / 0?").error == "division by zero"
+
+def test_correct_and_wrong_answers(verifier):
+    prompt = "Evaluate: 43 - 53 - 27."
+    result = verifier.verify_with_feedback(
+        "<think>...</think><answer>-37</answer><verifier_answer>-17</verifier_answer>", prompt=prompt
+    )
+    assert result["score"] == 0.5
+    assert result["feedback"][0] == "Expression: 43 - 53 - 27 = -37"
+    assert "<verifier_answer> '-17' is wrong (expected -37)." in result["feedback"]
+
+def test_normalized_answers(verifier):
+    text = "<answer>The final answer is -102,235,780.</answer><verifier_answer>-1.0223578E+8</verifier_answer>"
+    assert verifier.verify(text, prompt="Evaluate: -8584 * 9952 - 6132 * 2741.") == 1.0
+
+def test_rounded_decimals_use_tolerance(verifier):
+    text = "<answer>-4618.3098</answer>"
+    prompt = "Tell me what 2155 / -933 + -4616 is"
+    assert verifier.verify(text, prompt=prompt) == 1.0
+    assert verifier.verify(text, prompt=prompt, rel_tolerance=0) == 0.0
+    assert verifier.verify("<answer>-4618</answer>", prompt=prompt) == 0.0
+
+def test_integer_results_are_exact(verifier):
+    prompt = "Evaluate: -8584 * 9952 - 6132 * 2741."
+    assert verifier.verify("<answer>-102235780</answer>", prompt=prompt) == 1.0
+    for wrong in ("-102235779", "-102235680", "-102235780.5"):
+        result = verifier.verify_with_feedback(f"<answer>{wrong}</answer>", prompt=prompt)
+        assert result["score"] == 0.0
+        assert f"<answer> '{wrong}' is wrong (expected -102235780)." in result["feedback"]
+    # A whole-number answer to a fractional result is not a rounding
+    assert verifier.verify("<answer>333333333</answer>", expression="1000000000 / 3") == 0.0
+
+@pytest.mark.parametrize("prompt", [
+    "Evaluate: (9**100)**100 - 1.",
+    "Evaluate: (10**100)**100 / 3.",
+    "Evaluate: ((9**100)**40) * ((9**100)**40).",
+])
+def test_huge_results_are_rejected(verifier, prompt):
+    result = verifier.verify_with_feedback("<answer>1</answer>", prompt=prompt)
+    assert result["score"] == 0.0
+    assert "too large" in result["feedback"][0]
+
+def test_large_fractions_are_shown(verifier):
+    prompt = "Evaluate: (10**100)**4 / 3."
+    result = verifier.verify_with_feedback("<answer>1</answer>", prompt=prompt)
+    assert result["feedback"][0].startswith("Expression: (10**100)**4 / 3 = 1000")
+    assert verifier.verify("<answer>" + "1" + "0" * 400 + "/3</answer>", prompt=prompt) == 1.0
+
+def test_expression_argument_and_errors(verifier):
+    assert verifier.verify("<answer>7</answer>", expression="3 + 4") == 1.0
+    result = verifier.verify_with_feedback("<answer>7</answer>", prompt="Say hello.")
+    assert result == {"score": 0.0, "feedback": ["No arithmetic expression found in the prompt => score=0.0."]}
+    result = verifier.verify_with_feedback("no tags", prompt="What is 2 + 2?")
+    assert result["feedback"][-1] == "No <answer> or <verifier_answer> found => score=0.0."
+
+def test_scores_coldstart_file_quickly(verifier):
+    rows = [json.loads(line) for line in open(ROOT / "coldstart" / "merged_completions.jsonl", encoding="utf-8")]
+    start = time.perf_counter()
+    scores = [verifier.verify(row["completion"], prompt=row["prompt"]) for row in rows]
+    assert time.perf_counter() - start < 1.0
+    assert 0 < sum(scores) < len(rows)
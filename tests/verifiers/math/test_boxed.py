@@ -0,0 +1,24 @@
+# tests/verifiers/math/test_boxed.py
+from verifiers.math.helpers.boxed import extract_boxed, find_boxes
+
+def test_nested_braces_are_kept():
+    assert extract_boxed(r"\(\boxed{\frac{1}{2}}\)") == r"\frac{1}{2}"
+    assert extract_boxed(r"\boxed{\sqrt{\frac{a}{b}} + 1}") == r"\sqrt{\frac{a}{b}} + 1"
+
+def test_box_without_math_delimiters():
+    assert extract_boxed(r"The answer is \boxed { 42 }.") == "42"
+    assert extract_boxed(r"$\boxed{7}$") == "7"
+
+def test_last_box_wins():
+    text = r"First try \boxed{3}, wait, recheck... so \boxed{4}"
+    assert extract_boxed(text) == "4"
+    assert extract_boxed(text, last=False) == "3"
+
+def test_escaped_braces_and_unclosed_boxes():
+    assert find_boxes(r"\boxed{\{1, 2\}} \boxed{\boxed{5}} \boxed{never closed") == [r"\{1, 2\}", r"\boxed{5}"]
+    assert extract_boxed("no box here") is None
+    assert extract_boxed(r"\boxed{") is None
+
+def test_long_unclosed_box_is_linear():
+    text = r"\boxed{" + "{" * 200000
+    assert extract_boxed(text) is None
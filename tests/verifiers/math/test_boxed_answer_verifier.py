@@ -82,3 +82,23 @@ def test_additional_text_outside_box(verifier):
     result = verifier.verify_with_feedback(text=model_output, gold_solution=gold_solution)
     assert result["score"] == 1.0
     assert any("matches exactly" in msg for msg in result["feedback"])
+
+def test_nested_box_content(verifier):
+    gold_solution = r"\(\boxed{\frac{1}{2}}\)"
+    result = verifier.verify_with_feedback(text=r"\(\boxed{\frac{1}{2}}\)", gold_solution=gold_solution)
+    assert result["score"] == 1.0
+    assert any("matches exactly => model: '\\frac{1}{2}'" in msg for msg in result["feedback"])
+    assert verifier.verify(r"\(\boxed{\frac{1}{3}}\)", gold_solution=gold_solution) == 0.0
+
+def test_last_box_without_delimiters(verifier):
+    model_output = r"Maybe \boxed{41}? No: recounting gives \boxed{42}."
+    assert verifier.verify(model_output, gold_solution=r"\boxed{42}") == 1.0
+
+def test_normalized_match(verifier):
+    result = verifier.verify_with_feedback(text=r"\(\boxed{0.5}\)", gold_solution=r"\(\boxed{\frac{1}{2}}\)")
+    assert result["score"] == 1.0
+    assert any("matches after normalization" in msg and "(both '1/2')" in msg for msg in result["feedback"])
+    assert verifier.verify(r"\boxed{-1.0223578E+8}", gold_solution=r"\boxed{-102,235,780}") == 1.0
+
+def test_overlong_number_is_wrong(verifier):
+    assert verifier.verify(r"\boxed{" + "9" * 5000 + "}", gold_solution=r"\boxed{4}") == 0.0
@@ -0,0 +1,68 @@
+# tests/verifiers/math/test_claims.py
+from fractions import Fraction
+
+import pytest
+
+from verifiers.math.helpers.claims import check_claim, find_claims, stated_value
+
+def test_finds_claims_with_steps_and_offsets():
+    text = "Step 1: 6160 * 36 = 221,760\nStep 2: 221760 - 5 = 221755\nResult: 221755"
+    claims = find_claims(text)
+    assert [c.expression for c in claims] == ["6160 * 36", "221760 - 5"]
+    assert [c.step for c in claims] == ["Step 1", "Step 2"]
+    assert text[claims[0].start:claims[0].end] == "6160 * 36 = 221,760"
+    assert all(check_claim(c) for c in claims)
+
+@pytest.mark.parametrize("text, expected", [
+    ("1. 5 + 3 = 8", "5 + 3"),
+    ("- 6 + 7 = 13", "6 + 7"),
+    ("so 90 (9 * 10) + 7 = 97", "(9 * 10) + 7"),
+    ("x <= 5 + 3 = 8", "5 + 3"),
+    ("1,234 + 1 = 1,235", "1234 + 1"),
+])
+def test_left_hand_side(text, expected):
+    assert [c.expression for c in find_claims(text)] == [expected]
+
+@pytest.mark.parametrize("text", [
+    "a == 3 + 4",
+    "39 * 41 = 1599 + 2",
+    "x = 5",
+    "Result: 42",
+])
+def test_not_claims(text):
+    assert find_claims(text) == []
+
+def test_check_claim():
+    (wrong,) = find_claims("210 + 18 = 201")
+    assert check_claim(wrong) is False
+    (rounded,) = find_claims("-9501 / 1561 = -6.0865")
+    assert check_claim(rounded) is True
+    (approx,) = find_claims("1/3 ≈ 0.333")
+    assert approx.approximate and check_claim(approx) is True
+    (zero,) = find_claims("5 / 0 = 1")
+    assert check_claim(zero) is None
+
+def test_stated_value():
+    assert stated_value("1,469,606") == (1469606, 0)
+    assert stated_value("-1.08") == (Fraction(-108, 100), Fraction(1, 100))
+    assert stated_value("2.5e3")[1] == 100
+    assert stated_value("0e5") == (0, 0)
+    assert stated_value("1e3000000") is None
+    assert stated_value("9" * 5000) is None
+
+@pytest.mark.parametrize("text, holds", [
+    ("2 * 3 = 1e1", False),
+    ("2 * 3 = 0e5", False),
+    ("2 * 3 = 1e3000000", False),
+    ("1 + 1 = " + "9" * 5000, False),
+    ("2 * 3 = 6e0", True),
+    ("2 * 3 = 0.6e1", True),
+    ("1 / 25 = 0.1", False),
+    ("1 - 1 = 0.0", True),
+    ("1 - 1 = 0e5", True),
+    ("0.4 + 0 ≈ 0", True),
+    ("300 * 7 = 2.1e3", True),
+])
+def test_stated_precision_must_match_magnitude(text, holds):
+    (claim,) = find_claims(text)
+    assert check_claim(claim) is holds
@@ -0,0 +1,46 @@
+# tests/verifiers/math/test_normalize.py
+import pytest
+
+from verifiers.math.helpers.normalize import compare_answers, extract_number, normalize_answer, normalize_gold
+
+@pytest.mark.parametrize("answer, canonical", [
+    ("1,234", "1234"),
+    ("1234.0", "1234"),
+    ("1.234E+3", "1234"),
+    (r"1.234 \times 10^{3}", "1234"),
+    ("1.234×10^3", "1234"),
+    ("-1.0223578E+8", "-102235780"),
+    ("2e-3", "1/500"),
+    (r"\frac{1}{2}", "1/2"),
+    (r"\dfrac12", "1/2"),
+    ("0.5", "1/2"),
+    ("1/2", "1/2"),
+    (r"-\frac{3}{4}", "-3/4"),
+    (r"$42$.", "42"),
+    (r"\text{42}", "42"),
+    (r"x^2 + 1", "x^2+1"),
+    (r"\left( 1, 2 \right)", "(1,2)"),
+    ("1,23", "1,23"),
+    (r"\frac{1}{0}", r"\frac{1}{0}"),
+    ("1e999999999", "1e999999999"),
+    ("9" * 5000, "9" * 5000),
+])
+def test_normalize_answer(answer, canonical):
+    assert normalize_answer(answer) == canonical
+
+def test_compare_answers():
+    assert compare_answers(" 42 ", "42") == "exact"
+    assert compare_answers("1.4E+3", "1,400") == "normalized"
+    assert compare_answers("0.3333", r"\frac{1}{3}") is None
+
+def test_gold_is_normalized_once():
+    normalize_gold.cache_clear()
+    for model_answer in ["1400", "1.4E+3", "1399"]:
+        compare_answers(model_answer, "1,400.00")
+    info = normalize_gold.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+def test_overlong_numbers_are_not_parsed():
+    assert extract_number("9" * 5000) is None
+    assert extract_number("the answer is " + "9" * 5000) is None
+    assert compare_answers("9" * 5000, "4") is None
@@ -0,0 +1,72 @@
+# tests/verifiers/math/test_step_arithmetic_verifier.py
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from verifiers.math.step_arithmetic_verifier import StepArithmeticVerifier
+
+ROOT = Path(__file__).resolve().parents[3]
+
+TRACE = """<think>
+Step 1: -5932 * -6032 = 35,781,824
+Step 2: 35781824 + 12 = 35781836
+Step 3: 35781836 / 4 = 8945459
+</think>
+<answer>8945459</answer>"""
+
+@pytest.fixture
+def verifier():
+    return StepArithmeticVerifier()
+
+def test_all_steps_correct(verifier):
+    result = verifier.verify_with_feedback(TRACE)
+    assert result["score"] == 1.0
+    assert result["feedback"][0] == "Checked 3 claims: 3 correct."
+
+def test_first_wrong_step(verifier):
+    text = TRACE.replace("35781836", "35781837", 1)
+    result = verifier.verify_with_feedback(text)
+    assert result["score"] == pytest.approx(2 / 3)
+    assert result["feedback"][1] == (
+        "First wrong step: Step 2 '35781824 + 12 = 35781837' is wrong: 35781824 + 12 = 35781836."
+    )
+    assert verifier.verify(text) == result["score"]
+
+def test_only_think_is_checked(verifier):
+    assert verifier.verify("<think>no sums here</think><answer>2 + 2 = 5</answer>") == 0.0
+    result = verifier.verify_with_feedback("<answer>2 + 2 = 4</answer>")
+    assert result == {"score": 0.0, "feedback": ["Format error: no <think> tag found."]}
+
+def test_uncheckable_claims_are_skipped(verifier):
+    result = verifier.verify_with_feedback("<think>1 / 0 = 0 and 2 * 3 = 6</think>")
+    assert result["score"] == 1.0
+    assert "'1 / 0 = 0' cannot be evaluated; skipped." in result["feedback"]
+
+def test_coarse_scientific_results_are_wrong(verifier):
+    text = "<think>2 * 3 = 1e1\n4 * 5 = 0e5\n7 * 7 = 1e3000000</think>"
+    start = time.perf_counter()
+    assert verifier.verify(text) == 0.0
+    assert time.perf_counter() - start < 0.1
+
+def test_overlong_stated_number_is_wrong(verifier):
+    text = "<think>Step 1: 1 + 1 = " + "9" * 5000 + "</think><answer>2</answer>"
+    assert verifier.verify(text) == 0.0
+    assert verifier.verify_batch([text]) == [0.0]
+    assert verifier.verify_with_feedback(text)["score"] == 0.0
+
+def test_batch_matches_verify_on_coldstart(verifier):
+    rows = [json.loads(line) for line in open(ROOT / "coldstart" / "merged_completions.jsonl", encoding="utf-8")]
+    texts = [row["completion"] for row in rows]
+    start = time.perf_counter()
+    scores = verifier.verify_batch(texts)
+    assert time.perf_counter() - start < 1.0
+    assert scores == [verifier.verify(text) for text in texts]
+    assert 0 < sum(scores) < len(texts)
+
+def test_long_trace_scales_linearly(verifier):
+    text = "<think>" + "Step 1: 12 * 12 = 144, so 144 - 4 = 140.\n" * 5000 + "</think>"
+    start = time.perf_counter()
+    assert verifier.verify(text) == 1.0
+    assert time.perf_counter() - start < 2.0
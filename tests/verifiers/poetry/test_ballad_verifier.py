@@ -0,0 +1,36 @@
+import pytest
+from verifiers.poetry.ballad_verifier import BalladVerifier
+
+# Common measure, ABCB
+BALLAD = """The king sat in Dunfermline town,
+Drinking the blood-red wine;
+O where will I get a good sailor
+To sail this ship of mine?
+Up and spake an eldern knight,
+Sat at the king's right knee:
+Sir Patrick Spens is the best sailor
+That sails upon the sea."""
+
+@pytest.fixture
+def verifier():
+    return BalladVerifier()
+
+def test_scheme_uses_fresh_letters_per_stanza(verifier):
+    assert verifier.scheme(stanzas=2) == "ABCB DEFE"
+    with pytest.raises(ValueError):
+        verifier.scheme(stanzas=9)
+
+def test_two_stanza_ballad(verifier):
+    result = verifier.verify_with_feedback(BALLAD, stanzas=2)
+    assert "B-rhyme check passed (lines 2,4): 2/2 match." in result["feedback"]
+    assert "E-rhyme check passed (lines 6,8): 2/2 match." in result["feedback"]
+    assert result["score"] >= 0.2 + 0.5
+
+def test_unrhymed_quatrain(verifier):
+    poem = "The river runs beneath the hill\nAnd carries leaves away\nThe miller sleeps beside his wheel\nAnd dreams of summer rain"
+    result = verifier.verify_with_feedback(poem, stanzas=1)
+    assert "B-rhyme check failed (lines 2,4): 1/2 match." in result["feedback"]
+    assert result["score"] < verifier.verify(poem.replace("rain", "day"), stanzas=1)
+
+def test_stanza_count_mismatch_is_partial(verifier):
+    assert verifier.verify(BALLAD, stanzas=4) < verifier.verify(BALLAD, stanzas=2)
@@ -110,3 +110,14 @@ Then vanishes soon
     print("Feedback details:")
     for f in feedback_list:
         print("-", f)
+
+def test_pronunciation_variants_count(verifier):
+    """
+    'every' and 'family' have 2- and 3-syllable pronunciations; the first
+    CMU entry (3) would put line 1 over 5 with tolerance 0, the variant
+    range lets it pass.
+    """
+    text = "every family\nthe old silent pond is still\nsplash silence again"
+    result = verifier.verify_with_feedback(text, tolerance=0)
+    assert result["score"] == verifier.verify(text, tolerance=0) == 1.0
+    assert "Good (6 syllables, 4-6 across pronunciations)" in result["feedback"][0]
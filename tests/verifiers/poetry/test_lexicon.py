@@ -0,0 +1,118 @@
+import os
+
+import pronouncing
+import pytest
+
+from verifiers.poetry.helpers import lexicon as lexicon_module
+from verifiers.poetry.helpers.lexicon import (
+    Lexicon,
+    build_lexicon,
+    get_lexicon,
+    rhyme_tail_from_phones,
+    write_lexicon
+)
+
+PRONUNCIATIONS = [
+    ("water", "W AO1 T ER0"),
+    ("cat", "K AE1 T"),
+    ("permit", "P ER0 M IH1 T"),
+    ("permit", "P ER1 M IH2 T"),
+    ("café", "K AE0 F EY1"),
+    ("hmm", "HH M"),
+]
+
+@pytest.fixture
+def small_lexicon(tmp_path):
+    lexicon = Lexicon.open(write_lexicon(str(tmp_path / "small.bin"), PRONUNCIATIONS))
+    yield lexicon
+    lexicon.close()
+
+def test_lookup_fields(small_lexicon):
+    assert small_lexicon.lookup("water") == (2, "ER0", "10", 2, 2, frozenset({"ER0"}))
+    assert small_lexicon.lookup("cat") == (1, "AE1-T", "1", 1, 1, frozenset({"AE1-T"}))
+    assert small_lexicon.lookup("café")[:3] == (2, "EY1", "01")
+
+def test_first_pronunciation_wins(small_lexicon):
+    assert small_lexicon.lookup("permit")[:3] == (2, "IH1-T", "01")
+
+def test_pronunciation_variants(tmp_path):
+    pronunciations = PRONUNCIATIONS + [
+        ("fire", "F AY1 ER0"), ("fire", "F AY1 R"),
+        ("every", "EH1 V ER0 IY0"), ("every", "EH1 V R IY0"),
+    ]
+    lexicon = Lexicon.open(write_lexicon(str(tmp_path / "variants.bin"), pronunciations))
+    fire = lexicon.lookup("fire")
+    assert (fire.syllables, fire.min_syllables, fire.max_syllables) == (2, 1, 2)
+    assert fire.rhyme_tail == "ER0" and fire.rhyme_tails == {"ER0", "AY1-R"}
+    # Two pronunciations, one tail
+    every = lexicon.lookup("every")
+    assert (every.min_syllables, every.max_syllables) == (2, 3)
+    assert every.rhyme_tails == {"IY0"}
+    # Listed in the rhyme index under every tail
+    assert "fire" in lexicon.words_for_tail("AY1-R") and "fire" in lexicon.words_for_tail("ER0")
+
+def test_unknown_words(small_lexicon):
+    assert small_lexicon.lookup("dog") is None
+    assert small_lexicon.lookup("") is None
+    assert "cat" in small_lexicon and "dog" not in small_lexicon
+
+def test_words_are_sorted(small_lexicon):
+    assert len(small_lexicon) == 5
+    assert list(small_lexicon) == sorted(["water", "cat", "permit", "café", "hmm"])
+
+def test_no_stressed_vowel_uses_last_two_phones():
+    assert rhyme_tail_from_phones("HH M") == "HH-M"
+
+def test_matches_pronouncing():
+    """Every 25th CMU word compiles to what the old phones-based helpers computed."""
+    lexicon = get_lexicon()
+    pronouncing.init_cmu()
+    assert len(lexicon) == len(pronouncing.lookup)
+    for word in list(pronouncing.lookup)[::25]:
+        phones = pronouncing.phones_for_word(word)[0]
+        syllables, tail, stress = lexicon.lookup(word)[:3]
+        assert syllables == sum(ch.isdigit() for ch in phones), word
+        assert tail == rhyme_tail_from_phones(phones), word
+        assert stress == pronouncing.stresses(phones), word
+        entry = lexicon.lookup(word)
+        variants = pronouncing.phones_for_word(word)
+        counts = [sum(ch.isdigit() for ch in p) for p in variants]
+        assert (entry.min_syllables, entry.max_syllables) == (min(counts), max(counts)), word
+        assert entry.rhyme_tails == {rhyme_tail_from_phones(p) for p in variants}, word
+
+def test_rejects_other_formats(tmp_path):
+    path = tmp_path / "bogus.bin"
+    path.write_bytes(b"not a lexicon" * 10)
+    with pytest.raises(ValueError):
+        Lexicon.open(str(path))
+
+def test_get_lexicon_rebuilds_stale_file(tmp_path, monkeypatch):
+    path = tmp_path / "lexicon.bin"
+    data = bytearray(build_lexicon(PRONUNCIATIONS))
+    data[4] = 0xFF  # unknown format version
+    path.write_bytes(bytes(data))
+
+    monkeypatch.setenv("VERIFIERS_LEXICON_PATH", str(path))
+    monkeypatch.setattr(lexicon_module, "_lexicon", None)
+    lexicon = get_lexicon()
+    assert lexicon.lookup("cat")[:3] == (1, "AE1-T", "1")
+    assert Lexicon.open(str(path)).lookup("cat")[:3] == (1, "AE1-T", "1")
+
+def test_get_lexicon_falls_back_to_memory(tmp_path, monkeypatch):
+    monkeypatch.setenv("VERIFIERS_LEXICON_PATH", str(tmp_path / "missing-dir" / "lexicon.bin"))
+    monkeypatch.setattr(lexicon_module, "_lexicon", None)
+    lexicon = get_lexicon()
+    assert lexicon.lookup("cat")[:3] == (1, "AE1-T", "1")
+    assert not os.path.exists(tmp_path / "missing-dir")
+
+def test_words_for_tail(tmp_path):
+    pronunciations = PRONUNCIATIONS + [
+        ("bat", "B AE1 T"), ("acrobat", "AE1 K R AH0 B AE2 T"), ("at", "AE1 T"),
+        ("'at", "AE1 T"), ("t", "T IY1"),
+    ]
+    lexicon = Lexicon.open(write_lexicon(str(tmp_path / "rhymes.bin"), pronunciations))
+    # Fewest syllables, then shortest; apostrophes and single letters are left out
+    assert lexicon.words_for_tail("AE1-T") == ["at", "bat", "cat"]
+    assert lexicon.words_for_tail("AE1-T", limit=2, exclude={"at"}) == ["bat", "cat"]
+    assert lexicon.words_for_tail("IY1") == []
+    assert lexicon.words_for_tail("nope") == []
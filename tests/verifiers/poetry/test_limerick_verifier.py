@@ -133,3 +133,19 @@ Then ended the day feeling blue
     assert any("B-rhyme detail" in f for f in feedback), (
         "Expected B-rhyme detail in feedback"
     )
+
+def test_rhyme_suggestions_in_feedback(verifier):
+    """Failed rhyme checks name the offending line and suggest replacements."""
+    text = """\
+There once was a fellow named Lee
+Who was stung on the arm by a bee
+   When asked, "Was it fun?"
+   "No, it wasn't," he spurt
+It’s a good thing it wasn’t a cat.
+"""
+    feedback = verifier.verify_with_feedback(text)["feedback"]
+    a_suggestion = next(f for f in feedback if f.startswith("Line 5 'cat'"))
+    assert "does not rhyme with 'lee' (line 1); candidates:" in a_suggestion
+    assert any(f.startswith("Line 4 'spurt' does not rhyme with 'fun' (line 3)") for f in feedback)
+    # Line 2 rhymes with line 1, so it gets no suggestion
+    assert not any(f.startswith("Line 2 '") for f in feedback)
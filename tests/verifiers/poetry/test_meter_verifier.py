@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from verifiers.poetry.helpers.meter import meter_distance, meter_pattern
+from verifiers.poetry.meter_verifier import MeterVerifier
+
+SONNET_LINES = """Shall I compare thee to a summer's day?
+Thou art more lovely and more temperate:
+Rough winds do shake the darling buds of May,
+And summer's lease hath all too short a date;"""
+
+@pytest.fixture
+def verifier():
+    return MeterVerifier()
+
+def test_meter_pattern():
+    assert meter_pattern("iambic", 5) == "0101010101"
+    assert meter_pattern("Anapestic", 3) == "001001001"
+    assert meter_pattern("01 01 x1") == "0101x1"
+    with pytest.raises(ValueError):
+        meter_pattern("hexametric")
+    with pytest.raises(ValueError):
+        meter_pattern("iambic", 0)
+
+def test_meter_distance():
+    assert meter_distance("0101010101", "0101010101", 0) == 0
+    # "x" matches either stress
+    assert meter_distance("xxxx", "0101", 0) == 0
+    assert meter_distance("1010", "0101", 2) == 2
+    # Missing syllables
+    assert meter_distance("01010101", "0101010101", 2) == 2
+    # Bounded: anything past the bound reports bound + 1
+    assert meter_distance("1", "0101010101", 2) == 3
+    assert meter_distance("1010101010", "0101010101", 1) == 2
+
+def _full_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, s in enumerate(a, start=1):
+        current = [i]
+        for j, p in enumerate(b, start=1):
+            match = s == p or "x" in (s, p)
+            current.append(min(previous[j - 1] + (not match), previous[j] + 1, current[j - 1] + 1))
+        previous = current
+    return previous[-1]
+
+def test_banded_distance_matches_full_table():
+    rng = random.Random(0)
+    for _ in range(2000):
+        a = "".join(rng.choice("01x") for _ in range(rng.randint(0, 12)))
+        b = "".join(rng.choice("01x") for _ in range(rng.randint(0, 12)))
+        bound = rng.randint(0, 4)
+        assert meter_distance(a, b, bound) == min(_full_distance(a, b), bound + 1), (a, b, bound)
+
+def test_iambic_pentameter(verifier):
+    assert verifier.verify(SONNET_LINES) == 1.0
+    result = verifier.verify_with_feedback(SONNET_LINES, tolerance=0)
+    assert result["feedback"][0] == "Target iambic x5: 0101010101 (allowing 0 edit(s) per line)."
+    assert result["score"] == 0.75
+    assert "xxx10xx10 is more than 0 edit(s) from 0101010101 (9 syllables, expected 10)" in result["feedback"][2]
+
+def test_wrong_meter(verifier):
+    prose = "Nevertheless everybody remembered the anniversary\nUnfortunately"
+    assert verifier.verify(prose) == 0.0
+    assert verifier.verify("") == 0.0
+    assert verifier.verify_with_feedback("")["feedback"] == ["No lines found."]
+
+def test_anapestic_limerick_lines(verifier):
+    lines = "There once was a man from Peru\nWho dreamed he was eating his shoe"
+    assert verifier.verify(lines, meter="anapestic", feet=3, tolerance=1) == 1.0
+    assert verifier.verify(lines, meter="anapestic", feet=2, tolerance=1) == 0.0
+
+def test_verify_batch_shares_only_full_batches(verifier):
+    from verifiers.poetry.helpers.poem_batch import PoemBatch
+    texts = [SONNET_LINES, "", SONNET_LINES + "\nhello there"]
+    expected = [verifier.verify(t) for t in texts]
+    assert verifier.verify_batch(texts) == expected
+    assert verifier.verify_batch(texts, batch=PoemBatch(texts)) == expected
+    # A batch truncated to 3 lines cannot score line 4; a full one is built instead
+    assert verifier.verify_batch(texts, batch=PoemBatch(texts, max_lines=3)) == expected
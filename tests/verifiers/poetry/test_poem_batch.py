@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from verifiers.poetry.haiku_verifier import HaikuVerifier
+from verifiers.poetry.limerick_verifier import LimerickVerifier
+from verifiers.poetry.tanka_verifier import TankaVerifier
+from verifiers.poetry.helpers.meter import line_meter
+from verifiers.poetry.helpers.poem_batch import MAX_PACKED_SYLLABLES, PoemBatch
+
+HAIKU = "An old silent pond\nA frog jumps into the pond—\nSplash! Silence again."
+LIMERICK = """\
+There once was a fellow named Lee
+Who was stung on the arm by a bee
+   When asked, "Does it hurt?"
+   "No, it doesn't," he spurt
+It’s a good thing it wasn’t a flea.
+"""
+
+def test_arrays():
+    batch = PoemBatch([HAIKU, "", "one\n\n  two  words\n"])
+    assert batch.line_counts.tolist() == [3, 0, 2]
+    assert batch.line_starts.tolist() == [0, 3, 3]
+    assert batch.line_syllables.tolist() == [5, 7, 5, 1, 2]
+    # "pond—" and "pond" share a rhyme tail
+    assert batch.line_rhymes[0] == batch.line_rhymes[1]
+
+def test_max_lines_keeps_line_counts():
+    batch = PoemBatch([LIMERICK, HAIKU], max_lines=2)
+    assert batch.line_counts.tolist() == [5, 3]
+    assert len(batch.line_syllables) == 4
+    with pytest.raises(ValueError):
+        batch.first_lines(batch.line_syllables, 3)
+
+def test_shared_batch():
+    texts = [HAIKU, LIMERICK, "too short"]
+    batch = PoemBatch(texts, max_lines=5)
+    assert HaikuVerifier().verify_batch(texts, batch=batch) == [1.0, 0.0, 0.0]
+    assert LimerickVerifier().verify_batch(texts, batch=batch) == [0.0, 1.0, 0.0]
+    assert TankaVerifier().verify_batch(texts, batch=batch) == [TankaVerifier().verify(t) for t in texts]
+
+def test_distinct_line_meters():
+    long_line = "the cat sat on the mat " * 8
+    texts = [HAIKU, LIMERICK, HAIKU, long_line + "\n" + long_line + "\n...", ""]
+    batch = PoemBatch(texts)
+    meters, line_meter_ids = batch.distinct_line_meters()
+    lines = [l for t in texts for l in t.strip().split("\n") if l.strip()]
+    assert batch.line_meters == [meters[i] for i in line_meter_ids] == [line_meter(l) for l in lines]
+    assert sorted(meters) == sorted(set(batch.line_meters))
+    assert len(meters[line_meter_ids[11]]) > MAX_PACKED_SYLLABLES
+    assert meters[line_meter_ids[13]] == ""
+
+def test_rhyme_across_pronunciations():
+    # "read" is EH1-D first and IY1-D second; "need" and "bed" each rhyme with one of them
+    batch = PoemBatch(["I read\nwhat I need\nin bed\nthe cat"])
+    rhymes = batch.line_rhymes
+    first = rhymes[[0, 0, 0, 1]]
+    other = rhymes[[1, 2, 3, 2]]
+    assert batch.rhyme(first, other).tolist() == [True, True, False, False]
+    assert batch.rhyme(np.array([-1]), np.array([-1])).tolist() == [False]
+
+def test_syllable_ranges():
+    batch = PoemBatch(["every fire\ncat"])
+    assert batch.line_syllables.tolist() == [5, 1]
+    assert batch.line_min_syllables.tolist() == [3, 1]
+    assert batch.line_max_syllables.tolist() == [5, 1]
@@ -0,0 +1,64 @@
+import pytest
+
+from verifiers.poetry.helpers.rhyme_scheme import check_scheme, parse_scheme
+from verifiers.poetry.helpers.text_analysis import TextAnalysis
+from verifiers.poetry.rhyme_scheme_verifier import RhymeSchemeVerifier
+
+LIMERICK = [
+    "There once was a man from Peru",
+    "Who dreamed he was eating his shoe",
+    "He woke with a fright",
+    "In the middle of the night",
+    "And found that his dream had come true",
+]
+
+def test_parse_scheme():
+    assert parse_scheme("abab cdcd\nefef gg") == "ABABCDCDEFEFGG"
+    with pytest.raises(ValueError):
+        parse_scheme("AB-AB")
+    with pytest.raises(ValueError):
+        parse_scheme("   ")
+
+def test_groups_and_agreement():
+    result = check_scheme(LIMERICK, "AABBA")
+    assert [g.letter for g in result.groups] == ["A", "B"]
+    assert result.group("A").line_numbers == [1, 2, 5]
+    assert result.group("A").ok and result.group("B").ok
+    assert result.agreement == 1.0 and result.line_count_ok
+    assert result.key_groups[result.key(1)] == [1, 2, 5]
+    with pytest.raises(KeyError):
+        result.group("C")
+
+def test_misses_and_partial_agreement():
+    lines = LIMERICK[:4] + ["And then he went back to his bed"]
+    result = check_scheme(lines, "AABBA")
+    assert result.misses() == [(5, 1)]
+    assert not result.group("A").ok and result.group("B").ok
+    assert result.agreement == pytest.approx(4 / 5)
+
+def test_short_poem_has_no_keys_for_missing_lines():
+    result = check_scheme(LIMERICK[:3], "AABBA")
+    assert result.key(4) is None and result.key(5) is None
+    assert not result.line_count_ok
+    # Lines 1, 2 and 3 are present; missing lines are neither matches nor suggestions
+    assert result.matches == 3 and result.misses() == []
+    assert not result.group("B").ok
+
+def test_single_line_groups_are_ignored():
+    result = check_scheme(["the cat", "a dog", "a mat", "the moon"], "ABAC")
+    assert [g.letter for g in result.rhyme_groups] == ["A"]
+    assert result.agreement == 1.0
+
+def test_accepts_line_analyses():
+    analysis = TextAnalysis("\n".join(LIMERICK))
+    assert check_scheme(analysis.lines, "AABBA").agreement == 1.0
+
+def test_generic_verifier_scheme_argument():
+    verifier = RhymeSchemeVerifier()
+    poem = "\n".join(LIMERICK)
+    assert verifier.verify(poem, scheme="AABBA") == pytest.approx(1.0)
+    # Wrong scheme: 4 lines expected and A-B-A-B do not rhyme that way
+    result = verifier.verify_with_feedback(poem, scheme="ABAB")
+    assert result["score"] < 1.0
+    assert any(msg.startswith("A-rhyme check failed") for msg in result["feedback"])
+    assert any("does not rhyme with" in msg for msg in result["feedback"])
@@ -154,3 +154,16 @@ Thrilling noose
     print("Score:", score)
     for fmsg in feedback:
         print("-", fmsg)
+
+def test_rhyme_suggestions(verifier):
+    """A failed rhyme suggests dictionary words that rhyme with line 1."""
+    result = verifier.verify_with_feedback("I love my cat\nI walk the dog")
+    suggestion = next(msg for msg in result["feedback"] if "does not rhyme" in msg)
+    assert suggestion.startswith("Line 2 'dog' does not rhyme with 'cat' (line 1); candidates:")
+    assert "bat" in suggestion
+
+def test_rhyme_across_pronunciations(verifier):
+    """'read' rhymes with 'need' through its second pronunciation."""
+    result = verifier.verify_with_feedback("Every night I read\nAll the books I need")
+    assert result["score"] == 1.0
+    assert "Perfect rhyme: both lines share 'IY1-D'." in result["feedback"]
@@ -0,0 +1,41 @@
+import pytest
+from verifiers.poetry.sonnet_verifier import SonnetVerifier
+
+SONNET_18 = """Shall I compare thee to a summer's day?
+Thou art more lovely and more temperate:
+Rough winds do shake the darling buds of May,
+And summer's lease hath all too short a date;
+Sometime too hot the eye of heaven shines,
+And often is his gold complexion dimm'd;
+And every fair from fair sometime declines,
+By chance or nature's changing course untrimm'd;
+But thy eternal summer shall not fade,
+Nor lose possession of that fair thou ow'st;
+Nor shall death brag thou wander'st in his shade,
+When in eternal lines to time thou grow'st:
+So long as men can breathe or eyes can see,
+So long lives this, and this gives life to thee."""
+
+@pytest.fixture
+def verifier():
+    return SonnetVerifier()
+
+def test_shakespeare_scores_high(verifier):
+    result = verifier.verify_with_feedback(SONNET_18)
+    # 'temperate' / 'date' is an eye rhyme the dictionary does not accept
+    assert result["score"] == pytest.approx(0.2 + 0.5 * 13 / 14 + 0.3)
+    assert "B-rhyme check failed (lines 2,4): 1/2 match." in result["feedback"]
+    assert "G-rhyme check passed (lines 13,14): 2/2 match." in result["feedback"]
+    assert any(msg.startswith("Line 4 'date' does not rhyme with 'temperate' (line 2)") for msg in result["feedback"])
+
+def test_wrong_line_count_is_partial(verifier):
+    quatrain = "\n".join(SONNET_18.split("\n")[:4])
+    score = verifier.verify(quatrain)
+    assert 0.0 < score < 0.5
+
+def test_syllable_tolerance(verifier):
+    short = "\n".join(line.split(",")[0].split(" ", 3)[-1] for line in SONNET_18.split("\n"))
+    assert verifier.verify(short, tolerance=10) > verifier.verify(short, tolerance=0)
+
+def test_weights(verifier):
+    assert verifier.verify(SONNET_18, line_count_weight=1.0, rhyme_weight=0.0, syllable_weight=0.0) == 1.0
@@ -0,0 +1,63 @@
+import pytest
+
+from verifiers.poetry.helpers import word_cache as word_cache_module
+from verifiers.poetry.helpers.text_analysis import TextAnalysis
+from verifiers.poetry.helpers.word_cache import WordCache
+from verifiers.poetry.haiku_verifier import HaikuVerifier
+from verifiers.poetry.tanka_verifier import TankaVerifier
+from verifiers.poetry.limerick_verifier import LimerickVerifier
+from verifiers.poetry.rhyme_verifier import RhymeVerifier
+from verifiers.poetry.villanelle_verifier import VillanelleVerifier
+
+POEM = """\
+There once was a fellow named Lee
+Who was stung on the arm by a bee
+   When asked, "Does it hurt?"
+   "No, it doesn't," he spurt
+It’s a good thing it wasn’t a flea.
+"""
+
+VERIFIERS = [HaikuVerifier, TankaVerifier, LimerickVerifier, RhymeVerifier, VillanelleVerifier]
+
+@pytest.fixture
+def counted_lookups(monkeypatch):
+    """Counts word analyses per token, with the word cache disabled."""
+    calls = {}
+    original = word_cache_module.analyze_word
+
+    def counting(token):
+        calls[token] = calls.get(token, 0) + 1
+        return original(token)
+
+    monkeypatch.setattr(word_cache_module, "analyze_word", counting)
+    monkeypatch.setattr(word_cache_module, "word_cache", WordCache(max_entries=0))
+    return calls
+
+def test_each_word_is_looked_up_once(counted_lookups):
+    """One analysis shared by every poetry verifier resolves each distinct token once."""
+    analysis = TextAnalysis(POEM)
+    for verifier_cls in VERIFIERS:
+        verifier = verifier_cls()
+        verifier.verify(POEM, analysis=analysis)
+        verifier.verify_with_feedback(POEM, analysis=analysis)
+
+    assert counted_lookups, "Expected the analysis to look words up"
+    assert all(count == 1 for count in counted_lookups.values()), counted_lookups
+
+@pytest.mark.parametrize("verifier_cls", VERIFIERS)
+def test_shared_analysis_gives_same_results(verifier_cls):
+    """Passing an analysis must not change the score or the feedback."""
+    verifier = verifier_cls()
+    analysis = TextAnalysis(POEM)
+    assert verifier.verify(POEM, analysis=analysis) == verifier.verify(POEM)
+    assert verifier.verify_with_feedback(POEM, analysis=analysis) == verifier.verify_with_feedback(POEM)
+
+def test_line_analysis_fields():
+    analysis = TextAnalysis("An old silent pond\n\n  Splash!  \n")
+    assert len(analysis) == 2
+    first, second = analysis.lines
+    assert first.words == ["An", "old", "silent", "pond"]
+    assert first.syllables == 5
+    assert first.last_word == "pond"
+    assert second.clean_words == ["splash"]
+    assert second.rhyme_ending
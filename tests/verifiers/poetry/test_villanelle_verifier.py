@@ -96,3 +96,16 @@ Line 10
     # => final partial or near 0. 
     # We'll just confirm it's less than 1.0
     assert score < 1.0, f"Expected partial (<1.0), got {score}"
+
+def test_near_miss_refrain_gets_partial_credit(verifier):
+    """
+    A refrain with one word changed keeps most of its credit and the
+    feedback shows the word-level diff; punctuation is ignored.
+    """
+    exact = ["I have a cat", "We love our dog", "Another cat"] + ["random line"] * 2 + ["I have a cat."]
+    near = exact[:5] + ["I had a cat"]
+    exact_score = verifier.verify("\n".join(exact))
+    near_result = verifier.verify_with_feedback("\n".join(near))
+    # Line 6 repeats line 1 with 1 of 4 words changed => 0.75 of one refrain check
+    assert exact_score - near_result["score"] == pytest.approx(0.4 * 0.25 / 6)
+    assert "Refrain at line 6 differs from line 1 (0.75 similar): i [have→had] a cat" in near_result["feedback"]
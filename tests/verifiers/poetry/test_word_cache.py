@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+from verifiers.poetry.helpers.word_cache import WordCache, WordInfo, analyze_word
+
+@pytest.fixture
+def cache():
+    return WordCache(max_entries=3)
+
+def test_word_info_fields():
+    assert analyze_word("Water,") == WordInfo("water", 2, 2, "ER0", "10", "10", 2, 2, frozenset({"ER0"}))
+    # Unknown words fall back to the naive count and the last 2 letters
+    assert analyze_word("Zqxblorp!") == WordInfo("zqxblorp", 1, 1, "rp", "", "x", 1, 1, frozenset({"rp"}))
+    assert analyze_word("—") == WordInfo("", 0, 0, "", "", "", 0, 0, frozenset())
+
+def test_pronunciation_variants():
+    fire = analyze_word("fire")
+    assert (fire.min_syllables, fire.max_syllables) == (1, 2)
+    assert fire.syllables == 2 and {"ER0", "AY1-R"} <= fire.rhyme_tails
+
+def test_word_meter():
+    assert analyze_word("cat").meter == "x"
+    assert analyze_word("understand").meter == "x01"
+    assert analyze_word("unknownish-zqxblorp").meter == "x" * analyze_word("unknownish-zqxblorp").syllables
+
+def test_hits_and_misses(cache):
+    assert cache.get("cat") == analyze_word("cat")
+    cache.get("cat")
+    cache.get("Cat")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+def test_lru_eviction(cache):
+    for token in ["a", "b", "c"]:
+        cache.get(token)
+    cache.get("a")  # 'b' is now the least recently used
+    cache.get("d")
+    assert cache.stats()["evictions"] == 1
+    cache.get("b")
+    assert cache.stats()["misses"] == 5
+
+def test_resize_and_disable(cache):
+    for token in ["a", "b", "c"]:
+        cache.get(token)
+    cache.resize(1)
+    assert cache.stats()["size"] == 1
+    cache.resize(0)
+    cache.get("a")
+    cache.get("a")
+    assert cache.stats()["size"] == 0 and cache.stats()["hits"] == 0
+
+def test_thread_safety():
+    cache = WordCache(max_entries=50)
+    tokens = [f"word{i % 80}" for i in range(2000)]
+
+    def worker():
+        for token in tokens:
+            assert cache.get(token).clean == token.rstrip("0123456789")
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 8000
+    assert stats["size"] <= 50
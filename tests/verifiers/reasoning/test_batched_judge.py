@@ -0,0 +1,116 @@
+# tests/verifiers/reasoning/test_batched_judge.py
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from registry_loader import run_verifier_jobs, run_verifier_jobs_async
+from verifiers.reasoning.answer_satisfaction_verifier import AnswerSatisfactionVerifier
+from verifiers.reasoning.helpers.judge_cache import JudgeCache
+
+KWARGS = {"question": "What is 2+2?", "gold_answer": "4"}
+
+
+class FakeJudge:
+    """
+    Replies to batched prompts with score = (answer number + 1) / 100 for
+    each answer, and to single prompts with 0.5. 'batch_reply' overrides
+    the batched reply.
+    """
+
+    def __init__(self, batch_reply=None):
+        self.batch_reply = batch_reply
+        self.prompts = []
+
+    def reply(self, messages, format):
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        if format.get("type") != "array":
+            return json.dumps({"score": 0.5, "feedback": "single"})
+        if self.batch_reply is not None:
+            return self.batch_reply
+        answers = re.findall(r"^### ANSWER (\d+)\n(.*)$", prompt, re.MULTILINE)
+        return json.dumps([{"index": int(i), "score": (int(i) + 1) / 100, "feedback": f"batched {text}"}
+                           for i, text in answers])
+
+    def chat(self, model, messages, format=None):
+        return SimpleNamespace(message=SimpleNamespace(content=self.reply(messages, format)))
+
+    async def achat(self, model, messages, format=None):
+        await asyncio.sleep(0)
+        return self.reply(messages, format)
+
+    @property
+    def batched_calls(self):
+        return sum(prompt.count("### ANSWER 0") for prompt in self.prompts)
+
+    @property
+    def single_calls(self):
+        return len(self.prompts) - self.batched_calls
+
+
+@pytest.fixture
+def judge():
+    fake = FakeJudge()
+    with patch("verifiers.reasoning.answer_satisfaction_verifier.chat", side_effect=fake.chat):
+        yield fake
+
+def _texts(n):
+    return [f"<answer>answer {i}</answer>" for i in range(n)]
+
+def test_group_is_judged_in_one_call(judge):
+    verifier = AnswerSatisfactionVerifier()
+    texts = _texts(15) + ["<answer>answer 3</answer>", "no answer"]
+    results = verifier.verify_batch_with_feedback(texts, **KWARGS)
+
+    assert (judge.batched_calls, judge.single_calls) == (1, 0)
+    assert [r["score"] for r in results[:15]] == [(i + 1) / 100 for i in range(15)]
+    assert results[15] == results[3] == {"score": 0.04, "feedback": ["LLM feedback: batched answer 3"]}
+    assert results[16]["score"] == 0.0 and "No <answer>...</answer> found => score=0.0." in results[16]["feedback"]
+    assert verifier.verify_batch(texts, **KWARGS) == [r["score"] for r in results]
+
+def test_large_groups_are_split(judge):
+    scores = AnswerSatisfactionVerifier().verify_batch(_texts(20), **KWARGS)
+    assert (judge.batched_calls, judge.single_calls) == (2, 0)
+    assert scores[16:] == [0.01, 0.02, 0.03, 0.04]
+
+@pytest.mark.parametrize("reply, single_calls", [
+    ("not valid JSON at all", 4),
+    (json.dumps({"score": 1.0, "feedback": "not an array"}), 4),
+    (json.dumps([{"index": 0, "score": 2.0, "feedback": "a"}, {"index": 2, "score": 0.3, "feedback": "c"},
+                 {"index": 2, "score": 0.9, "feedback": "dup"}, {"index": 7, "score": 0.9, "feedback": "x"}]), 2),
+])
+def test_unparsed_answers_fall_back_to_single_calls(reply, single_calls):
+    judge = FakeJudge(batch_reply=reply)
+    with patch("verifiers.reasoning.answer_satisfaction_verifier.chat", side_effect=judge.chat):
+        scores = AnswerSatisfactionVerifier().verify_batch(_texts(4), **KWARGS)
+    assert judge.single_calls == single_calls
+    if single_calls == 2:
+        assert scores == [1.0, 0.5, 0.3, 0.5]
+    else:
+        assert scores == [0.5] * 4
+
+def test_batched_verdicts_are_cached(judge, tmp_path):
+    cache = JudgeCache(str(tmp_path / "judge.sqlite"))
+    verifier = AnswerSatisfactionVerifier(cache=cache)
+    first = verifier.verify_batch(_texts(3), **KWARGS)
+    calls = len(judge.prompts)
+    assert verifier.verify_batch(_texts(3), **KWARGS) == first
+    assert verifier.verify("<answer>answer 1</answer>", **KWARGS) == first[1]
+    assert len(judge.prompts) == calls
+
+def test_async_batch_through_the_job_runner():
+    judge = FakeJudge()
+    verifier = AnswerSatisfactionVerifier(judge=SimpleNamespace(chat=judge.achat))
+    jobs = [(text, KWARGS, False) for text in _texts(5)] + [("<answer>answer 9</answer>", KWARGS, True)]
+
+    results = asyncio.run(run_verifier_jobs_async(verifier, jobs))
+    assert [r["score"] for r in results] == [0.01, 0.02, 0.03, 0.04, 0.05, 0.5]
+    assert results[5]["feedback"] == ["LLM feedback: single"]
+    assert (judge.batched_calls, judge.single_calls) == (1, 1)
+
+    with patch("verifiers.reasoning.answer_satisfaction_verifier.chat", side_effect=judge.chat):
+        assert run_verifier_jobs(verifier, jobs) == results
@@ -0,0 +1,138 @@
+# tests/verifiers/reasoning/test_judge_cache.py
+import asyncio
+import json
+import sqlite3
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from verifiers.reasoning.answer_satisfaction_verifier import AnswerSatisfactionVerifier
+from verifiers.reasoning.helpers.judge_cache import JudgeCache
+
+VERDICT = {"score": 0.9, "feedback": ["LLM feedback: Good."]}
+
+def test_key_covers_every_field():
+    fields = ["model", "1", "answer", "question", "gold"]
+    key = JudgeCache.make_key(*fields)
+    for i in range(len(fields)):
+        changed = fields[:i] + [fields[i] + "!"] + fields[i + 1:]
+        assert JudgeCache.make_key(*changed) != key
+    assert JudgeCache.make_key("model", "1", "answer", None, None) != JudgeCache.make_key("model", "1", "answer", "", "")
+
+def test_verdicts_persist_across_instances(tmp_path):
+    path = str(tmp_path / "judge.sqlite")
+    cache = JudgeCache(path)
+    cache.put("k", VERDICT)
+    cache.close()
+
+    reopened = JudgeCache(path)
+    assert reopened.get("k") == VERDICT
+    assert reopened.get("other") is None
+    stats = reopened.stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+def test_least_recently_used_are_evicted(tmp_path):
+    cache = JudgeCache(str(tmp_path / "judge.sqlite"), max_entries=2)
+    cache.put("a", VERDICT)
+    cache.put("b", VERDICT)
+    assert cache.get("a") == VERDICT   # "a" is now most recent
+    cache.put("c", VERDICT)            # evicts "b"
+
+    assert cache.get("b") is None
+    assert cache.get("a") == VERDICT and cache.get("c") == VERDICT
+    assert cache.stats()["size"] == 2 and cache.stats()["evictions"] == 1
+
+def test_hits_do_not_write(tmp_path):
+    path = str(tmp_path / "judge.sqlite")
+    cache = JudgeCache(path)
+    cache.put("k", VERDICT)
+    cache._db.execute("UPDATE verdicts SET last_used = 0")
+    cache._db.commit()
+
+    def last_used():
+        return sqlite3.connect(path).execute("SELECT last_used FROM verdicts").fetchone()[0]
+
+    assert cache.get("k") == VERDICT
+    assert last_used() == 0
+    cache.close()
+    assert last_used() > 0
+
+def test_eviction_counts_rows_of_every_process(tmp_path):
+    path = str(tmp_path / "judge.sqlite")
+    first, second = JudgeCache(path, max_entries=3), JudgeCache(path, max_entries=3)
+    for key in "abc":
+        first.put(key, VERDICT)
+    second.put("d", VERDICT)
+    assert second.stats()["evictions"] == 1
+    assert first.stats()["size"] == second.stats()["size"] == 3
+    assert first.get("a") is None and first.get("d") == VERDICT
+
+def test_read_only_never_writes(tmp_path):
+    path = str(tmp_path / "judge.sqlite")
+    with pytest.raises(sqlite3.OperationalError):
+        JudgeCache(path, read_only=True)
+
+    writer = JudgeCache(path)
+    writer.put("k", VERDICT)
+    writer.close()
+
+    cache = JudgeCache(path, read_only=True)
+    assert cache.get("k") == VERDICT
+    cache.put("new", VERDICT)
+    cache.clear()
+    assert cache.get("new") is None and cache.get("k") == VERDICT
+
+def test_from_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("JUDGE_CACHE_PATH", raising=False)
+    assert JudgeCache.from_env() is None
+    monkeypatch.setenv("JUDGE_CACHE_PATH", str(tmp_path / "judge.sqlite"))
+    monkeypatch.setenv("JUDGE_CACHE_MAX_ENTRIES", "5")
+    cache = JudgeCache.from_env()
+    assert cache.max_entries == 5 and not cache.read_only
+
+@patch("verifiers.reasoning.answer_satisfaction_verifier.chat")
+def test_rerun_makes_no_judge_calls(mock_chat, tmp_path):
+    mock_chat.return_value.message.content = json.dumps({"score": 0.7, "feedback": "Decent."})
+    path = str(tmp_path / "judge.sqlite")
+    dataset = [("<answer>4</answer>", "What is 2+2?", "4"), ("<answer>5</answer>", "What is 2+3?", "5")]
+
+    def run(cache):
+        verifier = AnswerSatisfactionVerifier(default_model="test-model", cache=cache)
+        return [verifier.verify_with_feedback(text, question=q, gold_answer=g) for text, q, g in dataset]
+
+    first = run(JudgeCache(path))
+    assert mock_chat.call_count == 2
+    assert run(JudgeCache(path, read_only=True)) == first
+    assert mock_chat.call_count == 2
+    assert first[0] == {"score": 0.7, "feedback": ["LLM feedback: Decent."]}
+
+@patch("verifiers.reasoning.answer_satisfaction_verifier.chat")
+def test_errors_are_not_cached(mock_chat, tmp_path):
+    mock_chat.return_value.message.content = "not valid JSON at all"
+    cache = JudgeCache(str(tmp_path / "judge.sqlite"))
+    verifier = AnswerSatisfactionVerifier(cache=cache)
+    assert verifier.verify("<answer>4</answer>") == 0.0
+    assert verifier.verify("<answer>4</answer>") == 0.0
+    assert mock_chat.call_count == 2
+    assert cache.stats()["size"] == 0
+
+def test_async_lookups_leave_the_event_loop(tmp_path):
+    class RecordingCache(JudgeCache):
+        def get(self, key):
+            threads.add(threading.get_ident())
+            return super().get(key)
+
+    threads = set()
+    cache = RecordingCache(str(tmp_path / "judge.sqlite"))
+    verifier = AnswerSatisfactionVerifier(default_model="test-model", cache=cache)
+    cache.put(cache.make_key("test-model", verifier.PROMPT_VERSION, "4", "What is 2+2?", "4"), VERDICT)
+
+    async def run():
+        single = await verifier.averify_with_feedback("<answer>4</answer>", question="What is 2+2?", gold_answer="4")
+        batch = await verifier.averify_batch(["<answer>4</answer>"] * 2, question="What is 2+2?", gold_answer="4")
+        return threading.get_ident(), single, batch
+
+    loop_thread, single, batch = asyncio.run(run())
+    assert single == VERDICT and batch == [0.9, 0.9]
+    assert threads and loop_thread not in threads
@@ -0,0 +1,152 @@
+# tests/verifiers/reasoning/test_judge_client.py
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from ollama import ResponseError
+
+from registry_loader import run_verifier_jobs_async
+from verifiers.reasoning.answer_satisfaction_verifier import AnswerSatisfactionVerifier
+from verifiers.reasoning.helpers import judge_client
+from verifiers.reasoning.helpers.judge_client import JudgeClient, is_transient
+
+
+class FakeAsyncClient:
+    """Stands in for ollama.AsyncClient: replies after 'delay' seconds, failing first with 'errors'."""
+    instances = []
+
+    def __init__(self, host=None, **kwargs):
+        self.kwargs = kwargs
+        self.errors = []
+        self.delay = 0.01
+        self.content = json.dumps({"score": 0.8, "feedback": "Fine."})
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        FakeAsyncClient.instances.append(self)
+
+    async def chat(self, model, messages, format=None):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.errors:
+                raise self.errors.pop(0)
+            return SimpleNamespace(message=SimpleNamespace(content=self.content))
+        finally:
+            self.active -= 1
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    FakeAsyncClient.instances = []
+    monkeypatch.setattr(judge_client, "AsyncClient", FakeAsyncClient)
+    return FakeAsyncClient
+
+def _session(client):
+    """Opens the client's session on the running loop and returns the fake behind it."""
+    return client._session()[0][0]
+
+def test_concurrency_limit_and_one_pooled_session(fake_ollama):
+    client = JudgeClient(max_concurrency=5)
+
+    async def run():
+        results = await asyncio.gather(*[client.chat("m", []) for _ in range(40)])
+        await client.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert len(results) == 40
+    [session] = fake_ollama.instances
+    assert session.calls == 40
+    assert session.max_active == 5
+    assert session.kwargs["limits"].max_connections == 5
+    assert client.stats()["calls"] == 40 and client.stats()["in_flight"] == 0
+
+def test_large_pools_are_sharded(fake_ollama):
+    client = JudgeClient(max_concurrency=20)
+
+    async def run():
+        await asyncio.gather(*[client.chat("m", []) for _ in range(100)])
+
+    asyncio.run(run())
+    assert len(fake_ollama.instances) == 3
+    assert all(session.kwargs["limits"].max_connections == 7 for session in fake_ollama.instances)
+    assert all(session.max_active <= 7 for session in fake_ollama.instances)
+    assert sum(session.calls for session in fake_ollama.instances) == 100
+
+def test_transient_errors_are_retried(fake_ollama):
+    client = JudgeClient(retries=2, backoff=0)
+
+    async def run():
+        _session(client).errors = [ResponseError("busy", 503), ConnectionError("refused")]
+        return await client.chat("m", [])
+
+    assert json.loads(asyncio.run(run()))["score"] == 0.8
+    assert client.stats()["retries"] == 2
+
+def test_gives_up_after_retries_and_on_client_errors(fake_ollama):
+    client = JudgeClient(retries=1, backoff=0)
+
+    async def run(errors):
+        _session(client).errors = errors
+        return await client.chat("m", [])
+
+    with pytest.raises(ResponseError):
+        asyncio.run(run([ResponseError("busy", 503)] * 2))
+    with pytest.raises(ResponseError):
+        asyncio.run(run([ResponseError("model not found", 404)]))
+    assert client.stats()["retries"] == 1
+    assert client.stats()["failures"] == 2
+
+def test_timeout_per_attempt(fake_ollama):
+    client = JudgeClient(timeout=0.05, retries=1, backoff=0)
+
+    async def run():
+        _session(client).delay = 1.0
+        return await client.chat("m", [])
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
+    assert client.stats()["retries"] == 1
+
+def test_backoff_has_full_jitter():
+    client = JudgeClient(backoff=0.5)
+    delays = [client.backoff_delay(3) for _ in range(200)]
+    assert all(0 <= d <= 4.0 for d in delays)
+    assert len(set(delays)) > 100
+    assert client.backoff_delay(20) <= judge_client.MAX_BACKOFF
+
+def test_is_transient():
+    assert is_transient(asyncio.TimeoutError())
+    assert is_transient(ResponseError("slow down", 429))
+    assert not is_transient(ResponseError("bad request", 400))
+    assert not is_transient(ValueError("bad JSON"))
+
+def test_verifier_awaits_the_judge(fake_ollama):
+    verifier = AnswerSatisfactionVerifier(default_model="test-model", judge=JudgeClient(backoff=0))
+    jobs = [("<answer>4</answer>", {"question": "2+2?", "gold_answer": "4"}, True),
+            ("<answer>5</answer>", {}, False),
+            ("no answer", {}, False)]
+
+    results = asyncio.run(run_verifier_jobs_async(verifier, jobs))
+    assert results[0] == {"score": 0.8, "feedback": ["LLM feedback: Fine."]}
+    assert results[1] == {"score": 0.8, "feedback": None}
+    assert results[2] == {"score": 0.0, "feedback": None}
+    assert sum(session.calls for session in fake_ollama.instances) == 2
+
+def test_verifier_reports_judge_errors(fake_ollama):
+    verifier = AnswerSatisfactionVerifier(judge=JudgeClient(retries=0))
+
+    async def run():
+        _session(verifier.judge).content = "not valid JSON at all"
+        return await verifier.averify_with_feedback("<answer>4</answer>")
+
+    result = asyncio.run(run())
+    assert result["score"] == 0.0
+    assert any("Error calling LLM or parsing JSON" in msg for msg in result["feedback"])
@@ -0,0 +1,49 @@
+# tests/verifiers/reasoning/test_mock_judge_server.py
+import asyncio
+
+import pytest
+from ollama import Client
+
+from benchmarks.mock_ollama_server import MockOllamaServer, verdict_score
+from verifiers.reasoning import answer_satisfaction_verifier
+from verifiers.reasoning.answer_satisfaction_verifier import AnswerSatisfactionVerifier
+from verifiers.reasoning.helpers.judge_client import JudgeClient
+
+TEXTS = [f"<answer>2 + 2 = {n}</answer>" for n in (4, 5, 4, 6)]
+
+@pytest.fixture
+def server():
+    with MockOllamaServer(latency_ms=1, latency="fixed", per_answer_ms=0) as mock:
+        yield mock
+
+def _averify_batch(server, texts, **client_kwargs):
+    async def run():
+        judge = JudgeClient(host=server.url, backoff=0, **client_kwargs)
+        try:
+            return await AnswerSatisfactionVerifier(judge=judge).averify_batch(texts, question="What is 2+2?")
+        finally:
+            await judge.aclose()
+    return asyncio.run(run())
+
+def test_judge_path_over_http(server, monkeypatch):
+    expected = [verdict_score(f"2 + 2 = {n}") for n in (4, 5, 4, 6)]
+    assert _averify_batch(server, TEXTS) == expected
+    assert server.stats()["requests"] == 1 and server.stats()["answers"] == 3
+
+    monkeypatch.setattr(answer_satisfaction_verifier, "chat", Client(host=server.url).chat)
+    verifier = AnswerSatisfactionVerifier()
+    assert [verifier.verify(text) for text in TEXTS] == expected
+    assert verifier.verify_batch(TEXTS) == expected
+
+def test_failures_are_retried_then_reported():
+    with MockOllamaServer(latency_ms=0, latency="fixed", per_answer_ms=0, error_rate=1.0) as server:
+        assert _averify_batch(server, TEXTS[:2], retries=1) == [0.0, 0.0]
+        # One batched call and two single calls, each tried twice
+        assert server.stats()["requests"] == 6
+
+def test_malformed_batches_fall_back_to_single_calls():
+    with MockOllamaServer(latency_ms=0, latency="fixed", per_answer_ms=0, malformed_rate=1.0) as server:
+        assert _averify_batch(server, TEXTS) == [0.0] * 4
+        # The batched call, then one call per distinct answer
+        assert server.stats()["requests"] == 4
+        assert server.stats()["malformed"] == 4
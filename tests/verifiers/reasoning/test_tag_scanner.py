@@ -0,0 +1,69 @@
+import re
+import time
+
+import pytest
+
+from verifiers.reasoning.helpers.tag_scanner import describe_missing, find_section, match_layout, scan_tags
+
+# The anchored regex the layout check replaces; used here as the reference
+STRICT_PATTERN = re.compile(r"^\s*<think>(.*?)</think>\s*<answer>(.*?)</answer>\s*$", re.DOTALL)
+
+def test_scan_tags():
+    tags = scan_tags("<think>a</think> <ANSWER>b</answer>")
+    assert [(t.name, t.closing, t.start, t.exact) for t in tags] == [
+        ("think", False, 0, True), ("think", True, 8, True), ("answer", False, 17, False), ("answer", True, 26, True)
+    ]
+
+@pytest.mark.parametrize("text", [
+    "<think>a</think><answer>b</answer>",
+    "  <think>a</think>\n\n<answer>b</answer>  ",
+    "<think>I will write </think> then <answer>x</answer></think><answer>7</answer>",
+    "<think>a</think><answer>b</answer></answer>",
+    "<think>a</think><answer>b</answer>x",
+    "<think>a</think><ANSWER>b</ANSWER>",
+    "<answer>b</answer><think>a</think>",
+    "x<think>a</think><answer>b</answer>",
+    "<think>a</think>",
+    "",
+])
+def test_layout_matches_the_regex(text):
+    match, layout = STRICT_PATTERN.match(text), match_layout(text)
+    assert layout.ok == bool(match)
+    if match:
+        assert [s.content for s in layout.sections] == list(match.groups())
+
+def test_layout_errors_have_offsets():
+    layout = match_layout("Sure! <think>a</think><answer>b</answer>")
+    assert layout.describe_error() == "Format error at offset 0: expected <think>, found 'Sure! <think>a</thin'."
+
+    text = "<think>" + "x" * 100 + "</think>\n<answer>7"
+    layout = match_layout(text)
+    assert layout.offset == len(text)
+    assert layout.error == "<answer> opened at offset 116 is never closed."
+
+    layout = match_layout("<think>a</think> because <answer>b</answer>")
+    assert layout.error == "expected <answer> after </think>, found 'because <answer>b</a'."
+    assert layout.offset == 17
+
+    layout = match_layout("<think>a</think><answer>b</answer> done")
+    assert (layout.error, layout.offset) == ("unexpected text after </answer>, found 'done'.", 35)
+
+def test_three_section_layout():
+    layout = match_layout("<think>a</think><answer>b</answer><verifier_answer>4</verifier_answer>",
+                          ("think", "answer", "verifier_answer"))
+    assert [s.content for s in layout.sections] == ["a", "b", "4"]
+
+def test_find_section_is_case_insensitive():
+    text = "<think><answer>never closed</think> <Answer> 7 </ANSWER> <answer>8</answer>"
+    assert find_section(text, "answer").content == "never closed</think> <Answer> 7 "
+    assert find_section("<answer>7", "answer") is None
+    assert describe_missing("ab <answer>7", "answer") == "Format error at offset 3: <answer> is never closed."
+    assert describe_missing("ab", "answer") == "Format error: no <answer> tag found."
+
+def test_malformed_long_completion_is_fast():
+    # Many boundaries and no final </answer>: quadratic for the lazy regex
+    text = "<think>a" + "</think><answer>b" * 20000
+    start = time.perf_counter()
+    assert not match_layout(text).ok
+    assert find_section("<verifier_answer>" * 20000, "verifier_answer") is None
+    assert time.perf_counter() - start < 1.0
@@ -57,3 +57,13 @@ def test_whitespace_tolerance(verifier):
     result = verifier.verify_with_feedback(model_output, gold_solution="42   ")
     assert result["score"] == 1.0
     assert any("matches exactly" in msg for msg in result["feedback"])
+
+def test_normalized_number_matches(verifier):
+    result = verifier.verify_with_feedback("<verifier_answer>1.4E+3</verifier_answer>", gold_solution="1,400")
+    assert result["score"] == 1.0
+    assert any("matches after normalization" in msg for msg in result["feedback"])
+    assert verifier.verify("<verifier_answer>1.5E+3</verifier_answer>", gold_solution="1,400") == 0.0
+
+def test_overlong_number_is_wrong(verifier):
+    result = verifier.verify_with_feedback("<verifier_answer>" + "9" * 5000 + "</verifier_answer>", gold_solution="4")
+    assert result["score"] == 0.0
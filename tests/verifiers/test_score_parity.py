@@ -0,0 +1,204 @@
+# tests/verifiers/test_score_parity.py
+"""
+Every verifier's score-only verify() must return exactly the score that
+verify_with_feedback() reports. These tests run both paths over the
+sample files, the coldstart completions and a set of edge cases.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from verifiers.poetry.haiku_verifier import HaikuVerifier
+from verifiers.poetry.tanka_verifier import TankaVerifier
+from verifiers.poetry.limerick_verifier import LimerickVerifier
+from verifiers.poetry.rhyme_verifier import RhymeVerifier
+from verifiers.poetry.villanelle_verifier import VillanelleVerifier
+from verifiers.poetry.sonnet_verifier import SonnetVerifier
+from verifiers.poetry.ballad_verifier import BalladVerifier
+from verifiers.poetry.rhyme_scheme_verifier import RhymeSchemeVerifier
+from verifiers.poetry.meter_verifier import MeterVerifier
+from verifiers.language.morse_code.morse_code_verifier import MorseCodeVerifier, text_to_morse
+from verifiers.language.ciphers.caesar_verifier import CaesarVerifier
+from verifiers.language.ciphers.atbash_verifier import AtbashVerifier
+from verifiers.language.ciphers.base64_verifier import Base64Verifier
+from verifiers.language.nato_phonetic.nato_phonetic_verifier import NatoPhoneticVerifier
+from verifiers.reasoning.reasoning_format_verifier import ReasoningFormatVerifier
+from verifiers.reasoning.reasoning_format_with_verifier_answer_verifier import (
+    ReasoningFormatWithVerifierAnswerVerifier
+)
+from verifiers.reasoning.verifier_answer_verifier import VerifierAnswerVerifier
+from verifiers.math.boxed_answer_verifier import BoxedAnswerVerifier
+from verifiers.math.arithmetic_verifier import ArithmeticVerifier
+from verifiers.math.step_arithmetic_verifier import StepArithmeticVerifier
+
+ROOT = Path(__file__).resolve().parents[2]
+
+def _sample_texts(subdir: str) -> list:
+    return [p.read_text(encoding="utf-8") for p in sorted((ROOT / "samples" / subdir).rglob("*.txt"))]
+
+def _completions(limit: int = 120) -> list:
+    texts = []
+    with open(ROOT / "coldstart" / "merged_completions.jsonl", encoding="utf-8") as f:
+        for line in f:
+            texts.append(json.loads(line)["completion"])
+            if len(texts) >= limit:
+                break
+    return texts
+
+VILLANELLE = "\n".join([
+    "I have a cat", "We love our dog", "Another cat", "random cat", "random dog",
+    "I have a cat", "random cat", "random dog", "Another cat", "random cat",
+    "random dog", "I have a cat", "random cat", "random dog", "Another cat",
+    "random cat", "random dog", "I have a cat", "Another cat",
+])
+
+def _poems() -> list:
+    poems = _sample_texts("poetry") + [VILLANELLE, "", "   ", "One\nTwo\nThree", "a\n\n\nb"]
+    variants = []
+    for poem in poems:
+        lines = [l for l in poem.strip().split("\n") if l.strip()]
+        variants.append(poem)
+        # Prefixes, a reversed copy and a doubled copy exercise the line-count branches
+        variants.extend("\n".join(lines[:n]) for n in range(1, len(lines)))
+        variants.append("\n".join(reversed(lines)))
+        variants.append("\n".join(lines + lines))
+    return variants
+
+POEMS = _poems()
+
+def _assert_parity(verifier, texts, **kwargs):
+    for text in texts:
+        expected = verifier.verify_with_feedback(text, **kwargs)["score"]
+        assert verifier.verify(text, **kwargs) == expected, f"Score mismatch for {text!r} with {kwargs}"
+
+@pytest.mark.parametrize("kwargs", [{}, {"tolerance": 0}, {"tolerance": 2}])
+def test_haiku_parity(kwargs):
+    _assert_parity(HaikuVerifier(), POEMS, **kwargs)
+
+@pytest.mark.parametrize("kwargs", [{}, {"tolerance": 0}, {"tolerance": 3}])
+def test_tanka_parity(kwargs):
+    _assert_parity(TankaVerifier(), POEMS, **kwargs)
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"line_count_required": 3},
+    {"long_line_range": [5, 9], "short_line_range": [2, 6]},
+])
+def test_limerick_parity(kwargs):
+    _assert_parity(LimerickVerifier(), POEMS, **kwargs)
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"partial_threshold": 0.0, "fallback_credit": 0.25},
+    {"partial_threshold": 1.0},
+])
+def test_rhyme_parity(kwargs):
+    texts = POEMS + ["I love my cat\nthe bat", "I love my cat\nthe hat?", "I love my cat\n!!!"]
+    _assert_parity(RhymeVerifier(), texts, **kwargs)
+
+@pytest.mark.parametrize("kwargs", [{}, {"repetition_weight": 0.5, "rhyme_weight": 0.3, "line_count_weight": 0.2}])
+def test_villanelle_parity(kwargs):
+    _assert_parity(VillanelleVerifier(), POEMS, **kwargs)
+
+@pytest.mark.parametrize("verifier_cls, kwargs", [
+    (SonnetVerifier, {}),
+    (SonnetVerifier, {"tolerance": 0, "syllable_weight": 0.5}),
+    (BalladVerifier, {"stanzas": 1}),
+    (BalladVerifier, {}),
+    (RhymeSchemeVerifier, {"scheme": "AABBA"}),
+    (RhymeSchemeVerifier, {"scheme": "ABA ABA ABA ABA ABA ABAA"}),
+])
+def test_rhyme_scheme_parity(verifier_cls, kwargs):
+    _assert_parity(verifier_cls(), POEMS, **kwargs)
+
+@pytest.mark.parametrize("kwargs", [{}, {"tolerance": 0}, {"meter": "anapestic", "feet": 3, "tolerance": 1}])
+def test_meter_parity(kwargs):
+    _assert_parity(MeterVerifier(), POEMS, **kwargs)
+
+@pytest.mark.parametrize("original_text", ["HELLO", "SOS", "HELLO, WORLD?", "a b", ""])
+def test_morse_encode_parity(original_text):
+    reference = text_to_morse(original_text)
+    candidates = [reference, reference + " ...", reference[:-1], "", ".... . .-... .-.. ---", "- -- ---"]
+    _assert_parity(MorseCodeVerifier(), candidates, original_text=original_text, verify_mode="encode")
+
+@pytest.mark.parametrize("original_text", [".... . .-.. .-.. ---", "... --- ...", "", "...... / -"])
+def test_morse_decode_parity(original_text):
+    candidates = ["HELLO", "hellu", "SOST", "", "S S", "?"]
+    _assert_parity(MorseCodeVerifier(), candidates, original_text=original_text, verify_mode="decode")
+    _assert_parity(MorseCodeVerifier(), candidates, original_text=original_text, verify_mode="bogus")
+
+@pytest.mark.parametrize("verifier_cls, kwargs", [
+    (CaesarVerifier, {}),
+    (CaesarVerifier, {"shift": 13}),
+    (AtbashVerifier, {}),
+    (Base64Verifier, {}),
+    (NatoPhoneticVerifier, {}),
+])
+@pytest.mark.parametrize("original_text", ["Hello, World!", "SOS 42", ""])
+def test_transform_parity(verifier_cls, kwargs, original_text):
+    verifier = verifier_cls()
+    encoded = verifier.encode(original_text, **kwargs)
+    candidates = [encoded, encoded[:-2], encoded + " x", encoded.lower(), "", original_text]
+    _assert_parity(verifier, candidates, original_text=original_text, verify_mode="encode", **kwargs)
+    _assert_parity(verifier, candidates, original_text=encoded, verify_mode="decode", **kwargs)
+
+REASONING_TEXTS = _completions() + _sample_texts("reasoning") + [
+    "<think>a</think><answer>b</answer>",
+    "<think> </think><answer>b</answer>",
+    "<think>a</think><answer>b</answer><verifier_answer>4</verifier_answer>",
+    "<think>a</think><answer>b</answer><verifier_answer> </verifier_answer>",
+    "<answer>b</answer><think>a</think>",
+    "",
+]
+
+def test_reasoning_format_parity():
+    _assert_parity(ReasoningFormatVerifier(), REASONING_TEXTS)
+
+def test_reasoning_format_with_verifier_answer_parity():
+    _assert_parity(ReasoningFormatWithVerifierAnswerVerifier(), REASONING_TEXTS)
+
+@pytest.mark.parametrize("kwargs", [{}, {"gold_solution": "4"}, {"gold_solution": " 855 "}, {"gold_solution": "221760"}])
+def test_verifier_answer_parity(kwargs):
+    _assert_parity(VerifierAnswerVerifier(), REASONING_TEXTS, **kwargs)
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"gold_solution": r"\(\boxed{4}\)"},
+    {"gold_solution": r"\(\boxed{ 42 }\)"},
+    {"gold_solution": "no box here"},
+])
+def test_boxed_answer_parity(kwargs):
+    texts = _sample_texts("math") + [r"\(\boxed{42}\)", r"\(\boxed{ 4}\)", "no box", r"\boxed{4}"]
+    _assert_parity(BoxedAnswerVerifier(), texts, **kwargs)
+
+def test_arithmetic_parity():
+    verifier = ArithmeticVerifier()
+    with open(ROOT / "coldstart" / "merged_completions.jsonl", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f][:200]
+    for row in rows:
+        _assert_parity(verifier, [row["completion"]], prompt=row["prompt"])
+    _assert_parity(verifier, REASONING_TEXTS, expression="1 / 0")
+
+def test_step_arithmetic_parity():
+    with open(ROOT / "coldstart" / "merged_completions.jsonl", encoding="utf-8") as f:
+        texts = [json.loads(line)["completion"] for line in f][:200]
+    _assert_parity(StepArithmeticVerifier(), texts + REASONING_TEXTS)
+
+@pytest.mark.parametrize("verifier_cls, kwargs", [
+    (HaikuVerifier, {}),
+    (HaikuVerifier, {"tolerance": 0}),
+    (TankaVerifier, {}),
+    (TankaVerifier, {"tolerance": 2}),
+    (LimerickVerifier, {}),
+    (LimerickVerifier, {"line_count_required": 3}),
+    (LimerickVerifier, {"long_line_range": [5, 9], "short_line_range": [2, 6]}),
+    (MeterVerifier, {}),
+    (MeterVerifier, {"meter": "01x1", "tolerance": 1}),
+])
+def test_verify_batch_parity(verifier_cls, kwargs):
+    verifier = verifier_cls()
+    texts = POEMS + _completions(60)
+    assert verifier.verify_batch(texts, **kwargs) == [verifier.verify(t, **kwargs) for t in texts]
+    assert verifier.verify_batch([], **kwargs) == []
+    assert verifier.verify_batch(["", "  \n "], **kwargs) == [0.0, 0.0]
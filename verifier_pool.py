@@ -0,0 +1,117 @@
+# verifier_pool.py
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from registry_loader import get_registry, run_verifier_jobs
+
+logger = logging.getLogger("verifier_pool")
+
+# Registry path used by the worker processes (set by _init_worker)
+_worker_registry_path = None
+
+def _init_worker(registry_path: str):
+    """
+    Runs once in every worker process (including recycled ones).
+    Imports and instantiates every verifier that is configured to run in
+    the pool, so the first real request a worker sees does not pay for it.
+    """
+    global _worker_registry_path
+    _worker_registry_path = registry_path
+
+    registry = get_registry(registry_path)
+    registry.warm_up([
+        name for name, info in registry.data.items()
+        if info.get("execution") == "process"
+    ])
+
+def _worker_ping() -> int:
+    return os.getpid()
+
+def _worker_verify_many(verifier_name: str, jobs: list) -> list:
+    verifier_obj = get_registry(_worker_registry_path).get_verifier(verifier_name)
+    return run_verifier_jobs(verifier_obj, jobs)
+
+
+class VerifierPool:
+    """
+    A ProcessPoolExecutor for CPU-bound verifiers.
+
+    - max_workers defaults to the number of cores.
+    - Workers are started and warmed up by start() rather than on the first request.
+    - Each worker is replaced after max_tasks_per_child tasks, which keeps
+      long-running servers from accumulating memory in the workers.
+    """
+
+    def __init__(self, registry_path: str, max_workers: int = None, max_tasks_per_child: int = 1000):
+        self.registry_path = registry_path
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_tasks_per_child = max_tasks_per_child
+        self._executor = None
+
+    @classmethod
+    def from_env(cls, registry_path: str):
+        """
+        Builds a pool from the environment, or returns None when the pool is disabled:
+          VERIFIER_PROCESS_POOL              "1" to enable (default "0")
+          VERIFIER_POOL_WORKERS              number of worker processes (default: cores)
+          VERIFIER_POOL_MAX_TASKS_PER_CHILD  tasks before a worker is recycled (default 1000)
+        """
+        if os.environ.get("VERIFIER_PROCESS_POOL", "0") != "1":
+            return None
+        max_workers = int(os.environ.get("VERIFIER_POOL_WORKERS", "0")) or None
+        max_tasks = int(os.environ.get("VERIFIER_POOL_MAX_TASKS_PER_CHILD", "1000"))
+        return cls(registry_path, max_workers=max_workers, max_tasks_per_child=max_tasks)
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # max_tasks_per_child is not supported with the 'fork' start method
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.registry_path,),
+            max_tasks_per_child=self.max_tasks_per_child,
+        )
+
+    def start(self):
+        """Creates the executor and pre-warms every worker."""
+        self._executor = self._create_executor()
+        # One ping per worker; none are idle yet, so each spawns a new process
+        pings = [self._executor.submit(_worker_ping) for _ in range(self.max_workers)]
+        pids = {p.result() for p in pings}
+        logger.info(f"Verifier pool ready: {len(pids)} worker(s) (max_workers={self.max_workers}).")
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def run_many(self, verifier_name: str, jobs: list) -> list:
+        """
+        Runs (text, verifier_kwargs, feedback) jobs in the pool, split into
+        one chunk per worker, and returns results in job order.
+        """
+        if not jobs:
+            return []
+        loop = asyncio.get_running_loop()
+        chunk_size = -(-len(jobs) // self.max_workers)
+        chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+        try:
+            chunk_results = await asyncio.gather(*[
+                loop.run_in_executor(self._executor, _worker_verify_many, verifier_name, chunk)
+                for chunk in chunks
+            ])
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); replace the pool so later requests still work
+            logger.error("Verifier pool is broken; restarting it.")
+            self.shutdown()
+            self._executor = self._create_executor()
+            raise
+        return [result for chunk in chunk_results for result in chunk]
+
+    async def run(self, verifier_name: str, text: str, verifier_kwargs: dict, feedback: bool = False) -> dict:
+        results = await self.run_many(verifier_name, [(text, verifier_kwargs, feedback)])
+        return results[0]
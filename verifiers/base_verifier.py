@@ -1,12 +1,18 @@
 # base_verifier.py
 import abc
+import asyncio
 
 class BaseVerifier(abc.ABC):
     """
     Defines a standard interface for verifiers:
     - A 'verify' method that returns a float score in [0.0, 1.0].
     - A 'to_json' method describing parameters and usage for programmatic consumption.
+
+    VERSION identifies the scoring logic; bump it in a subclass whenever its
+    scores change, so cached results from the old logic are not reused.
     """
+
+    VERSION = "1"
     
     def __init__(self, name: str, description: str, parameters: dict = None):
         """
@@ -40,6 +46,38 @@ class BaseVerifier(abc.ABC):
         """
         pass
     
+    def verify_batch(self, texts: list, **kwargs) -> list:
+        """
+        Scores many texts with the same arguments; returns one float per
+        text, in order. The default calls verify() on each text; verifiers
+        that can share work across texts override it.
+        """
+        return [self.verify(text, **kwargs) for text in texts]
+
+    async def averify(self, text: str, **kwargs) -> float:
+        """
+        Async verify(). The default runs verify() in a worker thread;
+        verifiers that wait on I/O (e.g. an LLM judge) override it to
+        await without holding a thread.
+        """
+        return await asyncio.to_thread(self.verify, text, **kwargs)
+
+    async def averify_with_feedback(self, text: str, **kwargs) -> dict:
+        """Async verify_with_feedback(); the default runs it in a worker thread."""
+        return await asyncio.to_thread(self.verify_with_feedback, text, **kwargs)
+
+    async def averify_batch(self, texts: list, **kwargs) -> list:
+        """Async verify_batch(); the default runs it in a worker thread."""
+        return await asyncio.to_thread(self.verify_batch, texts, **kwargs)
+
+    def warm_up(self):
+        """
+        Loads anything the verifier would otherwise load lazily on its
+        first call (dictionaries, lexicons, ...). Called once at server
+        startup; the default does nothing.
+        """
+        pass
+
     def to_json(self):
         """
         Returns a dictionary that can be JSON-serialized, describing
@@ -0,0 +1,152 @@
+# helpers/alignment.py
+"""
+Edit distance and alignment between two sequences (strings, or lists of
+tokens such as Morse letter codes), shared by the verifiers that give
+partial credit for near misses.
+
+edit_distance() uses the bit-parallel algorithm of Myers (1999), in
+Hyyrö's formulation for Levenshtein distance: each column of the DP
+table is held as bit vectors in Python ints, so a whole column is
+updated with a handful of integer operations. Cost is O(len(a) *
+len(b) / 64) machine-word operations, near-linear for the lengths the
+verifiers see, and 'bound' stops early once the distance must exceed it.
+
+align() recovers the edit operations for feedback with a DP restricted
+to the diagonal band the distance allows (Ukkonen), so near matches cost
+O((len(a) + len(b)) * distance).
+"""
+
+# Above this many DP cells align() gives up and returns None
+MAX_ALIGN_CELLS = 4_000_000
+
+# Operations in an alignment
+MATCH, SUBSTITUTE, DELETE, INSERT = "=", "~", "-", "+"
+
+
+def edit_distance(a, b, bound: int = None) -> int:
+    """
+    Levenshtein distance between sequences 'a' and 'b' (unit-cost
+    insertions, deletions and substitutions of hashable items).
+
+    If 'bound' is given and the distance exceeds it, bound + 1 is
+    returned as soon as that is certain.
+    """
+    # The shorter sequence is the bit-vector "pattern"
+    if len(a) > len(b):
+        a, b = b, a
+    m, n = len(a), len(b)
+    if bound is not None and n - m > bound:
+        return bound + 1
+    if m == 0:
+        return n
+
+    # 1) Bit mask of the pattern positions holding each item
+    peq = {}
+    for i, item in enumerate(a):
+        peq[item] = peq.get(item, 0) | (1 << i)
+
+    # 2) Scan the text, one column per item; pv/mv are the +1/-1 vertical deltas
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv = mask, 0
+    score = m
+    for j, item in enumerate(b, start=1):
+        eq = peq.get(item, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # Row 0 of the table is 0, 1, 2, ...: the top horizontal delta is always +1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+        # Each remaining column can lower the score by at most 1
+        if bound is not None and score - (n - j) > bound:
+            return bound + 1
+    return score if bound is None else min(score, bound + 1)
+
+def similarity(a, b) -> float:
+    """1 - edit_distance / longer length: 1.0 for equal sequences, 0.0 for nothing in common."""
+    longest = max(len(a), len(b))
+    if not longest:
+        return 1.0
+    return 1.0 - edit_distance(a, b) / longest
+
+def align(a, b, max_cells: int = MAX_ALIGN_CELLS, distance: int = None):
+    """
+    A minimal alignment of 'a' (expected) to 'b' (actual), as a list of
+    (op, expected_item, actual_item) with op one of:
+      "=" match, "~" substitution, "-" item of 'a' missing from 'b'
+      (actual_item None), "+" extra item in 'b' (expected_item None).
+
+    Returns None if the band the distance requires would exceed
+    'max_cells' DP cells (sequences that are both long and very different).
+    Pass 'distance' if edit_distance(a, b) is already known.
+    """
+    n, m = len(a), len(b)
+    k = edit_distance(a, b) if distance is None else distance
+    # An optimal path never leaves the diagonals |i - j| <= k
+    width = 2 * k + 1
+    if (n + 1) * min(width, m + 1) > max_cells:
+        return None
+
+    # 1) Banded DP: rows[i][j - i + k] = D[i][j] for |i - j| <= k
+    infinity = n + m + 1
+    rows = []
+    for i in range(n + 1):
+        row = [infinity] * width
+        for j in range(max(0, i - k), min(m, i + k) + 1):
+            if i == 0:
+                best = j
+            elif j == 0:
+                best = i
+            else:
+                previous = rows[i - 1]
+                best = previous[j - i + k] + (a[i - 1] != b[j - 1])  # diagonal
+                if j - i + k + 1 < width:
+                    best = min(best, previous[j - i + k + 1] + 1)    # from above
+                if j - i + k > 0:
+                    best = min(best, row[j - i + k - 1] + 1)         # from the left
+            row[j - i + k] = best
+        rows.append(row)
+
+    # 2) Trace back from the end, preferring matches and substitutions
+    ops = []
+    i, j = n, m
+    while i or j:
+        here = rows[i][j - i + k]
+        if i and j and rows[i - 1][j - i + k] + (a[i - 1] != b[j - 1]) == here:
+            ops.append((MATCH if a[i - 1] == b[j - 1] else SUBSTITUTE, a[i - 1], b[j - 1]))
+            i, j = i - 1, j - 1
+        elif i and j - i + k + 1 < width and rows[i - 1][j - i + k + 1] + 1 == here:
+            ops.append((DELETE, a[i - 1], None))
+            i -= 1
+        else:
+            ops.append((INSERT, None, b[j - 1]))
+            j -= 1
+    ops.reverse()
+    return ops
+
+def format_diff(ops: list, separator: str = " ") -> str:
+    """
+    Renders an alignment, e.g. for tokens:
+        ".... . [.-..→.-...] .-.. [-.-] [+---]"
+    Matches are shown as is, substitutions as [expected→actual], missing
+    items as [-item] and extra items as [+item].
+    """
+    parts = []
+    for op, expected, actual in ops:
+        if op == MATCH:
+            parts.append(f"{expected}")
+        elif op == SUBSTITUTE:
+            parts.append(f"[{expected}→{actual}]")
+        elif op == DELETE:
+            parts.append(f"[-{expected}]")
+        else:
+            parts.append(f"[+{actual}]")
+    return separator.join(parts)
@@ -0,0 +1,31 @@
+# language/ciphers/atbash_verifier.py
+import string
+
+from verifiers.language.transform_verifier import TransformVerifier
+
+# A <-> Z, B <-> Y, ... in both cases; other characters pass through
+_ATBASH_TABLE = str.maketrans(
+    string.ascii_uppercase + string.ascii_lowercase,
+    string.ascii_uppercase[::-1] + string.ascii_lowercase[::-1],
+)
+
+def atbash(text: str) -> str:
+    """
+    Mirrors each ASCII letter in the alphabet, keeping its case:
+    "Hello" -> "Svool". Atbash is its own inverse.
+    """
+    return text.translate(_ATBASH_TABLE)
+
+
+class AtbashVerifier(TransformVerifier):
+    """Atbash cipher in either direction, compared character by character, ignoring case."""
+    ENCODED_NAME = "ciphertext"
+
+    encode = staticmethod(atbash)
+    decode = staticmethod(atbash)
+
+    def __init__(self):
+        super().__init__(
+            name="atbash_verifier",
+            description="Verifies an Atbash cipher (A<->Z, B<->Y, ...) in both encoding and decoding directions.",
+        )
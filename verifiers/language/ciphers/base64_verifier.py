@@ -0,0 +1,45 @@
+# language/ciphers/base64_verifier.py
+import base64
+import binascii
+
+from verifiers.language.transform_verifier import TransformVerifier
+
+def text_to_base64(text: str) -> str:
+    """Standard base64 of the UTF-8 bytes of 'text'."""
+    return base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+def base64_to_text(encoded: str) -> str:
+    """
+    Decodes base64 (whitespace and line breaks ignored) to UTF-8 text;
+    bytes that are not valid UTF-8 become U+FFFD.
+    Raises ValueError if 'encoded' is not valid base64.
+    """
+    try:
+        data = base64.b64decode(''.join(encoded.split()), validate=True)
+    except binascii.Error as e:
+        raise ValueError(f"Invalid base64: {e}") from None
+    return data.decode("utf-8", errors="replace")
+
+
+class Base64Verifier(TransformVerifier):
+    """
+    Base64 in either direction. The base64 side is compared character by
+    character with case significant and whitespace (line wrapping)
+    ignored; the plain side ignores case.
+    """
+    ENCODED_NAME = "base64"
+    ENCODED_CASE_SENSITIVE = True
+
+    encode = staticmethod(text_to_base64)
+    decode = staticmethod(base64_to_text)
+
+    def __init__(self):
+        super().__init__(
+            name="base64_verifier",
+            description="Verifies base64 encoding of UTF-8 text in both encoding and decoding directions.",
+        )
+
+    def units(self, text: str, encoded: bool):
+        if encoded:
+            return ''.join(text.split())
+        return super().units(text, encoded)
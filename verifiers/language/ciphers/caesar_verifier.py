@@ -0,0 +1,51 @@
+# language/ciphers/caesar_verifier.py
+import string
+
+from verifiers.language.transform_verifier import TransformVerifier
+
+# One str.translate table per shift, built once; other characters pass through
+_SHIFT_TABLES = [
+    str.maketrans(
+        string.ascii_uppercase + string.ascii_lowercase,
+        string.ascii_uppercase[shift:] + string.ascii_uppercase[:shift]
+        + string.ascii_lowercase[shift:] + string.ascii_lowercase[:shift],
+    )
+    for shift in range(26)
+]
+
+def caesar_shift(text: str, shift: int = 3) -> str:
+    """
+    Shifts each ASCII letter 'shift' places along the alphabet, keeping
+    its case: ("Hello", 3) -> "Khoor". Negative shifts go back; ROT13 is
+    shift 13.
+    """
+    return text.translate(_SHIFT_TABLES[int(shift) % 26])
+
+def caesar_unshift(text: str, shift: int = 3) -> str:
+    """Inverse of caesar_shift()."""
+    return caesar_shift(text, -int(shift))
+
+
+class CaesarVerifier(TransformVerifier):
+    """
+    Caesar cipher / ROT-N with a given shift, in either direction. Compared
+    character by character, ignoring case.
+    """
+    ENCODED_NAME = "ciphertext"
+    TRANSFORM_PARAMETERS = {"shift": 3}
+
+    encode = staticmethod(caesar_shift)
+    decode = staticmethod(caesar_unshift)
+
+    def __init__(self):
+        super().__init__(
+            name="caesar_verifier",
+            description="Verifies a Caesar cipher (ROT-N) in both encoding and decoding directions.",
+            parameters={
+                "shift": {
+                    "type": "integer",
+                    "default": 3,
+                    "description": "Places each letter is shifted along the alphabet (13 => ROT13)."
+                }
+            }
+        )
@@ -0,0 +1,58 @@
+# language/nato_phonetic/nato_phonetic_verifier.py
+from verifiers.language.transform_verifier import TokenTable, TransformVerifier, decode_tokens, encode_tokens
+
+# ICAO spelling alphabet, upper-cased as the verifier compares code words case-insensitively
+NATO_ALPHABET = {
+    'A': 'ALFA',    'B': 'BRAVO',   'C': 'CHARLIE', 'D': 'DELTA',
+    'E': 'ECHO',    'F': 'FOXTROT', 'G': 'GOLF',    'H': 'HOTEL',
+    'I': 'INDIA',   'J': 'JULIETT', 'K': 'KILO',    'L': 'LIMA',
+    'M': 'MIKE',    'N': 'NOVEMBER', 'O': 'OSCAR',  'P': 'PAPA',
+    'Q': 'QUEBEC',  'R': 'ROMEO',   'S': 'SIERRA',  'T': 'TANGO',
+    'U': 'UNIFORM', 'V': 'VICTOR',  'W': 'WHISKEY', 'X': 'XRAY',
+    'Y': 'YANKEE',  'Z': 'ZULU',
+    '0': 'ZERO',  '1': 'ONE',  '2': 'TWO',   '3': 'THREE', '4': 'FOUR',
+    '5': 'FIVE',  '6': 'SIX',  '7': 'SEVEN', '8': 'EIGHT', '9': 'NINE',
+}
+
+# Common alternative spellings, read as the canonical code word
+ALIASES = {'ALPHA': 'ALFA', 'JULIET': 'JULIETT', 'X-RAY': 'XRAY', 'NINER': 'NINE'}
+
+_ENCODE_TABLE = TokenTable(NATO_ALPHABET)
+_DECODE_TABLE = {word: char for char, word in NATO_ALPHABET.items()}
+_DECODE_TABLE.update({alias: _DECODE_TABLE[word] for alias, word in ALIASES.items()})
+_DECODE_TABLE['/'] = ' '
+
+def text_to_nato(text: str) -> str:
+    """
+    Spells 'text' in the NATO phonetic alphabet: "Hi 5" -> "HOTEL INDIA / FIVE".
+    Words are separated by '/', characters without a code word become '?'.
+    """
+    return encode_tokens(text, _ENCODE_TABLE)
+
+def nato_to_text(nato: str) -> str:
+    """Reads NATO code words (any case, common aliases accepted) back as text; '/' is a space."""
+    return decode_tokens(nato.upper(), _DECODE_TABLE)
+
+
+class NatoPhoneticVerifier(TransformVerifier):
+    """
+    NATO phonetic spelling in either direction; the spelled side is
+    compared code word by code word, ignoring case, with aliases such as
+    "Alpha" and "X-ray" read as their ICAO spelling.
+    """
+    ENCODED_NAME = "NATO spelling"
+    ENCODED_TOKENS = True
+
+    encode = staticmethod(text_to_nato)
+    decode = staticmethod(nato_to_text)
+
+    def __init__(self):
+        super().__init__(
+            name="nato_phonetic_verifier",
+            description="Verifies NATO phonetic alphabet spelling in both encoding and decoding directions.",
+        )
+
+    def units(self, text: str, encoded: bool):
+        if encoded:
+            return [ALIASES.get(token, token) for token in text.upper().split()]
+        return super().units(text, encoded)
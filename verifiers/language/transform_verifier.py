@@ -0,0 +1,262 @@
+# language/transform_verifier.py
+"""
+Shared engine for verifiers that check a reversible text transform
+(Morse code, Caesar/ROT-N, Atbash, base64, NATO phonetic alphabet) in
+either direction:
+  - verify_mode="encode": original_text is plain text, the candidate
+    should be its encoding
+  - verify_mode="decode": original_text is encoded, the candidate should
+    be the plain text
+
+Each transform builds its tables once at import (str.maketrans tables
+where the transform maps characters), and the reference transform of
+original_text is cached, since a batch of candidates shares one
+original_text.
+"""
+import abc
+from functools import lru_cache
+
+from verifiers.base_verifier import BaseVerifier
+from verifiers.helpers.alignment import DELETE, INSERT, SUBSTITUTE, align, edit_distance, format_diff
+
+# Distinct (transform, mode, original_text, parameters) references kept per process
+REFERENCE_CACHE_SIZE = 1024
+
+VERIFY_MODES = ("encode", "decode")
+
+
+class TokenTable(dict):
+    """
+    A str.translate() table that maps each character to its code word
+    followed by a space; whitespace becomes "/ " and characters without a
+    code become "? ". Characters are looked up once, then remembered.
+    """
+
+    def __init__(self, codes: dict):
+        super().__init__({ord(char): code + " " for char, code in codes.items()})
+
+    def __missing__(self, key: int) -> str:
+        value = "/ " if chr(key).isspace() else "? "
+        self[key] = value
+        return value
+
+
+def encode_tokens(text: str, table: TokenTable) -> str:
+    """Upper-cases 'text' and translates it to space-separated code words."""
+    return text.upper().translate(table)[:-1]
+
+def decode_tokens(text: str, inverse: dict) -> str:
+    """Maps each whitespace-separated code word back to its character ("?" if unknown)."""
+    return ''.join([inverse.get(token, '?') for token in text.split()])
+
+@lru_cache(maxsize=REFERENCE_CACHE_SIZE)
+def _reference(verifier_cls, verify_mode: str, original_text: str, params: tuple) -> str:
+    transform = verifier_cls.encode if verify_mode == "encode" else verifier_cls.decode
+    return transform(original_text, **dict(params))
+
+
+class TransformVerifier(BaseVerifier):
+    """
+    Compares a candidate with the reference transform of original_text.
+
+    The encoded side is compared token by token (code words split on
+    whitespace) when ENCODED_TOKENS is set, otherwise character by
+    character; the plain side is always compared character by character,
+    ignoring case. Surrounding whitespace never counts.
+
+    Partial credit: score = 1 - edit distance / longer length, so a dropped
+    or extra item costs one edit instead of shifting everything after it.
+
+    Subclasses implement encode() and decode() as static methods (decode()
+    may raise ValueError for text that is not a valid encoding; it scores
+    0.0) and list the transform's own arguments (e.g. a Caesar shift) with their
+    defaults in TRANSFORM_PARAMETERS.
+    """
+    ENCODED_NAME = "encoding"       # how the feedback names the encoded side
+    ENCODED_TOKENS = False          # compare the encoded side by whitespace-separated tokens
+    ENCODED_CASE_SENSITIVE = False  # whether case matters on the encoded side
+    TRANSFORM_PARAMETERS = {}
+    # Per-item mismatch messages before the rest are summarized
+    MAX_MISMATCH_MESSAGES = 20
+
+    def __init__(self, name: str, description: str, parameters: dict = None):
+        """
+        Parameters:
+          - original_text: the reference text (plain text if verify_mode='encode',
+                           encoded if verify_mode='decode').
+          - verify_mode: "encode" => we expect the candidate text to be encoded,
+                         "decode" => we expect the candidate text to be plain text.
+        """
+        super().__init__(
+            name=name,
+            description=description,
+            parameters={
+                "original_text": {
+                    "type": "string",
+                    "description": (f"The reference text: plain text (encode mode) or "
+                                    f"{self.ENCODED_NAME} (decode mode).")
+                },
+                "verify_mode": {
+                    "type": "string",
+                    "default": "encode",
+                    "description": (f"Either 'encode' (candidate is {self.ENCODED_NAME}) "
+                                    "or 'decode' (candidate is plain text).")
+                },
+                **(parameters or {})
+            }
+        )
+
+    @staticmethod
+    @abc.abstractmethod
+    def encode(text: str, **params) -> str:
+        """
+        Plain text => its encoding, with the transform's parameters.
+        Child classes must implement this.
+        """
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def decode(text: str, **params) -> str:
+        """
+        Encoded text => plain text, with the transform's parameters.
+        Child classes must implement this.
+        """
+        pass
+
+    def reference(self, original_text: str, verify_mode: str = "encode", **kwargs) -> str:
+        """
+        The expected candidate: encode(original_text) or decode(original_text),
+        cached per (verifier class, mode, text, transform parameters).
+        """
+        params = tuple((name, kwargs.get(name, default)) for name, default in self.TRANSFORM_PARAMETERS.items())
+        return _reference(type(self), verify_mode, original_text, params)
+
+    def units(self, text: str, encoded: bool):
+        """
+        The items compared: tokens or characters of the encoded side,
+        characters of the plain side. Surrounding whitespace is ignored.
+        """
+        if not encoded:
+            return text.strip().upper()
+        if not self.ENCODED_CASE_SENSITIVE:
+            text = text.upper()
+        return text.split() if self.ENCODED_TOKENS else text.strip()
+
+    def verify(self, text: str,
+               original_text: str = "",
+               verify_mode: str = "encode",
+               **kwargs) -> float:
+        """
+        Returns a score in [0,1] using the same alignment as
+        verify_with_feedback (1 - edit distance / longer length), without
+        recovering the edits or building the mismatch messages.
+        """
+        if verify_mode not in VERIFY_MODES:
+            return 0.0
+        encoded = verify_mode == "encode"
+        try:
+            reference = self.reference(original_text, verify_mode, **kwargs)
+        except ValueError:
+            return 0.0
+        ref_units = self.units(reference, encoded)
+        cand_units = self.units(text, encoded)
+
+        if not ref_units or not cand_units:
+            return 0.0
+        max_len = max(len(ref_units), len(cand_units))
+        return (max_len - edit_distance(ref_units, cand_units)) / max_len
+
+    def verify_with_feedback(self, text: str,
+                             original_text: str = "",
+                             verify_mode: str = "encode",
+                             **kwargs) -> dict:
+        """
+        Returns a dict:
+          {
+            "score": float in [0,1],
+            "feedback": list of strings
+          }
+
+        The feedback lists each edit (substituted, missing and extra items,
+        indexed by reference position), the reference and candidate, and
+        a diff of the alignment.
+        """
+        feedback = []
+
+        if verify_mode not in VERIFY_MODES:
+            feedback.append(f"Invalid verify_mode: '{verify_mode}'. Expected 'encode' or 'decode'.")
+            return {"score": 0.0, "feedback": feedback}
+
+        encoded = verify_mode == "encode"
+        try:
+            reference = self.reference(original_text, verify_mode, **kwargs)
+        except ValueError:
+            # decode() raises for text that is not a valid encoding (e.g. bad base64)
+            feedback.append(f"Original text is not valid {self.ENCODED_NAME} => score=0.0.")
+            return {"score": 0.0, "feedback": feedback}
+        ref_units = self.units(reference, encoded)
+        cand_units = self.units(text, encoded)
+        if encoded and self.ENCODED_TOKENS:
+            label, noun, separator = "Token", "token", " "
+        else:
+            label, noun, separator = "Character", "character", ""
+
+        if not ref_units or not cand_units:
+            if separator:
+                feedback.append("Either reference or candidate tokens are empty.")
+            else:
+                feedback.append("Either reference or candidate text is empty.")
+            return {"score": 0.0, "feedback": feedback}
+
+        max_len = max(len(ref_units), len(cand_units))
+        distance = edit_distance(ref_units, cand_units)
+        ops = align(ref_units, cand_units, distance=distance)
+        feedback.extend(self._edit_messages(ops, label, noun))
+
+        if len(ref_units) != len(cand_units):
+            feedback.append(
+                f"{label} count mismatch: reference has {len(ref_units)}, "
+                f"candidate has {len(cand_units)}."
+            )
+
+        score = (max_len - distance) / max_len
+        if encoded:
+            tag = "(Encode)"
+            feedback.append(f"{tag} Reference {self.ENCODED_NAME}: '{reference}'")
+            feedback.append(f"{tag} Candidate {self.ENCODED_NAME}: '{text}'")
+        else:
+            tag = "(Decode)"
+            feedback.append(f"{tag} Original {self.ENCODED_NAME}: '{original_text}'")
+            feedback.append(f"{tag} Decoded as: '{reference}'")
+            feedback.append(f"{tag} Candidate text: '{text}'")
+        if distance and ops is not None:
+            feedback.append(f"{tag} Diff: {format_diff(ops, separator=separator)}")
+        feedback.append(f"{tag} Edit distance = {distance} / {max_len}")
+        feedback.append(f"{tag} Score = {score:.2f}")
+
+        return {"score": score, "feedback": feedback}
+
+    def _edit_messages(self, ops, label: str, noun: str) -> list:
+        """
+        One message per edit in an alignment, indexed by reference
+        position (candidate position for extra items), capped at
+        MAX_MISMATCH_MESSAGES.
+        """
+        if ops is None:
+            return [f"{label} sequences are too long and too different to align item by item."]
+        messages = []
+        ref_index = cand_index = 0
+        for op, expected, actual in ops:
+            if op == SUBSTITUTE:
+                messages.append(f"{label} mismatch at index {ref_index}: expected '{expected}', got '{actual}'")
+            elif op == DELETE:
+                messages.append(f"Missing {noun} at index {ref_index}: expected '{expected}'")
+            elif op == INSERT:
+                messages.append(f"Extra {noun} at candidate index {cand_index}: got '{actual}'")
+            ref_index += op != INSERT
+            cand_index += op != DELETE
+        if len(messages) > self.MAX_MISMATCH_MESSAGES:
+            hidden = len(messages) - self.MAX_MISMATCH_MESSAGES
+            messages = messages[:self.MAX_MISMATCH_MESSAGES] + [f"... and {hidden} more {noun} edit(s)."]
+        return messages
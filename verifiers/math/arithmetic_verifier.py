@@ -0,0 +1,138 @@
+# verifiers/math/arithmetic_verifier.py
+from fractions import Fraction
+
+from verifiers.base_verifier import BaseVerifier
+from verifiers.math.helpers.arithmetic import evaluate, find_expression
+from verifiers.math.helpers.normalize import extract_number, format_number
+from verifiers.reasoning.helpers.tag_scanner import find_section, scan_tags
+
+class ArithmeticVerifier(BaseVerifier):
+    """
+    Checks the answer to an arithmetic prompt ("Evaluate: -8584 * 9952 -
+    6132 * 2741.") against the exact result of its expression, so no gold
+    answer is needed.
+
+    The expression is taken from the prompt (or passed as 'expression')
+    and evaluated exactly with a restricted AST evaluator; results are
+    cached per prompt and per expression.
+
+    Score: the fraction of the <answer> and <verifier_answer> sections
+    present whose number equals the result (after normalization, e.g.
+    "-1,022,357,844" or "1.4E+3"). Only a decimal answer to a non-integer
+    result may differ from it, by up to 'rel_tolerance'. 0.0 if neither
+    section is present.
+    """
+    ANSWER_TAGS = ("answer", "verifier_answer")
+
+    def __init__(self):
+        super().__init__(
+            name="arithmetic_verifier",
+            description=("Evaluates the arithmetic expression in the prompt exactly and checks "
+                         "the <answer>/<verifier_answer> values against it."),
+            parameters={
+                "prompt": {
+                    "type": "string",
+                    "description": "The prompt containing the expression, e.g. 'Evaluate: 12 * 7 - 3.'"
+                },
+                "expression": {
+                    "type": "string",
+                    "description": "The expression itself; overrides the one found in 'prompt'."
+                },
+                "rel_tolerance": {
+                    "type": "float",
+                    "default": 1e-6,
+                    "description": "Allowed relative error, for decimal answers to non-integer results (0 => exact)."
+                }
+            }
+        )
+
+    def _expected(self, prompt: str, expression: str):
+        """(expression text, exact value or None, error message or None)."""
+        if expression:
+            try:
+                return expression, evaluate(expression), None
+            except ValueError as e:
+                return expression, None, str(e)
+        found = find_expression(prompt or "")
+        if found is None:
+            return None, None, "no arithmetic expression found in the prompt"
+        return found.text, found.value, found.error
+
+    @staticmethod
+    def _matches(value: Fraction, expected: Fraction, rel_tolerance: float) -> bool:
+        if value == expected:
+            return True
+        # Integers are compared exactly; only rounded decimals get the tolerance
+        if expected.denominator == 1 or value.denominator == 1:
+            return False
+        return abs(value - expected) <= Fraction(rel_tolerance) * abs(expected)
+
+    def _answers(self, text: str) -> list:
+        """(tag, content) of each answer section present."""
+        tags = scan_tags(text)
+        answers = []
+        for name in self.ANSWER_TAGS:
+            section = find_section(text, name, tags)
+            if section is not None:
+                answers.append((name, section.content.strip()))
+        return answers
+
+    def verify(self, text: str, prompt: str = None, expression: str = None,
+               rel_tolerance: float = 1e-6, **kwargs) -> float:
+        """Returns only the score, with the same rules as verify_with_feedback."""
+        _, expected, _ = self._expected(prompt, expression)
+        answers = self._answers(text)
+        if expected is None or not answers:
+            return 0.0
+        correct = 0
+        for _, content in answers:
+            value = extract_number(content)
+            correct += value is not None and self._matches(value, expected, rel_tolerance)
+        return correct / len(answers)
+
+    def verify_with_feedback(self, text: str, prompt: str = None, expression: str = None,
+                             rel_tolerance: float = 1e-6, **kwargs) -> dict:
+        """
+        Returns a dict with:
+          - "score": fraction of answer sections with the right value
+          - "feedback": the expression and its exact result, then one
+            message per answer section
+        """
+        feedback = []
+
+        # 1) The exact result
+        expression_text, expected, error = self._expected(prompt, expression)
+        if expected is None:
+            if expression_text is None:
+                feedback.append(f"{error.capitalize()} => score=0.0.")
+            else:
+                feedback.append(f"Cannot evaluate '{expression_text}': {error} => score=0.0.")
+            return {"score": 0.0, "feedback": feedback}
+        shown = format_number(expected)
+        if expected.denominator != 1:
+            try:
+                shown += f" ≈ {float(expected):.10g}"
+            except OverflowError:
+                pass
+        feedback.append(f"Expression: {expression_text} = {shown}")
+
+        # 2) Each answer section against it
+        answers = self._answers(text)
+        if not answers:
+            feedback.append("No <answer> or <verifier_answer> found => score=0.0.")
+            return {"score": 0.0, "feedback": feedback}
+
+        correct = 0
+        for name, content in answers:
+            value = extract_number(content)
+            if value is None:
+                feedback.append(f"<{name}> has no number: '{content}'.")
+            elif self._matches(value, expected, rel_tolerance):
+                correct += 1
+                feedback.append(f"<{name}> '{content}' is correct.")
+            else:
+                feedback.append(f"<{name}> '{content}' is wrong (expected {shown}).")
+
+        score = correct / len(answers)
+        feedback.append(f"Score: {score:.2f} ({correct}/{len(answers)} answers correct).")
+        return {"score": score, "feedback": feedback}
@@ -1,20 +1,21 @@
 # verifiers/math/boxed_answer_verifier.py
-import re
 import logging
 from verifiers.base_verifier import BaseVerifier
+from verifiers.math.helpers.boxed import extract_boxed
+from verifiers.math.helpers.normalize import compare_answers, normalize_answer, normalize_gold
 
 class BoxedAnswerVerifier(BaseVerifier):
     """
-    Enforces that the final answer is in a LaTeX box \(\boxed{...}\)
-    and matches the gold solution's box content (after stripping whitespace).
-    """
+    Enforces that the final answer is in a LaTeX box \\boxed{...} (alone or
+    inside \\( \\)) and matches the gold solution's box content.
 
-    # Regex to find something like: \(\boxed{42}\)
-    # The capturing group (.*?) gives us the box content
-    BOX_PATTERN = re.compile(
-        r"\\\(\s*\\boxed\s*\{\s*(.*?)\s*\}\s*\\\)",
-        flags=re.DOTALL
-    )
+    The last box of each text is used, braces are balanced so nested
+    content such as \\frac{1}{2} is kept whole, and contents match if they
+    are equal after stripping whitespace or have the same canonical form
+    (numbers, fractions, thousands separators, scientific notation).
+    """
+    # 2: brace-balanced last box, with or without \( \); normalized comparison
+    VERSION = "2"
 
     def __init__(self, name="boxed_answer_verifier"):
         super().__init__(
@@ -26,10 +27,21 @@ class BoxedAnswerVerifier(BaseVerifier):
 
     def verify(self, text: str, **kwargs) -> float:
         """
-        Convenience method returning just the numeric score.
+        Returns just the numeric score, with the same rules as
+        verify_with_feedback but no feedback messages.
         """
-        result = self.verify_with_feedback(text, **kwargs)
-        return result["score"]
+        gold_solution = kwargs.get("gold_solution", None)
+        if gold_solution is None:
+            return 0.0
+
+        gold_content = extract_boxed(gold_solution)
+        if gold_content is None:
+            return 1.0
+
+        model_content = extract_boxed(text)
+        if model_content is None:
+            return 0.0
+        return 1.0 if compare_answers(model_content, gold_content) else 0.0
 
     def verify_with_feedback(self, text: str, **kwargs) -> dict:
         """
@@ -47,26 +59,31 @@ class BoxedAnswerVerifier(BaseVerifier):
             return {"score": 0.0, "feedback": feedback}
 
         # 1) Extract the box content from the gold solution
-        gold_match = self.BOX_PATTERN.search(gold_solution)
-        if not gold_match:
+        gold_content = extract_boxed(gold_solution)
+        if gold_content is None:
             # The test expects returning score=1.0 plus a message if the gold solution has no box
             feedback.append("Gold solution has no \\(\\boxed{...}\\) => no strict comparison => score=1.0.")
             return {"score": 1.0, "feedback": feedback}
 
-        gold_content = gold_match.group(1).strip()
-
-        # 2) Extract the box content from the model output
-        model_match = self.BOX_PATTERN.search(text)
-        if not model_match:
+        # 2) Extract the last box content from the model output
+        model_content = extract_boxed(text)
+        if model_content is None:
             feedback.append("No \\(\\boxed{...}\\) found in model output => score=0.0.")
             return {"score": 0.0, "feedback": feedback}
 
-        model_content = model_match.group(1).strip()
-
-        # 3) Compare the stripped content
-        if model_content == gold_content:
+        # 3) Compare the stripped content, then the canonical forms
+        match = compare_answers(model_content, gold_content)
+        if match == "exact":
             feedback.append(f"matches exactly => model: '{model_content}', gold: '{gold_content}' => score=1.0")
             return {"score": 1.0, "feedback": feedback}
-        else:
-            feedback.append(f"differs => model: '{model_content}', gold: '{gold_content}' => score=0.0")
-            return {"score": 0.0, "feedback": feedback}
+        if match == "normalized":
+            feedback.append(
+                f"matches after normalization => model: '{model_content}', gold: '{gold_content}' "
+                f"(both '{normalize_gold(gold_content)}') => score=1.0"
+            )
+            return {"score": 1.0, "feedback": feedback}
+        feedback.append(
+            f"differs => model: '{model_content}', gold: '{gold_content}' "
+            f"(normalized: '{normalize_answer(model_content)}' vs '{normalize_gold(gold_content)}') => score=0.0"
+        )
+        return {"score": 0.0, "feedback": feedback}
@@ -0,0 +1,153 @@
+# helpers/arithmetic.py
+"""
+Exact evaluation of the arithmetic in prompts such as
+"Evaluate: -8584 * 9952 - 6132 * 2741." without eval().
+
+The expression is parsed with ast and walked by a small evaluator that
+accepts only numbers, parentheses, unary +/- and the binary operators
++ - * / and ** (also written ^, × and ÷). Values are fractions.Fraction,
+so division is exact. Results are cached per expression and the
+expression found in each prompt is cached per prompt.
+"""
+import ast
+import operator
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+# Distinct prompts / expressions whose results are kept per process
+EXPRESSION_CACHE_SIZE = 65536
+# Longest expression the evaluator accepts, in characters
+MAX_EXPRESSION_LENGTH = 500
+# Largest |exponent| allowed in a ** b
+MAX_POWER = 100
+# Largest numerator or denominator of any value, in bits: about 4200
+# digits, under Python's 4300-digit limit for converting ints to str
+MAX_VALUE_BITS = 14_000
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+_EXPRESSION_NODES = (ast.Expression, ast.UnaryOp, ast.BinOp,
+                     *_BINARY_OPERATORS, *_UNARY_OPERATORS)
+_SYMBOLS = str.maketrans({"×": "*", "÷": "/", "^": "**", "−": "-"})
+
+# Runs of characters an expression can be made of; the longest one that
+# evaluates and contains an operator is the prompt's expression
+_CANDIDATE = re.compile(r"[-+−(\d][\d\s+\-−*/().×÷^]*")
+
+
+class Expression:
+    """
+    An expression found in a prompt:
+      - text:    the expression as found
+      - value:   its exact value (Fraction), or None if it cannot be evaluated
+      - error:   why it cannot be evaluated (e.g. "division by zero"), else None
+    """
+
+    __slots__ = ("text", "value", "error")
+
+    def __init__(self, text: str, value: Fraction = None, error: str = None):
+        self.text = text
+        self.value = value
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"Expression({self.text!r}, value={self.value}, error={self.error!r})"
+
+
+def _evaluate_node(node):
+    if isinstance(node, ast.Expression):
+        return _evaluate_node(node.body)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        # Floats come from decimal literals; str() gives back the literal's digits
+        return Fraction(node.value) if isinstance(node.value, int) else Fraction(str(node.value))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_evaluate_node(node.operand))
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        left, right = _evaluate_node(node.left), _evaluate_node(node.right)
+        if isinstance(node.op, ast.Div) and right == 0:
+            raise ValueError("division by zero")
+        if isinstance(node.op, ast.Pow):
+            if right.denominator != 1 or abs(right) > MAX_POWER:
+                raise ValueError(f"exponent must be an integer of at most {MAX_POWER}, got {right}")
+            if left == 0 and right < 0:
+                raise ValueError("division by zero")
+            bits = max(left.numerator.bit_length(), left.denominator.bit_length()) * abs(right.numerator)
+            if bits > MAX_VALUE_BITS:
+                raise ValueError(f"power too large (about {bits} bits)")
+        value = _BINARY_OPERATORS[type(node.op)](left, right)
+        bits = max(value.numerator.bit_length(), value.denominator.bit_length())
+        if bits > MAX_VALUE_BITS:
+            raise ValueError(f"result too large ({bits} bits)")
+        return value
+    raise ValueError(f"unsupported syntax: {type(node).__name__}")
+
+def _parse(expression: str) -> ast.Expression:
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ValueError(f"expression longer than {MAX_EXPRESSION_LENGTH} characters")
+    try:
+        return ast.parse(expression.translate(_SYMBOLS).strip(), mode="eval")
+    except SyntaxError:
+        raise ValueError(f"not an arithmetic expression: {expression!r}") from None
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def evaluate(expression: str) -> Fraction:
+    """
+    The exact value of an arithmetic expression. Raises ValueError for
+    anything but numbers, parentheses and + - * / ** (^, ×, ÷), for
+    division by zero, for values over MAX_VALUE_BITS and for expressions
+    over MAX_EXPRESSION_LENGTH.
+    """
+    return _evaluate_node(_parse(expression))
+
+def is_expression(text: str) -> bool:
+    """
+    True if 'text' is arithmetic the evaluator accepts, with at least one
+    binary operator (it is not evaluated, so it may still divide by zero).
+    """
+    try:
+        tree = _parse(text)
+    except ValueError:
+        return False
+    has_operator = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.BinOp):
+            has_operator = True
+        elif isinstance(node, ast.Constant):
+            if type(node.value) not in (int, float):
+                return False
+        elif not isinstance(node, _EXPRESSION_NODES):
+            return False
+    return has_operator
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def find_expression(prompt: str):
+    """
+    The arithmetic expression in a prompt: the longest run of numbers,
+    operators and parentheses that parses and contains at least one
+    binary operator (a trailing full stop is dropped). Returns an
+    Expression, evaluated if possible, or None if the prompt has none.
+    """
+    candidates = []
+    for match in _CANDIDATE.finditer(prompt):
+        text = match.group().strip().rstrip(".").strip()
+        if any(char.isdigit() for char in text):
+            candidates.append(text)
+
+    for text in sorted(candidates, key=len, reverse=True):
+        if not is_expression(text):
+            continue
+        try:
+            return Expression(text, evaluate(text))
+        except ValueError as e:
+            return Expression(text, error=str(e))
+    return None
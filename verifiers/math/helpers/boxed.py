@@ -0,0 +1,59 @@
+# helpers/boxed.py
+"""
+Extracts the content of LaTeX \\boxed{...} answers.
+
+One left-to-right pass over the text: each \\boxed is followed by
+counting braces until its opening brace is closed, so nested groups such
+as \\boxed{\\frac{1}{2}} come out whole. Boxes may stand alone or sit
+inside \\( \\) or $ $, and escaped braces (\\{, \\}) do not count.
+"""
+import re
+
+BOX_COMMAND = re.compile(r"\\boxed\s*\{")
+
+
+def find_boxes(text: str) -> list:
+    """
+    The contents of every complete \\boxed{...} in 'text', in order,
+    stripped of surrounding whitespace. A box that is never closed ends
+    the search. Boxes nested inside another box are part of its content.
+    """
+    boxes = []
+    position = 0
+    while True:
+        match = BOX_COMMAND.search(text, position)
+        if not match:
+            return boxes
+        end = _closing_brace(text, match.end())
+        if end is None:
+            return boxes
+        boxes.append(text[match.end():end].strip())
+        position = end + 1
+
+def extract_boxed(text: str, last: bool = True):
+    """
+    The content of the last \\boxed{...} in 'text' (the final answer of a
+    chain of thought), or the first if last=False. None if there is none.
+    """
+    boxes = find_boxes(text)
+    if not boxes:
+        return None
+    return boxes[-1] if last else boxes[0]
+
+def _closing_brace(text: str, start: int):
+    """Index of the brace closing the group that opens just before 'start', or None."""
+    depth = 1
+    i, n = start, len(text)
+    while i < n:
+        char = text[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return None
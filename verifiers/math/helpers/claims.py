@@ -0,0 +1,170 @@
+# helpers/claims.py
+"""
+Finds the arithmetic claims in a reasoning trace, such as
+
+    Step 2: 6132 * 2741 = 16,807,812
+    5585 + 0.366673500937 ≈ 5585.366673500937
+
+and checks them exactly with the restricted evaluator.
+
+The scan is linear in the length of the text: it visits each "=" or
+"≈" once and looks at most MAX_CLAIM_CHARS back (on the same line) for
+the expression and forward for the stated number. Expressions are
+evaluated through evaluate()'s cache, so claims that repeat across a
+batch of traces are computed once.
+"""
+import re
+from fractions import Fraction
+from functools import lru_cache
+from typing import NamedTuple
+
+from verifiers.math.helpers.arithmetic import EXPRESSION_CACHE_SIZE, evaluate, is_expression
+from verifiers.math.helpers.normalize import MAX_EXPONENT, MAX_NUMBER_LENGTH
+
+# Longest left-hand side considered for a claim, in characters
+MAX_CLAIM_CHARS = 120
+
+_RELATION = re.compile(r"[=≈]")
+_STATED = re.compile(r"\s*([+-]?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:[eE][+-]?\d+)?)")
+# A stated number followed by another operand is an expression, not a result
+_CONTINUES = re.compile(r"\s*[-+*/×÷^]\s*\(?\d")
+_EXPRESSION_CHARS = frozenset("0123456789 \t,.+-−*/×÷^()")
+_THOUSANDS = re.compile(r"(?<![\d,.])\d{1,3}(?:,\d{3})+(?![\d,])")
+_STEP = re.compile(r"^\s*(?:step\s*(\d+)|(\d+)[.)])", re.IGNORECASE | re.MULTILINE)
+
+
+class Claim(NamedTuple):
+    """
+    One "expression = number" (or "≈ number") claim:
+      - expression: the left-hand side, thousands separators removed
+      - stated:     the number as written
+      - approximate: True for "≈"
+      - start, end: offsets of the claim in the text
+      - step:       the label of the step it belongs to ("Step 2", "3."), or None
+    """
+    expression: str
+    stated: str
+    approximate: bool
+    start: int
+    end: int
+    step: str
+
+    @property
+    def text(self) -> str:
+        return f"{self.expression} {'≈' if self.approximate else '='} {self.stated}"
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _left_expression(run: str):
+    """
+    The longest suffix of 'run' (the characters before an "=") that is an
+    arithmetic expression, as (offset in run, expression with thousands
+    separators removed); None if no suffix is. Suffixes start at a
+    number, sign or parenthesis that begins a token, so "1. 5 + 3" gives
+    (3, "5 + 3") and "- 6 + 7" (a bullet) gives (2, "6 + 7").
+    """
+    run = run.rstrip()
+    for i, char in enumerate(run):
+        if char not in "(-+−0123456789":
+            continue
+        if i and (run[i - 1].isdigit() or run[i - 1] in ".,"):
+            continue
+        # A sign followed by a space is a list bullet ("- 6 + 7"), not a minus
+        if char in "-+−" and run[i + 1:i + 2].isspace():
+            continue
+        candidate = _THOUSANDS.sub(lambda m: m.group().replace(",", ""), run[i:])
+        if is_expression(candidate):
+            return i, candidate
+    return None
+
+def _step_labels(text: str) -> list:
+    """(offset, label) of each step heading ("Step 2", "3.") at the start of a line."""
+    return [
+        (m.start(), f"Step {m.group(1)}" if m.group(1) else f"{m.group(2)}.")
+        for m in _STEP.finditer(text)
+    ]
+
+def find_claims(text: str) -> list:
+    """All arithmetic claims in 'text', in order."""
+    claims = []
+    steps = _step_labels(text)
+    step_index = -1
+    for relation in _RELATION.finditer(text):
+        position = relation.start()
+        # Skip comparisons such as "<=", "==" and "!="
+        if (position and text[position - 1] in "<>!=") or text[position + 1:position + 2] == "=":
+            continue
+
+        # 1) The stated number, which must end the claim
+        stated = _STATED.match(text, relation.end())
+        if not stated or _CONTINUES.match(text, stated.end()):
+            continue
+
+        # 2) The expression: expression characters back from the relation, on the same line
+        start = position
+        floor = max(0, position - MAX_CLAIM_CHARS)
+        while start > floor and text[start - 1] in _EXPRESSION_CHARS:
+            start -= 1
+        found = _left_expression(text[start:position])
+        if found is None:
+            continue
+        offset, expression = found
+
+        while step_index + 1 < len(steps) and steps[step_index + 1][0] <= position:
+            step_index += 1
+        claims.append(Claim(
+            expression=expression,
+            stated=stated.group(1),
+            approximate=relation.group() == "≈",
+            start=start + offset,
+            end=stated.end(),
+            step=steps[step_index][1] if step_index >= 0 else None,
+        ))
+    return claims
+
+def stated_value(stated: str):
+    """
+    (value, unit) of a stated number: its exact value and one unit in its
+    last written digit (0 for integers without an exponent and for a zero
+    mantissa such as "0e5"). None if it is longer than MAX_NUMBER_LENGTH
+    or its exponent is larger than MAX_EXPONENT, so "1e3000000" is never
+    expanded.
+    """
+    digits = stated.replace(",", "")
+    if len(digits) > MAX_NUMBER_LENGTH:
+        return None
+    mantissa, _, exponent = digits.lower().partition("e")
+    if exponent and abs(int(exponent)) > MAX_EXPONENT:
+        return None
+    value = Fraction(digits)
+    decimals = len(mantissa.partition(".")[2])
+    if (not decimals and not exponent) or (exponent and not value):
+        return value, Fraction(0)
+    return value, Fraction(10) ** (int(exponent or 0) - decimals)
+
+def check_claim(claim: Claim, value: Fraction = None):
+    """
+    True if the claim holds, False if it does not, None if its expression
+    cannot be evaluated (e.g. division by zero). Pass 'value' if the
+    expression has already been evaluated.
+
+    A stated integer must be exact ("≈" allows ±1); a stated decimal or
+    scientific number may be off by one unit in its last written digit,
+    so rounded results are accepted. That digit must not be above the
+    leading digit of the true value: "2 * 3 = 1e1" is not a rounding of 6.
+    """
+    if value is None:
+        try:
+            value = evaluate(claim.expression)
+        except ValueError:
+            return None
+    written = stated_value(claim.stated)
+    if written is None:
+        return False
+    stated, unit = written
+    # A unit larger than the value means the stated number keeps none of its digits
+    if unit > abs(value):
+        return stated == value
+    if claim.approximate and not unit:
+        unit = Fraction(1)
+    return abs(value - stated) <= unit
@@ -0,0 +1,133 @@
+# helpers/normalize.py
+"""
+Canonical forms of math answers, so equal values written differently
+compare equal:
+
+    "1,234"  "1234.0"  "1.234E+3"  "1.234 \\times 10^{3}"  ->  "1234"
+    "\\frac{1}{2}"  "\\dfrac12"  "0.5"  "1/2"               ->  "1/2"
+
+Numbers become exact fractions (via fractions.Fraction, so decimals do
+not pick up float rounding) written as an integer or "p/q". Anything
+else is compared as its LaTeX with whitespace and cosmetic commands
+removed.
+"""
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+# Distinct gold answers whose canonical form is kept per process
+GOLD_CACHE_SIZE = 65536
+# Larger powers of ten are left as text rather than expanded to exact integers
+MAX_EXPONENT = 400
+# Longer numbers are left as text: int() refuses more than 4300 digits
+MAX_NUMBER_LENGTH = 4300
+
+# LaTeX that does not change the value: spacing, sizing and math-mode wrappers
+_COSMETIC = re.compile(r"\\[,;:! ]|\\left|\\right|\\displaystyle|\$|\\\(|\\\)|\\\[|\\\]")
+_TEXT = re.compile(r"\\(?:text|mbox|mathrm)\{([^{}]*)\}")
+_FRAC_COMMANDS = re.compile(r"\\[dt]frac")
+_THOUSANDS = re.compile(r"^[+-]?\d{1,3}(?:,\d{3})+(?:\.\d*)?$")
+
+_NUMBER = r"[+-]?(?:\d+\.?\d*|\.\d+)"
+_DECIMAL = re.compile(rf"^{_NUMBER}(?:[eE]([+-]?\d+))?$")
+# 1.4\times10^{3}, 1.4\cdot10^3, 1.4×10^3, 1.4*10**3
+_POWER_OF_TEN = re.compile(
+    rf"^({_NUMBER})(?:\\times|\\cdot|×|\*)10(?:\^\{{([+-]?\d+)\}}|\^([+-]?\d+)|\*\*([+-]?\d+))$"
+)
+# \frac{a}{b}, \frac12 and a/b with numeric a and b, optionally signed
+_FRACTION = re.compile(rf"^([+-]?)\\frac(?:\{{({_NUMBER})\}}|(\d))(?:\{{({_NUMBER})\}}|(\d))$")
+_SLASH = re.compile(rf"^({_NUMBER})/({_NUMBER})$")
+# Numbers inside prose, e.g. "the final answer is -1,022,357,844."
+_NUMBER_IN_TEXT = re.compile(r"[+-]?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:[eE][+-]?\d+)?(?:/\d+)?")
+
+
+def clean_latex(answer: str) -> str:
+    """Removes whitespace, cosmetic LaTeX and a trailing period; unwraps \\text{...}."""
+    answer = _TEXT.sub(r"\1", answer)
+    answer = _COSMETIC.sub("", answer)
+    answer = _FRAC_COMMANDS.sub(r"\\frac", answer)
+    answer = answer.replace("{,}", ",")
+    answer = ''.join(answer.split())
+    return answer[:-1] if answer.endswith(".") else answer
+
+def parse_number(answer: str):
+    """
+    The exact value of a cleaned answer that is a number (integer,
+    decimal, thousands-separated, scientific notation, fraction), as a
+    Fraction; None otherwise, and for answers over MAX_NUMBER_LENGTH.
+    """
+    if len(answer) > MAX_NUMBER_LENGTH:
+        return None
+    if _THOUSANDS.match(answer):
+        answer = answer.replace(",", "")
+    match = _DECIMAL.match(answer)
+    if match:
+        if match.group(1) and abs(int(match.group(1))) > MAX_EXPONENT:
+            return None
+        return Fraction(answer)
+
+    match = _POWER_OF_TEN.match(answer)
+    if match:
+        mantissa, *exponents = match.groups()
+        exponent = int(next(e for e in exponents if e is not None))
+        if abs(exponent) > MAX_EXPONENT:
+            return None
+        return Fraction(mantissa) * Fraction(10) ** exponent
+
+    match = _FRACTION.match(answer) or _SLASH.match(answer)
+    if match:
+        groups = [g for g in match.groups() if g is not None]
+        sign = groups.pop(0) if len(groups) == 3 else ""
+        numerator, denominator = (Fraction(g) for g in groups)
+        if denominator == 0:
+            return None
+        value = numerator / denominator
+        return -value if sign == "-" else value
+    return None
+
+def extract_number(answer: str):
+    """
+    The value of an answer that is a number, or else of the last number
+    written in it ("final answer is 1.4E+3" -> 1400). None if it has none.
+    """
+    value = parse_number(clean_latex(answer))
+    if value is not None:
+        return value
+    for match in reversed(_NUMBER_IN_TEXT.findall(answer)):
+        value = parse_number(match)
+        if value is not None:
+            return value
+    return None
+
+def format_number(value: Fraction) -> str:
+    return str(value.numerator) if value.denominator == 1 else f"{value.numerator}/{value.denominator}"
+
+def normalize_answer(answer: str) -> str:
+    """
+    The canonical form of an answer: "p/q" or an integer for numbers,
+    otherwise the cleaned LaTeX.
+    """
+    cleaned = clean_latex(answer)
+    value = parse_number(cleaned)
+    return format_number(value) if value is not None else cleaned
+
+@lru_cache(maxsize=GOLD_CACHE_SIZE)
+def normalize_gold(answer: str) -> str:
+    """
+    normalize_answer() for gold answers, memoized: the same gold recurs
+    for every completion of a prompt and across dataset passes, so each
+    distinct gold is normalized once per process.
+    """
+    return normalize_answer(answer)
+
+def compare_answers(model_answer: str, gold_answer: str):
+    """
+    How a model's answer matches the gold: "exact" (same string after
+    stripping whitespace), "normalized" (same canonical form), or None.
+    """
+    model_answer, gold_answer = model_answer.strip(), gold_answer.strip()
+    if model_answer == gold_answer:
+        return "exact"
+    if normalize_answer(model_answer) == normalize_gold(gold_answer):
+        return "normalized"
+    return None
@@ -0,0 +1,133 @@
+# verifiers/math/step_arithmetic_verifier.py
+from verifiers.base_verifier import BaseVerifier
+from verifiers.math.helpers.arithmetic import evaluate
+from verifiers.math.helpers.claims import check_claim, find_claims
+from verifiers.math.helpers.normalize import format_number
+from verifiers.reasoning.helpers.tag_scanner import describe_missing, find_section
+
+class StepArithmeticVerifier(BaseVerifier):
+    """
+    Re-checks the arithmetic in a <think> reasoning chain: every claim of
+    the form "expression = number" (or "≈ number"), such as
+    "Step 2: 6132 * 2741 = 16,807,812", is evaluated exactly and compared
+    with the stated result.
+
+    Score: the fraction of checkable claims that hold (claims whose
+    expression cannot be evaluated, e.g. a division by zero, are skipped).
+    0.0 if there is no <think> section or it makes no checkable claim.
+
+    The scan is linear in the length of the text, and verify_batch()
+    evaluates each distinct expression of the batch once.
+    """
+    # Wrong claims listed individually before the rest are summarized
+    MAX_WRONG_MESSAGES = 10
+
+    def __init__(self):
+        super().__init__(
+            name="step_arithmetic_verifier",
+            description=("Checks every 'a op b = c' claim in the <think> section exactly and "
+                         "scores the fraction that are correct."),
+            parameters={}
+        )
+
+    @staticmethod
+    def _claims(text: str) -> list:
+        """The claims in the first <think> section (None if there is none)."""
+        section = find_section(text, "think")
+        if section is None:
+            return None
+        return find_claims(section.content)
+
+    @staticmethod
+    def _evaluate_all(claims: list) -> dict:
+        """expression => exact value (None if it cannot be evaluated), each evaluated once."""
+        values = {}
+        for claim in claims:
+            if claim.expression not in values:
+                try:
+                    values[claim.expression] = evaluate(claim.expression)
+                except ValueError:
+                    values[claim.expression] = None
+        return values
+
+    @staticmethod
+    def _score(claims: list, values: dict) -> float:
+        checked = correct = 0
+        for claim in claims:
+            value = values[claim.expression]
+            if value is not None:
+                checked += 1
+                correct += check_claim(claim, value)
+        return correct / checked if checked else 0.0
+
+    def verify(self, text: str, **kwargs) -> float:
+        """Returns only the score, with the same rules as verify_with_feedback."""
+        claims = self._claims(text)
+        if not claims:
+            return 0.0
+        return self._score(claims, self._evaluate_all(claims))
+
+    def verify_batch(self, texts: list, **kwargs) -> list:
+        """
+        Scores many traces with the same rules as verify(), evaluating
+        each distinct expression of the whole batch once.
+        """
+        per_text = [self._claims(text) or [] for text in texts]
+        values = self._evaluate_all([claim for claims in per_text for claim in claims])
+        return [self._score(claims, values) if claims else 0.0 for claims in per_text]
+
+    def verify_with_feedback(self, text: str, **kwargs) -> dict:
+        """
+        Returns a dict with:
+          - "score": fraction of checkable claims that are correct
+          - "feedback": the number of claims checked, the first wrong step
+            and one message per wrong (or uncheckable) claim
+        """
+        feedback = []
+
+        # 1) The claims of the <think> section
+        claims = self._claims(text)
+        if claims is None:
+            feedback.append(describe_missing(text, "think"))
+            return {"score": 0.0, "feedback": feedback}
+        if not claims:
+            feedback.append("No arithmetic claims ('a op b = c') found in <think> => score=0.0.")
+            return {"score": 0.0, "feedback": feedback}
+
+        # 2) Each claim against its exact value
+        values = self._evaluate_all(claims)
+        messages = []
+        first_wrong = None
+        checked = correct = 0
+        for claim in claims:
+            where = f"{claim.step} " if claim.step else ""
+            value = values[claim.expression]
+            if value is None:
+                messages.append(f"{where}'{claim.text}' cannot be evaluated; skipped.")
+                continue
+            checked += 1
+            if check_claim(claim, value):
+                correct += 1
+                continue
+            shown = format_number(value)
+            if value.denominator != 1:
+                shown += f" ≈ {float(value):.10g}"
+            messages.append(f"{where}'{claim.text}' is wrong: {claim.expression} = {shown}.")
+            if first_wrong is None:
+                first_wrong = messages[-1]
+
+        if not checked:
+            feedback.extend(messages)
+            feedback.append("No claim could be evaluated => score=0.0.")
+            return {"score": 0.0, "feedback": feedback}
+
+        score = correct / checked
+        feedback.append(f"Checked {checked} claims: {correct} correct.")
+        if first_wrong is not None:
+            feedback.append(f"First wrong step: {first_wrong}")
+        if len(messages) > self.MAX_WRONG_MESSAGES:
+            hidden = len(messages) - self.MAX_WRONG_MESSAGES
+            messages = messages[:self.MAX_WRONG_MESSAGES] + [f"... and {hidden} more."]
+        feedback.extend(messages)
+        feedback.append(f"Score: {score:.2f} ({correct}/{checked} claims correct).")
+        return {"score": score, "feedback": feedback}
@@ -0,0 +1,54 @@
+# poetry/ballad_verifier.py
+from verifiers.poetry.rhyme_scheme_verifier import RhymeSchemeVerifier
+
+class BalladVerifier(RhymeSchemeVerifier):
+    """
+    A ballad in common measure: quatrains rhyming ABCB (only lines 2 and 4
+    of each stanza rhyme), alternating ~8 and ~6 syllables.
+    """
+    STANZA_SCHEME = "ABCB"
+    STANZA_SYLLABLES = [8, 6, 8, 6]
+    MAX_STANZAS = 8  # 3 fresh letters per stanza, 26 letters
+    LINE_COUNT_WEIGHT = 0.2
+    RHYME_WEIGHT = 0.5
+    SYLLABLE_WEIGHT = 0.3
+
+    def __init__(self):
+        super().__init__(
+            name="ballad_verifier",
+            description=("Checks if a poem is a ballad with partial credit: ABCB quatrains, "
+                         "alternating ~8/6 syllables per line."),
+            parameters={
+                "stanzas": {
+                    "type": "integer",
+                    "default": 4,
+                    "description": f"Number of ABCB quatrains expected (1-{self.MAX_STANZAS})."
+                },
+                **self._weight_parameters(),
+                "syllable_weight": {
+                    "type": "float",
+                    "default": self.SYLLABLE_WEIGHT,
+                    "description": "Weight for scoring the syllables-per-line requirement."
+                },
+                "tolerance": {
+                    "type": "integer",
+                    "default": 1,
+                    "description": "Allowed +/- deviation from 8 or 6 syllables per line."
+                }
+            }
+        )
+
+    def scheme(self, stanzas: int = 4, **kwargs) -> str:
+        """
+        Fresh letters per stanza, so each stanza's 2nd and 4th lines rhyme
+        only with each other: 2 stanzas => "ABCB DEFE".
+        """
+        if not 1 <= stanzas <= self.MAX_STANZAS:
+            raise ValueError(f"stanzas must be between 1 and {self.MAX_STANZAS}, got {stanzas}.")
+        return " ".join(
+            "".join(chr(ord(letter) + 3 * i) for letter in self.STANZA_SCHEME)
+            for i in range(stanzas)
+        )
+
+    def syllable_targets(self, letters: str, **kwargs) -> list:
+        return self.STANZA_SYLLABLES * (len(letters) // len(self.STANZA_SCHEME))
@@ -1,8 +1,13 @@
 # poetry/haiku_verifier.py
 from verifiers.base_verifier import BaseVerifier
-from verifiers.poetry.helpers.syllable_utils import count_syllables, breakdown_syllables
+from verifiers.poetry.helpers.syllable_utils import describe_syllables, preload_lexicon, syllables_within
+from verifiers.poetry.helpers.poem_batch import PoemBatch
+from verifiers.poetry.helpers.text_analysis import TextAnalysis
 
 class HaikuVerifier(BaseVerifier):
+    # 2: a line passes if any pronunciation of its words is on target
+    VERSION = "2"
+
     def __init__(self):
         super().__init__(
             name="haiku_verifier",
@@ -16,16 +21,40 @@ class HaikuVerifier(BaseVerifier):
             }
         )
 
-    def verify(self, text: str, tolerance: int = 1, **kwargs) -> float:
+    def warm_up(self):
+        preload_lexicon()
+
+    def verify(self, text: str, tolerance: int = 1, analysis: TextAnalysis = None, **kwargs) -> float:
         """
         Returns a float in [0.0, 1.0] giving partial credit for each line
         that meets its syllable requirement, but ONLY if line_count == 3.
         Otherwise, immediate 0.0.
+
+        Score-only path: counts syllables per line without building the
+        per-word feedback. Pass a precomputed TextAnalysis of 'text' as
+        'analysis' to reuse its lexicon lookups.
         """
-        result = self.verify_with_feedback(text, tolerance=tolerance, **kwargs)
-        return result["score"]
+        if analysis is not None:
+            lines = analysis.lines
+        else:
+            lines = [l for l in text.strip().split('\n') if l.strip()]
+        if len(lines) != 3:
+            return 0.0
 
-    def verify_with_feedback(self, text: str, tolerance: int = 1, **kwargs) -> dict:
+        correct_lines = 0
+        for line, target in zip(lines, (5, 7, 5)):
+            if syllables_within(line, target - tolerance, target + tolerance):
+                correct_lines += 1
+        return correct_lines / 3.0
+
+    def verify_batch(self, texts: list, tolerance: int = 1, batch: PoemBatch = None, **kwargs) -> list:
+        """
+        Scores many poems at once with the same rules as verify(). Pass a
+        PoemBatch of 'texts' as 'batch' to share it with other verifiers.
+        """
+        return PoemBatch.of(texts, batch, max_lines=3).score_line_targets((5, 7, 5), tolerance)
+
+    def verify_with_feedback(self, text: str, tolerance: int = 1, analysis: TextAnalysis = None, **kwargs) -> dict:
         """
         Returns a dict with:
           {
@@ -43,7 +72,8 @@ class HaikuVerifier(BaseVerifier):
         The tests expect exactly 3 feedback lines if line_count == 3,
         or 1 feedback line if line_count != 3.
         """
-        lines = [l for l in text.strip().split('\n') if l.strip()]
+        analysis = TextAnalysis.of(text, analysis)
+        lines = analysis.lines
         feedback = []
         
         # Must be exactly 3 lines for a standard haiku
@@ -61,20 +91,23 @@ class HaikuVerifier(BaseVerifier):
         correct_lines = 0
         line_feedback = []
 
-        for i, line in enumerate(lines):
+        for i, line_analysis in enumerate(lines):
+            line = line_analysis.text
+
             # Break out the words
-            words = line.strip().split()
+            words = line_analysis.words
 
-            # Total syllables in the entire line
-            syl_count = count_syllables(line)
+            # Total syllables in the entire line (and its range across pronunciations)
+            syl_count = describe_syllables(line_analysis)
 
             # Number of syllables in each individual word
-            word_syll_counts = [count_syllables(w) for w in words]
+            word_syll_counts = line_analysis.word_syllables
 
-            # (New) Actual syllable breakdown for each word (requires a custom function)
-            # e.g. breakdown_syllables("beautiful") -> ["beau", "ti", "ful"]
+            # Actual syllable breakdown for each word
+            # e.g. "beautiful" -> ["beau", "ti", "ful"]
             word_syllable_breakdowns = [
-                f"{w} ({'-'.join(breakdown_syllables(w))})" for w in words
+                f"{w} ({'-'.join(chunks)})"
+                for w, chunks in zip(words, line_analysis.word_breakdowns())
             ]
 
             # Determine acceptable syllable range
@@ -82,17 +115,17 @@ class HaikuVerifier(BaseVerifier):
             high = desired_syllables[i] + tolerance
 
             # Build feedback
-            if low <= syl_count <= high:
+            if syllables_within(line_analysis, low, high):
                 correct_lines += 1
                 line_feedback.append(
-                    f"Line {i+1} (\"{line}\"): Good ({syl_count} syllables).\n"
+                    f"Line {i+1} (\"{line}\"): Good ({syl_count}).\n"
                     f"  Words: {', '.join(words)}\n"
                     f"  Syllables per word: {word_syll_counts}\n"
                     f"  Syllable breakdown: {', '.join(word_syllable_breakdowns)}"
                 )
             else:
                 line_feedback.append(
-                    f"Line {i+1} (\"{line}\"): {syl_count} syllables (expected ~{desired_syllables[i]}).\n"
+                    f"Line {i+1} (\"{line}\"): {syl_count} (expected ~{desired_syllables[i]}).\n"
                     f"  Words: {', '.join(words)}\n"
                     f"  Syllables per word: {word_syll_counts}\n"
                     f"  Syllable breakdown: {', '.join(word_syllable_breakdowns)}"
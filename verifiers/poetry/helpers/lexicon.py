@@ -0,0 +1,401 @@
+# helpers/lexicon.py
+"""
+Compact, memory-mapped phonetic lexicon for the poetry verifiers.
+
+pronouncing parses the whole CMU dictionary into Python strings and lists
+in every process that touches it. The verifiers only need three things
+per word, so this module compiles the dictionary once into a small binary
+file and maps it read-only at runtime. The pages are shared by every
+process that opens the same file (uvicorn workers, pool workers).
+
+Per word, from the first CMU pronunciation (as the verifiers have always
+used):
+  - syllables:   number of vowel nuclei
+  - rhyme tail:  last stressed vowel and everything after it, e.g. "AE1-T"
+  - stress:      stress digits, e.g. "10" for "water"
+
+and across all of its pronunciations, so that "fire" (1 or 2 syllables)
+or "every" (2 or 3) is not penalized for the variant listed first:
+  - min/max syllables
+  - rhyme tails: the set of tails of every pronunciation
+
+Build the file ahead of time (the Dockerfile does this):
+
+    python -m verifiers.poetry.helpers.lexicon build [path]
+
+If the file is missing at runtime it is built on first use and written
+next to this module (or to VERIFIERS_LEXICON_PATH); if that location is
+not writable the lexicon is kept in memory instead.
+
+File layout (little-endian):
+  header    magic, format version, counts and section offsets
+  records   one RECORD per word, sorted by word
+  slots     open-addressing hash table of (crc32, record number + 1),
+            0 marks an empty slot
+  words     concatenated UTF-8 words, in record order
+  tails     newline-joined rhyme tails (record tail ids index this)
+  stresses  newline-joined stress patterns (record stress ids index this)
+  rhymes    inverted rhyme index: n_tails + 1 offsets, then the record
+            numbers of the words with each tail, from any pronunciation
+            (letters-only words of 2+ letters, fewest syllables and
+            shortest first)
+  tailsets  rhyme-tail sets of words whose pronunciations end in more
+            than one tail: n_tailsets + 1 offsets, then tail ids. Set 0
+            is empty and means "just the record's tail".
+"""
+import array
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from typing import NamedTuple
+
+MAGIC = b"VLEX"
+FORMAT_VERSION = 3
+
+# magic, version, n_words, n_slots, then offset/length of each section, n_tailsets
+HEADER = struct.Struct("<4sIIIIIIIIIIIIII")
+# word offset, word length, syllables, min syllables, max syllables, stress id, tail id, tail set id
+RECORD = struct.Struct("<IBBBBHII")
+# crc32 of the word, record number + 1 (0 = empty slot)
+SLOT = struct.Struct("<II")
+# rhyme index entries: one record number, or a tail's [start, end) span
+UINT = struct.Struct("<I")
+SPAN = struct.Struct("<II")
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cmu_lexicon.bin")
+
+
+def syllables_from_phones(phones: str) -> int:
+    """Each digit in an ARPAbet phone string marks a vowel nucleus."""
+    return sum(ch.isdigit() for ch in phones)
+
+def rhyme_tail_from_phones(phones: str) -> str:
+    """
+    The last stressed vowel + subsequent sounds, e.g. "K AE1 T" -> "AE1-T".
+    If no vowel is marked, the last two phones are used.
+    """
+    syllables = phones.strip().split()
+
+    # Find the last stressed vowel index (digit indicates vowel w/ stress info)
+    stressed_vowel_index = -1
+    for i, syl in enumerate(syllables):
+        if any(ch.isdigit() for ch in syl):
+            stressed_vowel_index = i
+
+    # Fallback if none found
+    if stressed_vowel_index == -1:
+        stressed_vowel_index = max(0, len(syllables) - 2)
+
+    return '-'.join(syllables[stressed_vowel_index:])
+
+def stress_from_phones(phones: str) -> str:
+    """Stress digits of a phone string, e.g. "W AO1 T ER0" -> "10"."""
+    return ''.join(ch for ch in phones if ch.isdigit())
+
+
+class Entry(NamedTuple):
+    """
+    What lookup() returns for a known word. The first four fields come
+    from its first pronunciation; the range and tail set cover them all.
+    """
+    syllables: int
+    rhyme_tail: str
+    stress: str
+    min_syllables: int
+    max_syllables: int
+    rhyme_tails: frozenset
+
+
+def build_lexicon(pronunciations=None) -> bytes:
+    """
+    Compiles (word, phones) pairs into the binary lexicon format.
+    Defaults to the CMU dictionary shipped with pronouncing. The first
+    pronunciation of a word gives its syllables, tail and stress; all of
+    them give its syllable range and rhyme-tail set.
+    """
+    if pronunciations is None:
+        import pronouncing
+        pronouncing.init_cmu()
+        pronunciations = pronouncing.pronunciations
+
+    # 1) Every pronunciation of every word, first one first
+    variants = {}
+    for word, phones in pronunciations:
+        variants.setdefault(word, []).append(phones)
+    words = sorted(variants)
+
+    # 2) Intern tails, stress patterns and multi-tail sets
+    tail_ids, stress_ids, tailset_ids = {}, {}, {(): 0}
+    records = bytearray()
+    blob = bytearray()
+    for word in words:
+        phones = variants[word][0]
+        encoded = word.encode("utf-8")
+        # Distinct tail ids, the first pronunciation's first
+        tails = list(dict.fromkeys(
+            tail_ids.setdefault(rhyme_tail_from_phones(p), len(tail_ids)) for p in variants[word]
+        ))
+        tailset_id = 0 if len(tails) == 1 else tailset_ids.setdefault(tuple(sorted(tails)), len(tailset_ids))
+        counts = [syllables_from_phones(p) for p in variants[word]]
+        stress_id = stress_ids.setdefault(stress_from_phones(phones), len(stress_ids))
+        records += RECORD.pack(
+            len(blob), len(encoded), counts[0], min(counts), max(counts), stress_id, tails[0], tailset_id
+        )
+        blob += encoded
+
+    # 3) Hash slots: power of two, at most half full
+    n_slots = 1
+    while n_slots < 2 * len(words):
+        n_slots *= 2
+    mask = n_slots - 1
+    slots = [(0, 0)] * n_slots
+    for index, word in enumerate(words):
+        crc = zlib.crc32(word.encode("utf-8"))
+        slot = crc & mask
+        while slots[slot][1]:
+            slot = (slot + 1) & mask
+        slots[slot] = (crc, index + 1)
+    slot_bytes = b"".join(SLOT.pack(*entry) for entry in slots)
+
+    tails = "\n".join(tail_ids).encode("utf-8")
+    stresses = "\n".join(stress_ids).encode("utf-8")
+
+    # 4) Inverted rhyme index: tail id -> record numbers, simplest words first
+    postings = [[] for _ in tail_ids]
+    for index, word in enumerate(words):
+        # Spelled-out letters ("b", "c") and tokens with apostrophes make poor suggestions
+        if word.isalpha() and len(word) > 1:
+            for phones in variants[word]:
+                postings[tail_ids[rhyme_tail_from_phones(phones)]].append(
+                    (syllables_from_phones(phones), len(word), word, index)
+                )
+    offsets, members = [0], []
+    for posting in postings:
+        # A word listed under one tail by two pronunciations keeps its simplest entry
+        members.extend(dict.fromkeys(index for *_, index in sorted(posting)))
+        offsets.append(len(members))
+    rhymes = struct.pack(f"<{len(offsets)}I{len(members)}I", *offsets, *members)
+
+    # 5) Multi-tail sets, in id order
+    offsets, members = [0], []
+    for tailset in tailset_ids:
+        members.extend(tailset)
+        offsets.append(len(members))
+    tailsets = struct.pack(f"<{len(offsets)}I{len(members)}I", *offsets, *members)
+
+    # 6) Lay out the sections after the header
+    records_off = HEADER.size
+    slots_off = records_off + len(records)
+    words_off = slots_off + len(slot_bytes)
+    tails_off = words_off + len(blob)
+    stresses_off = tails_off + len(tails)
+    rhymes_off = stresses_off + len(stresses)
+    tailsets_off = rhymes_off + len(rhymes)
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(words), n_slots,
+        records_off, len(records), slots_off, words_off,
+        tails_off, len(tails), stresses_off, len(stresses), rhymes_off,
+        tailsets_off, len(tailset_ids),
+    )
+    return b"".join([header, records, slot_bytes, blob, tails, stresses, rhymes, tailsets])
+
+def write_lexicon(path: str = None, pronunciations=None) -> str:
+    """Builds the lexicon and writes it atomically to 'path'. Returns the path."""
+    path = path or lexicon_path()
+    data = build_lexicon(pronunciations)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return path
+
+def lexicon_path() -> str:
+    return os.environ.get("VERIFIERS_LEXICON_PATH", DEFAULT_PATH)
+
+
+class Lexicon:
+    """
+    Read-only view over a compiled lexicon (an mmap or a bytes object).
+
+    lookup(word) takes a cleaned, lowercase word and returns its Entry,
+    or None if the word is unknown. words_for_tail(tail) lists the words
+    that share a rhyme tail.
+    """
+
+    def __init__(self, buffer, mm: mmap.mmap = None):
+        magic, version = struct.unpack_from("<4sI", buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not a version {FORMAT_VERSION} lexicon file.")
+        (_magic, _version, n_words, n_slots,
+         self._records_off, _records_len,
+         self._slots_off, self._words_off,
+         tails_off, tails_len, stresses_off, stresses_len,
+         self._rhymes_off, self._tailsets_off, n_tailsets) = HEADER.unpack_from(buffer, 0)
+
+        self._buffer = buffer
+        self._mmap = mm
+        self._n_words = n_words
+        self._mask = n_slots - 1
+        # The slot table as flat uint32 pairs: indexing it is far cheaper than a struct unpack
+        self._slots = memoryview(buffer)[self._slots_off:self._words_off].cast("I")
+        if sys.byteorder == "big":
+            # The file is little-endian; big-endian hosts read a swapped copy
+            swapped = array.array("I", self._slots)
+            swapped.byteswap()
+            self._slots.release()
+            self._slots = memoryview(swapped)
+        # A few thousand short strings; decoded once so lookups return shared str objects
+        self._tails = bytes(buffer[tails_off:tails_off + tails_len]).decode("utf-8").split("\n")
+        self._stresses = bytes(buffer[stresses_off:stresses_off + stresses_len]).decode("utf-8").split("\n")
+        self._tail_ids = {tail: tail_id for tail_id, tail in enumerate(self._tails)}
+        # Record numbers start after the n_tails + 1 offsets
+        self._postings_off = self._rhymes_off + 4 * (len(self._tails) + 1)
+        self._tailset_members_off = self._tailsets_off + 4 * (n_tailsets + 1)
+        # Tail sets are decoded on first use: one per tail for single-tail
+        # words, one per multi-tail set id
+        self._single_tailsets = {}
+        self._multi_tailsets = {}
+
+    @classmethod
+    def open(cls, path: str) -> "Lexicon":
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mm, mm)
+        except (ValueError, struct.error):
+            mm.close()
+            raise
+
+    def close(self):
+        self._slots.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _record(self, index: int) -> tuple:
+        return RECORD.unpack_from(self._buffer, self._records_off + RECORD.size * index)
+
+    def _word(self, index: int) -> str:
+        word_off, word_len = self._record(index)[:2]
+        start = self._words_off + word_off
+        return bytes(self._buffer[start:start + word_len]).decode("utf-8")
+
+    def words_for_tail(self, tail: str, limit: int = None, exclude=()) -> list[str]:
+        """
+        Words (letters only, 2+ letters) whose rhyme tail is 'tail', fewest
+        syllables and shortest first, skipping any in 'exclude'. Only the
+        first 'limit' entries are decoded, so a lookup costs O(limit), not
+        O(dictionary).
+        """
+        tail_id = self._tail_ids.get(tail)
+        if tail_id is None:
+            return []
+        start, end = SPAN.unpack_from(self._buffer, self._rhymes_off + 4 * tail_id)
+        words = []
+        for position in range(start, end):
+            if limit is not None and len(words) >= limit:
+                break
+            word = self._word(UINT.unpack_from(self._buffer, self._postings_off + 4 * position)[0])
+            if word not in exclude:
+                words.append(word)
+        return words
+
+    def _tailset(self, tail_id: int, tailset_id: int) -> frozenset:
+        if not tailset_id:
+            tailset = self._single_tailsets.get(tail_id)
+            if tailset is None:
+                tailset = self._single_tailsets[tail_id] = frozenset((self._tails[tail_id],))
+            return tailset
+        tailset = self._multi_tailsets.get(tailset_id)
+        if tailset is None:
+            start, end = SPAN.unpack_from(self._buffer, self._tailsets_off + 4 * tailset_id)
+            tail_ids = struct.unpack_from(f"<{end - start}I", self._buffer, self._tailset_members_off + 4 * start)
+            tailset = self._multi_tailsets[tailset_id] = frozenset(self._tails[t] for t in tail_ids)
+        return tailset
+
+    def lookup(self, word: str, _unpack_record=RECORD.unpack_from, _new_entry=tuple.__new__):
+        """
+        The word's Entry, or None. One probe costs an encode, a crc32 and
+        two uint32 reads of the slot table; only a crc match unpacks a
+        record. That is a few times slower than a dict lookup of a word's
+        phones (see benchmarks/bench_lexicon.py), but cheaper than
+        pronouncing's lookup plus parsing the phones into syllables and a
+        rhyme tail, which is what the verifiers need; repeated words are
+        served by word_cache.
+        """
+        key = word.encode("utf-8")
+        crc = zlib.crc32(key)
+        slots = self._slots
+        mask = self._mask
+        slot = crc & mask
+        while True:
+            index = slots[2 * slot + 1]
+            if not index:
+                return None
+            if slots[2 * slot] == crc:
+                buffer = self._buffer
+                (word_off, word_len, syllables, min_syllables, max_syllables,
+                 stress_id, tail_id, tailset_id) = _unpack_record(buffer, self._records_off + RECORD.size * (index - 1))
+                start = self._words_off + word_off
+                if buffer[start:start + word_len] == key:
+                    tailset = None if tailset_id else self._single_tailsets.get(tail_id)
+                    if tailset is None:
+                        tailset = self._tailset(tail_id, tailset_id)
+                    # tuple.__new__ skips the NamedTuple constructor's Python frame
+                    return _new_entry(Entry, (
+                        syllables, self._tails[tail_id], self._stresses[stress_id],
+                        min_syllables, max_syllables, tailset,
+                    ))
+            slot = (slot + 1) & mask
+
+    def __contains__(self, word: str) -> bool:
+        return self.lookup(word) is not None
+
+    def __len__(self) -> int:
+        return self._n_words
+
+    def __iter__(self):
+        """Yields every word in sorted order."""
+        for index in range(self._n_words):
+            yield self._word(index)
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._buffer)
+
+
+_lexicon = None
+_lexicon_lock = threading.Lock()
+
+def get_lexicon() -> Lexicon:
+    """
+    The process-wide lexicon. Maps the compiled file, building it first
+    if it is missing or stale; falls back to an in-memory copy if the
+    file cannot be written.
+    """
+    global _lexicon
+    if _lexicon is not None:
+        return _lexicon
+    with _lexicon_lock:
+        if _lexicon is None:
+            path = lexicon_path()
+            try:
+                _lexicon = Lexicon.open(path)
+            except (OSError, ValueError, struct.error):
+                try:
+                    _lexicon = Lexicon.open(write_lexicon(path))
+                except OSError:
+                    _lexicon = Lexicon(build_lexicon())
+    return _lexicon
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "build":
+        print("Usage: python -m verifiers.poetry.helpers.lexicon build [path]")
+        sys.exit(1)
+    written = write_lexicon(sys.argv[2] if len(sys.argv) > 2 else None)
+    lexicon = Lexicon.open(written)
+    print(f"Wrote {len(lexicon)} words ({lexicon.size_bytes} bytes) to {written}")
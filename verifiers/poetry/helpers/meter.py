@@ -0,0 +1,79 @@
+# helpers/meter.py
+from functools import lru_cache
+
+from verifiers.poetry.helpers.word_cache import word_info
+
+# Metrical feet as stress patterns: "1" stressed, "0" unstressed
+FEET = {
+    "iambic": "01",
+    "trochaic": "10",
+    "anapestic": "001",
+    "dactylic": "100",
+    "amphibrachic": "010",
+    "spondaic": "11",
+}
+
+def meter_pattern(meter: str, feet: int = 5) -> str:
+    """
+    The target stress pattern of a line:
+      - a foot name repeated 'feet' times: ("iambic", 5) -> "0101010101"
+      - or an explicit pattern of "0", "1" and "x" (spaces ignored), used as is:
+        ("01 01 01 01 01", ...) -> "0101010101"
+    """
+    name = meter.strip().lower()
+    if name in FEET:
+        if feet < 1:
+            raise ValueError(f"feet must be at least 1, got {feet}.")
+        return FEET[name] * feet
+
+    pattern = ''.join(meter.split())
+    if not pattern or set(pattern) - set("01x"):
+        raise ValueError(
+            f"Unknown meter {meter!r}: use one of {', '.join(FEET)} "
+            "or a pattern of '0' (unstressed), '1' (stressed) and 'x' (either)."
+        )
+    return pattern
+
+def line_meter(line) -> str:
+    """
+    Metrical pattern of a line (string or LineAnalysis): the words'
+    precomputed patterns concatenated, one "1"/"0"/"x" per syllable.
+    """
+    if not isinstance(line, str):
+        return line.meter
+    return ''.join([word_info(word).meter for word in line.strip().split()])
+
+@lru_cache(maxsize=65536)
+def meter_distance(stresses: str, pattern: str, bound: int) -> int:
+    """
+    Edit distance between a line's stresses and a target pattern, where
+    "x" matches either stress. Insertions and deletions (extra or missing
+    syllables) and substitutions (misplaced stresses) cost 1 each.
+
+    Only the diagonal band |i - j| <= bound of the DP table is computed
+    (a path leaving it costs more than 'bound'), and the search stops as
+    soon as the distance must exceed 'bound', returning bound + 1: cost
+    is O(len(stresses) * bound) and lines far off the meter cost little.
+    Cached: the same stress strings recur across a batch of poems.
+    """
+    n, m = len(stresses), len(pattern)
+    if abs(n - m) > bound:
+        return bound + 1
+
+    # Cells are capped at bound + 1, which is also the value of every cell outside the band
+    over = bound + 1
+    previous = [min(j, over) for j in range(m + 1)]
+    for i in range(1, n + 1):
+        s = stresses[i - 1]
+        low, high = max(1, i - bound), min(m, i + bound)
+        current = [over] * (m + 1)
+        current[0] = min(i, over)
+        for j in range(low, high + 1):
+            p = pattern[j - 1]
+            best = previous[j - 1] + (0 if s == p or s == "x" or p == "x" else 1)
+            best = min(best, previous[j] + 1, current[j - 1] + 1)
+            current[j] = best if best < over else over
+        if min(current[low - 1:high + 1]) > bound:
+            return over
+        previous = current
+    return previous[m]
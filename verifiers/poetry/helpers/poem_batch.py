@@ -0,0 +1,231 @@
+# helpers/poem_batch.py
+
+import numpy as np
+
+from verifiers.poetry.helpers.word_cache import word_info
+
+# Longest metrical pattern packed into an int64, two bits per syllable;
+# longer lines are joined as strings
+MAX_PACKED_SYLLABLES = 31
+_STRESS_DIGITS = {"0": 1, "1": 2, "x": 3}
+_STRESS_CHARS = " 01x"
+
+def _pack_meter(meter: str) -> int:
+    """A pattern as an integer, two bits per syllable; digits are never 0, so packing is one-to-one."""
+    code = 0
+    for stress in meter:
+        code = (code << 2) | _STRESS_DIGITS[stress]
+    return code
+
+def _unpack_meter(code: int) -> str:
+    stresses = []
+    while code:
+        stresses.append(_STRESS_CHARS[code & 3])
+        code >>= 2
+    return ''.join(reversed(stresses))
+
+class PoemBatch:
+    """
+    Syllable and rhyme arrays for many poems at once.
+
+    Every poem is split into non-empty lines exactly as the verifiers do
+    it, every distinct token across the whole batch is resolved once, and
+    the results are laid out as flat NumPy arrays over all lines:
+
+      - line_counts:     non-empty lines per poem, shape (n_poems,)
+      - line_starts:     index of each poem's first line in the flat arrays
+      - line_syllables:  syllables per line
+      - line_min_syllables,
+        line_max_syllables: syllable range per line across pronunciations
+      - line_rhymes:     id of each line's rhyme-tail set (-1 if it has none);
+                         compare ids with rhyme()
+      - line_meters:     each line's metrical pattern (a list of strings,
+                         built on first access); distinct_line_meters()
+                         gives the distinct patterns and each line's index
+
+    Only the first 'max_lines' lines of each poem are tokenized (all of
+    them if None); line_counts still counts every line.
+
+    Verifiers score the batch with array comparisons instead of a Python
+    loop per line. Build it once and pass it as 'batch=' to several
+    verifiers' verify_batch() to reuse it.
+    """
+
+    def __init__(self, texts: list, max_lines: int = None):
+        self.texts = texts
+        self.max_lines = max_lines
+        all_tokens = []
+        line_token_counts = []
+        line_counts = []
+        stored_counts = []
+
+        # 1) Tokenize, then number each distinct token in first-seen order
+        #    (dict and map work in C; there is no Python step per token)
+        for text in texts:
+            num_lines = 0
+            for line in text.strip().split('\n'):
+                if not line.strip():
+                    continue
+                num_lines += 1
+                if max_lines is not None and num_lines > max_lines:
+                    continue
+                tokens = line.split()
+                line_token_counts.append(len(tokens))
+                all_tokens.extend(tokens)
+            line_counts.append(num_lines)
+            stored_counts.append(num_lines if max_lines is None else min(num_lines, max_lines))
+        token_ids = {token: i for i, token in enumerate(dict.fromkeys(all_tokens))}
+        flat_token_ids = list(map(token_ids.__getitem__, all_tokens))
+
+        # 2) Resolve each distinct token once; equal tail sets share an id
+        tailset_ids = {frozenset(): -1}
+        syllable_table = np.empty(len(token_ids), dtype=np.int32)
+        min_table = np.empty(len(token_ids), dtype=np.int32)
+        max_table = np.empty(len(token_ids), dtype=np.int32)
+        rhyme_table = np.empty(len(token_ids), dtype=np.int32)
+        for token, token_id in token_ids.items():
+            info = word_info(token)
+            syllable_table[token_id] = info.syllables
+            min_table[token_id] = info.min_syllables
+            max_table[token_id] = info.max_syllables
+            rhyme_table[token_id] = tailset_ids.setdefault(info.rhyme_tails, len(tailset_ids) - 1)
+        del tailset_ids[frozenset()]
+        self._tailsets = list(tailset_ids)
+        # Distinct sets can only intersect if one of them has 2+ tails;
+        # the trailing False is what id -1 indexes
+        self._multi_tail = np.array([len(s) > 1 for s in self._tailsets] + [False], dtype=bool)
+        self.unique_tokens = len(token_ids)
+        self._tokens = list(token_ids)
+        self._line_meters = None
+        self._distinct_line_meters = None
+
+        # 3) Per-line sums and last-token rhymes
+        self.line_counts = np.asarray(line_counts, dtype=np.int64)
+        self.line_starts = np.zeros(len(texts), dtype=np.int64)
+        if len(texts) > 1:
+            np.cumsum(np.asarray(stored_counts[:-1], dtype=np.int64), out=self.line_starts[1:])
+
+        token_counts = np.asarray(line_token_counts, dtype=np.int64)
+        flat = np.asarray(flat_token_ids, dtype=np.int64)
+        self._flat_token_ids = flat
+        self._line_token_counts = token_counts
+        if len(token_counts):
+            line_ends = np.cumsum(token_counts)
+            self.line_syllables = np.add.reduceat(syllable_table[flat], line_ends - token_counts)
+            self.line_min_syllables = np.add.reduceat(min_table[flat], line_ends - token_counts)
+            self.line_max_syllables = np.add.reduceat(max_table[flat], line_ends - token_counts)
+            self.line_rhymes = rhyme_table[flat[line_ends - 1]]
+        else:
+            self.line_syllables = np.zeros(0, dtype=np.int32)
+            self.line_min_syllables = np.zeros(0, dtype=np.int32)
+            self.line_max_syllables = np.zeros(0, dtype=np.int32)
+            self.line_rhymes = np.zeros(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @property
+    def line_meters(self) -> list:
+        """Metrical pattern of every stored line, from each distinct token's cached pattern."""
+        if self._line_meters is None:
+            meters, line_meter_ids = self.distinct_line_meters()
+            self._line_meters = [meters[i] for i in line_meter_ids.tolist()]
+        return self._line_meters
+
+    def distinct_line_meters(self) -> tuple:
+        """
+        (distinct metrical patterns of the stored lines, index of each
+        line's pattern in that list as an array). Each line's pattern is
+        packed into an integer on arrays, from its tokens' packed patterns,
+        and grouped with np.unique, so no string is built per line. Lines
+        longer than MAX_PACKED_SYLLABLES syllables are joined as strings.
+        """
+        if self._distinct_line_meters is not None:
+            return self._distinct_line_meters
+        counts = self._line_token_counts
+        if not len(counts):
+            self._distinct_line_meters = [], np.zeros(0, dtype=np.int64)
+            return self._distinct_line_meters
+
+        # 1) Packed pattern and syllables of each distinct token
+        token_meters = [word_info(token).meter for token in self._tokens]
+        lengths = np.array([len(m) for m in token_meters], dtype=np.int64)
+        codes = np.array([_pack_meter(m) if len(m) <= MAX_PACKED_SYLLABLES else 0 for m in token_meters],
+                         dtype=np.int64)
+
+        # 2) Line code = sum of token codes, each shifted past the syllables after it in
+        #    the line (bits are twice the syllables; long lines' codes are replaced below)
+        flat = self._flat_token_ids
+        starts = np.cumsum(counts) - counts
+        token_bits = 2 * lengths[flat]
+        through = np.cumsum(token_bits)
+        line_ends = through[starts + counts - 1]
+        packed = line_ends - through[starts] + token_bits[starts] <= 2 * MAX_PACKED_SYLLABLES
+        shifts = np.repeat(line_ends, counts)
+        shifts -= through
+        np.minimum(shifts, 2 * MAX_PACKED_SYLLABLES, out=shifts)
+        line_codes = np.add.reduceat(codes[flat] << shifts, starts)
+
+        # 3) Long lines get negative codes, one per distinct joined pattern
+        long_meters = {}
+        for line in np.flatnonzero(~packed).tolist():
+            tokens = flat[starts[line]:starts[line] + counts[line]].tolist()
+            meter = ''.join(token_meters[t] for t in tokens)
+            line_codes[line] = -1 - long_meters.setdefault(meter, len(long_meters))
+        long_meters = list(long_meters)
+
+        unique, inverse = np.unique(line_codes, return_inverse=True)
+        meters = [long_meters[-1 - code] if code < 0 else _unpack_meter(code) for code in unique.tolist()]
+        self._distinct_line_meters = meters, inverse.reshape(-1)
+        return self._distinct_line_meters
+
+    @property
+    def line_poems(self) -> np.ndarray:
+        """Index of the poem each stored line belongs to."""
+        stored = np.diff(np.append(self.line_starts, len(self.line_syllables)))
+        return np.repeat(np.arange(len(self)), stored)
+
+    @classmethod
+    def of(cls, texts: list, batch: "PoemBatch" = None, max_lines: int = None) -> "PoemBatch":
+        """Returns 'batch' if given, else a fresh batch of 'texts' keeping 'max_lines' lines."""
+        return batch if batch is not None else cls(texts, max_lines)
+
+    def first_lines(self, values: np.ndarray, k: int, fill: int = 0) -> np.ndarray:
+        """
+        The first k entries of a per-line array for every poem, shape
+        (n_poems, k). Positions past the end of a shorter poem hold 'fill'.
+        """
+        if self.max_lines is not None and k > self.max_lines:
+            raise ValueError(f"This batch only keeps the first {self.max_lines} lines of each poem, not {k}.")
+        positions = np.arange(k)
+        present = positions < self.line_counts[:, None]
+        if not len(values):
+            return np.full((len(self), k), fill, dtype=values.dtype)
+        index = np.minimum(self.line_starts[:, None] + positions, len(values) - 1)
+        return np.where(present, values[index], fill)
+
+    def rhyme(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Elementwise: do rhyme-set ids 'a' and 'b' (from line_rhymes, -1 for
+        none) share a tail? Equal ids always do; different ids are only
+        compared as sets when one of them has several tails.
+        """
+        result = (a == b) & (a != -1)
+        candidates = np.flatnonzero(~result & (a != -1) & (b != -1) & (self._multi_tail[a] | self._multi_tail[b]))
+        for i in candidates:
+            result[i] = not self._tailsets[a[i]].isdisjoint(self._tailsets[b[i]])
+        return result
+
+    def score_line_targets(self, targets: tuple, tolerance: int) -> list:
+        """
+        Scores for poems that must have exactly len(targets) lines, each
+        within 'tolerance' syllables of its target in some pronunciation:
+        the fraction of lines on target, or 0.0 if the line count is wrong.
+        """
+        n = len(targets)
+        exact = self.line_counts == n
+        targets = np.asarray(targets)
+        low = self.first_lines(self.line_min_syllables, n)
+        high = self.first_lines(self.line_max_syllables, n)
+        on_target = (low <= targets + tolerance) & (targets - tolerance <= high)
+        return np.where(exact, on_target.sum(axis=1) / float(n), 0.0).tolist()
@@ -0,0 +1,145 @@
+# helpers/rhyme_scheme.py
+from verifiers.poetry.helpers.rhyme_utils import get_rhyme_ending, get_rhyme_tails
+
+def parse_scheme(scheme: str) -> str:
+    """
+    Normalizes a rhyme scheme: one letter per line, case-insensitive,
+    whitespace ignored, so stanzas can be spaced out for readability:
+        "ABAB CDCD EFEF GG" -> "ABABCDCDEFEFGG"
+    """
+    letters = ''.join(scheme.split()).upper()
+    if not letters.isalpha():
+        raise ValueError(f"Rhyme scheme must contain only letters and spaces, got {scheme!r}.")
+    return letters
+
+
+class RhymeGroup:
+    """
+    The lines that share one letter of a scheme:
+      - letter:        the scheme letter
+      - line_numbers:  1-based line positions, in order
+      - keys:          rhyme key of each line (None if the poem is too short)
+      - tails:         rhyme tails of every pronunciation of each line's
+                       last word (None if the poem is too short)
+      - matched:       whether each line rhymes with the group's first line,
+                       i.e. their tail sets intersect. The first line counts
+                       as matched when it has a tail.
+    """
+
+    __slots__ = ("letter", "line_numbers", "keys", "tails", "matched")
+
+    def __init__(self, letter: str, line_numbers: list, keys: list, tails: list):
+        self.letter = letter
+        self.line_numbers = line_numbers
+        self.keys = keys
+        self.tails = tails
+        reference = tails[0]
+        self.matched = [
+            bool(reference) and tail is not None and not reference.isdisjoint(tail)
+            for tail in tails
+        ]
+
+    @property
+    def matches(self) -> int:
+        return sum(self.matched)
+
+    @property
+    def ok(self) -> bool:
+        """True when every line of the group exists and rhymes with the first."""
+        return all(self.matched)
+
+    @property
+    def agreement(self) -> float:
+        return self.matches / len(self.matched)
+
+    def misses(self) -> list:
+        """(line number, reference line number) of each present line that misses the first line's rhyme."""
+        reference = self.line_numbers[0]
+        return [
+            (number, reference)
+            for number, key, matched in zip(self.line_numbers[1:], self.keys[1:], self.matched[1:])
+            if key is not None and not matched
+        ]
+
+    def __repr__(self) -> str:
+        return f"RhymeGroup({self.letter!r}, lines={self.line_numbers}, matched={self.matched})"
+
+
+class SchemeResult:
+    """
+    A poem checked against a rhyme scheme. Each line's rhyme key (and
+    tail set, across pronunciations) is computed once; 'groups' holds one
+    RhymeGroup per scheme letter (in order of first appearance) and
+    'key_groups' maps every rhyme key to the line numbers that end in it,
+    whatever the scheme says.
+    """
+
+    def __init__(self, lines: list, scheme: str):
+        self.scheme = parse_scheme(scheme)
+        self.num_lines = len(lines)
+
+        # 1) One rhyme key and tail set per line the scheme covers
+        covered = lines[:len(self.scheme)]
+        self.keys = [get_rhyme_ending(line) for line in covered]
+        self.tails = [get_rhyme_tails(line) for line in covered]
+
+        # 2) Hash lines by key and by scheme letter
+        self.key_groups = {}
+        for number, key in enumerate(self.keys, start=1):
+            if key:
+                self.key_groups.setdefault(key, []).append(number)
+
+        positions = {}
+        for number, letter in enumerate(self.scheme, start=1):
+            positions.setdefault(letter, []).append(number)
+        self.groups = [
+            RhymeGroup(letter, numbers, [self.key(n) for n in numbers], [self._tails(n) for n in numbers])
+            for letter, numbers in positions.items()
+        ]
+
+    def key(self, line_number: int):
+        """Rhyme key of a 1-based line, or None if the poem is too short."""
+        return self.keys[line_number - 1] if line_number <= len(self.keys) else None
+
+    def _tails(self, line_number: int):
+        return self.tails[line_number - 1] if line_number <= len(self.tails) else None
+
+    def group(self, letter: str) -> RhymeGroup:
+        for group in self.groups:
+            if group.letter == letter:
+                return group
+        raise KeyError(letter)
+
+    @property
+    def line_count_ok(self) -> bool:
+        return self.num_lines == len(self.scheme)
+
+    @property
+    def rhyme_groups(self) -> list:
+        """Groups with at least 2 lines; single-line groups have nothing to agree on."""
+        return [g for g in self.groups if len(g.line_numbers) > 1]
+
+    @property
+    def matches(self) -> int:
+        return sum(g.matches for g in self.rhyme_groups)
+
+    @property
+    def total(self) -> int:
+        return sum(len(g.line_numbers) for g in self.rhyme_groups)
+
+    @property
+    def agreement(self) -> float:
+        """Fraction of lines in multi-line groups that rhyme with their group's first line."""
+        return self.matches / self.total if self.total else 1.0
+
+    def misses(self) -> list:
+        """(line number, reference line number) of every present line that misses its group's rhyme."""
+        return [miss for group in self.rhyme_groups for miss in group.misses()]
+
+
+def check_scheme(lines: list, scheme: str) -> SchemeResult:
+    """
+    Checks non-empty lines (strings or LineAnalysis) against a rhyme scheme
+    such as "AABBA", "ABA ABA ABA ABA ABA ABAA" or "ABAB CDCD EFEF GG".
+    """
+    return SchemeResult(lines, scheme)
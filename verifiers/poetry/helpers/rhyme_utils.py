@@ -1,44 +1,78 @@
 # helpers/rhyme_utils.py
-import pronouncing
+from verifiers.poetry.helpers.lexicon import get_lexicon
+from verifiers.poetry.helpers.word_cache import word_info
 
-def get_rhyme_ending(line: str) -> str:
+def get_rhyme_ending(line) -> str:
     """
     Get a rough 'rhyming tail' for a line by taking the last word's
     phonetic tail (last stressed vowel + subsequent sounds).
-    Fallback is the last 2 letters if no pronouncing data is found.
+    Fallback is the last 2 letters if the word is not in the lexicon.
+
+    'line' may be a string or a precomputed LineAnalysis.
     """
+    if not isinstance(line, str):
+        return line.rhyme_ending
+
     words = line.strip().split()
     if not words:
         return ""
-    
-    last_word = ''.join([c for c in words[-1] if c.isalpha()]).lower()
-    phones = pronouncing.phones_for_word(last_word)
-    
-    if not phones:
-        # Fallback: just return the last word’s last 2 letters
-        return last_word[-2:]
-    
-    phone = phones[0]
-    syllables = phone.strip().split()
-    
-    # Find the last stressed vowel index (digit indicates vowel w/ stress info)
-    stressed_vowel_index = -1
-    for i, syl in enumerate(syllables):
-        if any(ch.isdigit() for ch in syl):
-            stressed_vowel_index = i
-    
-    # Fallback if none found
-    if stressed_vowel_index == -1:
-        stressed_vowel_index = max(0, len(syllables) - 2)
-    
-    # Take everything from the last stressed vowel onward
-    rhyming_tail = syllables[stressed_vowel_index:]
-    return '-'.join(rhyming_tail)
-
-def lines_rhyme(line1: str, line2: str) -> bool:
-    """
-    Check if two lines rhyme by comparing their 'rhyming tail'.
-    """
-    end1 = get_rhyme_ending(line1)
-    end2 = get_rhyme_ending(line2)
-    return (end1 == end2) and (end1 != "")
+    return word_info(words[-1]).rhyme_tail
+
+def get_rhyme_tails(line) -> frozenset:
+    """
+    Rhyming tails of every pronunciation of the line's last word
+    (empty if the line has no words). Precomputed in the lexicon.
+
+    'line' may be a string or a precomputed LineAnalysis.
+    """
+    if not isinstance(line, str):
+        return line.rhyme_tails
+
+    words = line.strip().split()
+    if not words:
+        return frozenset()
+    return word_info(words[-1]).rhyme_tails
+
+def lines_rhyme(line1, line2) -> bool:
+    """
+    Check if two lines rhyme: some pronunciation of each last word shares
+    a 'rhyming tail' ("fire" rhymes with "higher" and with "liar").
+    Each line may be a string or a precomputed LineAnalysis.
+    """
+    return not get_rhyme_tails(line1).isdisjoint(get_rhyme_tails(line2))
+
+def shared_rhyme_tail(line1, line2) -> str:
+    """The tail two lines rhyme on (line1's own ending if it is shared), or ""."""
+    shared = get_rhyme_tails(line1) & get_rhyme_tails(line2)
+    if not shared:
+        return ""
+    ending = get_rhyme_ending(line1)
+    return ending if ending in shared else min(shared)
+
+def last_word(line) -> str:
+    """Cleaned last word of a line (string or LineAnalysis); "" if none."""
+    if not isinstance(line, str):
+        return line.last_word
+    words = line.strip().split()
+    return word_info(words[-1]).clean if words else ""
+
+def rhyme_candidates(line, limit: int = 5, exclude=()) -> list[str]:
+    """
+    Dictionary words that rhyme with the last word of 'line' (the same
+    rhyming tail), simplest first, excluding that word and 'exclude'.
+    Served from the lexicon's precomputed rhyme index.
+    """
+    skip = {last_word(line), *exclude}
+    return get_lexicon().words_for_tail(get_rhyme_ending(line), limit=limit, exclude=skip)
+
+def rhyme_suggestion(line, line_number: int, ref_line, ref_number: int, limit: int = 5) -> str:
+    """
+    Feedback for a line that should rhyme with 'ref_line' but does not, e.g.
+    "Line 5 'cat' does not rhyme with 'lee' (line 1); candidates: be, he, ...".
+    """
+    word, ref_word = last_word(line), last_word(ref_line)
+    message = f"Line {line_number} '{word}' does not rhyme with '{ref_word}' (line {ref_number})"
+    candidates = rhyme_candidates(ref_line, limit=limit, exclude=(word,))
+    if candidates:
+        return f"{message}; candidates: {', '.join(candidates)}."
+    return f"{message}; no rhyming candidates found."
@@ -1,30 +1,64 @@
 # helpers/syllable_utils.py
-import pronouncing
+from verifiers.poetry.helpers.lexicon import get_lexicon
+from verifiers.poetry.helpers.word_cache import word_info, _count_syllables_naive
 
-def count_syllables(line: str) -> int:
+def preload_lexicon():
+    """
+    Maps the compiled phonetic lexicon now (building it if it is missing)
+    instead of on the first lookup.
+    """
+    get_lexicon()
+
+def count_syllables(line) -> int:
     """
     Counts syllables in a line by summing the syllables of each word.
-    Uses pronouncing.phones_for_word() for an accurate count if possible.
+    Uses the CMU-derived lexicon for an accurate count if possible.
     Falls back to naive vowel-group counting if not found in CMU dict.
+
+    'line' may be a string or a precomputed LineAnalysis.
     """
-    words = line.strip().split()
-    total_syllables = 0
+    if not isinstance(line, str):
+        return line.syllables
 
-    for word in words:
-        # Normalize the word to remove punctuation, etc.
-        clean_word = ''.join([c for c in word if c.isalpha()]).lower()
-        phones = pronouncing.phones_for_word(clean_word)
+    # Each word is normalized and looked up once per process (see word_cache)
+    return sum(word_info(word).syllables for word in line.strip().split())
 
-        if phones:
-            # Take the first pronunciation variant
-            # Each digit in the ARPAbet phone string indicates a vowel nucleus,
-            # so counting digits approximates counting syllables.
-            total_syllables += sum(ch.isdigit() for ch in phones[0])
-        else:
-            # Fallback: naive vowel-group counting
-            total_syllables += _count_syllables_naive(clean_word)
+def syllable_range(line) -> tuple[int, int]:
+    """
+    (min, max) syllables of a line across its words' pronunciation
+    variants, e.g. "every fire" -> (3, 5). Each word's range is
+    precomputed in the lexicon, so this costs the same as count_syllables.
+
+    'line' may be a string or a precomputed LineAnalysis.
+    """
+    if not isinstance(line, str):
+        return line.min_syllables, line.max_syllables
+
+    low = high = 0
+    for word in line.strip().split():
+        info = word_info(word)
+        low += info.min_syllables
+        high += info.max_syllables
+    return low, high
+
+def syllables_within(line, low: int, high: int) -> bool:
+    """
+    True when some reading of 'line' has between 'low' and 'high'
+    syllables, i.e. its syllable range overlaps [low, high].
+    """
+    line_low, line_high = syllable_range(line)
+    return line_low <= high and low <= line_high
 
-    return total_syllables
+def describe_syllables(line) -> str:
+    """
+    "5 syllables", or "5 syllables, 4-6 across pronunciations" when the
+    line's pronunciation variants differ. For feedback messages.
+    """
+    count = count_syllables(line)
+    low, high = syllable_range(line)
+    if low == high:
+        return f"{count} syllables"
+    return f"{count} syllables, {low}-{high} across pronunciations"
 
 def breakdown_syllables(word: str) -> list[str]:
     """
@@ -34,48 +68,17 @@ def breakdown_syllables(word: str) -> list[str]:
         "beautiful" -> ["beau", "ti", "ful"]
     This approach will not always match correct English syllabification.
     If an accurate breakdown is needed, consider a more advanced method
-    or parsing the ARPAbet phones in 'pronouncing'.
+    or aligning the ARPAbet phones from the CMU dictionary with the letters.
     """
     # Strip punctuation and lowercase
-    w = ''.join(c for c in word if c.isalpha()).lower()
+    w = word_info(word).clean
     if not w:
         return []
 
-    # Attempt a pronunciation-based approach first, if available
-    phones = pronouncing.phones_for_word(w)
-    if phones:
-        # Example strategy (very simplified):
-        # 1) Parse the ARPAbet phones
-        # 2) Attempt to align phone clusters with letters
-        # 3) Create textual chunks
-        # 
-        # However, ARPAbet-to-text alignment can get complicated.
-        # Here, we’ll just do a naive fallback to keep things simple.
-        return _breakdown_syllables_naive(w)
-
-    # If not in CMU dictionary, do the naive approach
+    # ARPAbet-to-text alignment gets complicated, so known and unknown
+    # words alike use the naive vowel-group split.
     return _breakdown_syllables_naive(w)
 
-def _count_syllables_naive(word: str) -> int:
-    """
-    Naive syllable count by counting vowel groups.
-    E.g., 'beautiful' -> 3 vowel groups: 'eau', 'i', 'u'
-    """
-    vowels = "aeiou"
-    count = 0
-    in_vowel_group = False
-
-    for char in word:
-        if char in vowels:
-            # When we first encounter a vowel group, increment count
-            if not in_vowel_group:
-                count += 1
-                in_vowel_group = True
-        else:
-            in_vowel_group = False
-
-    return count
-
 def _breakdown_syllables_naive(word: str) -> list[str]:
     """
     A naive way to split a word into syllable-like chunks by grouping everything
@@ -0,0 +1,96 @@
+# helpers/text_analysis.py
+from verifiers.poetry.helpers.syllable_utils import _breakdown_syllables_naive
+from verifiers.poetry.helpers.word_cache import word_info
+
+class LineAnalysis:
+    """
+    One non-empty line of a poem, analyzed once:
+      - text:            the original line
+      - words:           whitespace tokens, as written
+      - word_infos:      WordInfo (clean form, syllables, rhyme tail, stress) per token
+      - clean_words:     lowercase, letters-only form of each token
+      - word_syllables:  syllable count for each word
+      - syllables:       total syllables in the line
+      - min_syllables,
+        max_syllables:   total range across the words' pronunciations
+      - rhyme_ending:    rhyming tail of the last word ("" if none)
+      - rhyme_tails:     rhyming tails of every pronunciation of the last word
+
+    Accepted anywhere the poetry helpers take a line string
+    (count_syllables, syllable_range, get_rhyme_ending, lines_rhyme).
+    """
+
+    __slots__ = (
+        "text", "words", "word_infos", "clean_words", "word_syllables",
+        "syllables", "min_syllables", "max_syllables", "rhyme_ending", "rhyme_tails"
+    )
+
+    def __init__(self, text: str, lookup):
+        self.text = text
+        self.words = text.strip().split()
+        self.word_infos = [lookup(w) for w in self.words]
+        self.clean_words = [info.clean for info in self.word_infos]
+        self.word_syllables = [info.syllables for info in self.word_infos]
+        self.syllables = sum(self.word_syllables)
+        self.min_syllables = sum([info.min_syllables for info in self.word_infos])
+        self.max_syllables = sum([info.max_syllables for info in self.word_infos])
+        self.rhyme_ending = self.word_infos[-1].rhyme_tail if self.word_infos else ""
+        self.rhyme_tails = self.word_infos[-1].rhyme_tails if self.word_infos else frozenset()
+
+    @property
+    def meter(self) -> str:
+        """Metrical pattern of the line, one "1"/"0"/"x" per syllable."""
+        return ''.join([info.meter for info in self.word_infos])
+
+    @property
+    def last_word(self) -> str:
+        return self.clean_words[-1] if self.clean_words else ""
+
+    @property
+    def last_word_stress(self) -> str:
+        """Stress digits of the last word, e.g. "10" ("" if unknown)."""
+        return self.word_infos[-1].stress if self.word_infos else ""
+
+    def word_breakdowns(self) -> list[list[str]]:
+        """Naive syllable chunks per word, as breakdown_syllables() returns them."""
+        return [_breakdown_syllables_naive(w) if w else [] for w in self.clean_words]
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class TextAnalysis:
+    """
+    Single-pass analysis of a poem shared by the poetry verifiers.
+
+    The text is split into non-empty lines exactly as the verifiers do it,
+    and each distinct token is resolved once. Build it once and pass it as
+    'analysis=' to several verifiers to score one poem against all of them
+    without repeating the work:
+
+        analysis = TextAnalysis(poem)
+        HaikuVerifier().verify(poem, analysis=analysis)
+        TankaVerifier().verify(poem, analysis=analysis)
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._words = {}  # token -> WordInfo
+        self.lines = [
+            LineAnalysis(line, self._lookup)
+            for line in text.strip().split('\n') if line.strip()
+        ]
+
+    def _lookup(self, token: str):
+        info = self._words.get(token)
+        if info is None:
+            info = self._words[token] = word_info(token)
+        return info
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    @classmethod
+    def of(cls, text: str, analysis: "TextAnalysis" = None) -> "TextAnalysis":
+        """Returns 'analysis' if given, else a fresh analysis of 'text'."""
+        return analysis if analysis is not None else cls(text)
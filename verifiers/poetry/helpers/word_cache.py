@@ -0,0 +1,158 @@
+# helpers/word_cache.py
+import os
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from verifiers.poetry.helpers.lexicon import get_lexicon
+
+class WordInfo(NamedTuple):
+    """
+    Everything the poetry helpers derive from one whitespace token:
+      - clean:            lowercase, letters-only form
+      - syllables:        lexicon count, or the naive count for unknown words
+      - naive_syllables:  vowel-group count
+      - rhyme_tail:       lexicon rhyme tail, or the last 2 letters
+      - stress:           lexicon stress digits ("" for unknown words)
+      - meter:            one metrical symbol per syllable (see meter_from_stress)
+      - min_syllables:    fewest syllables across pronunciations
+      - max_syllables:    most syllables across pronunciations
+      - rhyme_tails:      rhyme tails of every pronunciation
+    """
+    clean: str
+    syllables: int
+    naive_syllables: int
+    rhyme_tail: str
+    stress: str
+    meter: str
+    min_syllables: int
+    max_syllables: int
+    rhyme_tails: frozenset
+
+def clean_token(word: str) -> str:
+    """Lowercases a whitespace token and strips everything but letters."""
+    return ''.join([c for c in word if c.isalpha()]).lower()
+
+def _count_syllables_naive(word: str) -> int:
+    """
+    Naive syllable count by counting vowel groups.
+    E.g., 'beautiful' -> 3 vowel groups: 'eau', 'i', 'u'
+    """
+    vowels = "aeiou"
+    count = 0
+    in_vowel_group = False
+
+    for char in word:
+        if char in vowels:
+            # When we first encounter a vowel group, increment count
+            if not in_vowel_group:
+                count += 1
+                in_vowel_group = True
+        else:
+            in_vowel_group = False
+
+    return count
+
+def meter_from_stress(stress: str, syllables: int) -> str:
+    """
+    The metrical pattern of one word: "1" stressed, "0" unstressed and
+    "x" either way. Primary stress is "1" and no stress "0"; secondary
+    stress, monosyllables (which take the stress of their position) and
+    unknown words (one "x" per naive syllable) are "x".
+        "water" ("10") -> "10", "cat" -> "x", "understand" ("201") -> "x01"
+    """
+    if not stress:
+        return "x" * syllables
+    if len(stress) == 1:
+        return "x"
+    return stress.replace("2", "x")
+
+def analyze_word(token: str) -> WordInfo:
+    """Computes a token's WordInfo without the cache."""
+    clean = clean_token(token)
+    naive = _count_syllables_naive(clean)
+    entry = get_lexicon().lookup(clean) if clean else None
+    if entry is None:
+        # Fallbacks: naive vowel groups, last 2 letters
+        tail = clean[-2:]
+        return WordInfo(clean, naive, naive, tail, "", "x" * naive, naive, naive, frozenset((tail,) if tail else ()))
+    return WordInfo(
+        clean, entry.syllables, naive, entry.rhyme_tail, entry.stress,
+        meter_from_stress(entry.stress, entry.syllables),
+        entry.min_syllables, entry.max_syllables, entry.rhyme_tails,
+    )
+
+
+class WordCache:
+    """
+    Bounded, thread-safe LRU cache of WordInfo keyed by the raw token.
+
+    The same few thousand words repeat across a batch of poems, so each
+    distinct token is cleaned and looked up once. max_entries=0 disables
+    caching (every call computes).
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> WordInfo:
+        with self._lock:
+            info = self._entries.get(token)
+            if info is not None:
+                self._entries.move_to_end(token)
+                self.hits += 1
+                return info
+            self.misses += 1
+
+        # Compute outside the lock; a concurrent miss on the same token just repeats the work
+        info = analyze_word(token)
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[token] = info
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return info
+
+    def resize(self, max_entries: int):
+        with self._lock:
+            self.max_entries = max_entries
+            while len(self._entries) > max(max_entries, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Process-wide cache; WORD_CACHE_MAX_ENTRIES sets its size (0 disables it)
+word_cache = WordCache(int(os.environ.get("WORD_CACHE_MAX_ENTRIES", "100000")))
+
+def word_info(token: str) -> WordInfo:
+    """The (cached) WordInfo of a whitespace token."""
+    return word_cache.get(token)
+
+def configure_word_cache(max_entries: int):
+    """Resizes the process-wide word cache, evicting the oldest entries if needed."""
+    word_cache.resize(max_entries)
+
+def word_cache_stats() -> dict:
+    return word_cache.stats()
@@ -1,38 +1,23 @@
 # poetry/limerick_verifier.py
-import re
-import pronouncing
+import numpy as np
 
 from verifiers.base_verifier import BaseVerifier
 from verifiers.poetry.helpers.syllable_utils import (
-    count_syllables,
-    breakdown_syllables
+    describe_syllables,
+    preload_lexicon,
+    syllable_range,
+    syllables_within
 )
-from verifiers.poetry.helpers.rhyme_utils import lines_rhyme
-
-def _get_last_word_and_phones(line: str) -> tuple[str, list[str]]:
-    """
-    Returns (last_word, phones_list) for a given line.
-    - last_word: the last alphabetic word in lowercase (no punctuation).
-    - phones_list: list of possible ARPAbet pronunciations from pronouncing.
-    """
-    words = line.strip().split()
-    if not words:
-        return ("", [])
-
-    # Take the last token, strip punctuation, lowercase it
-    raw_last = words[-1].lower()
-    clean_last = re.sub(r'[^a-z]', '', raw_last)
-
-    # Get ARPAbet pronunciations from pronouncing
-    if clean_last:
-        phones = pronouncing.phones_for_word(clean_last)
-    else:
-        phones = []
-
-    return (clean_last, phones)
-
+from verifiers.poetry.helpers.rhyme_scheme import check_scheme
+from verifiers.poetry.helpers.rhyme_utils import rhyme_suggestion
+from verifiers.poetry.helpers.poem_batch import PoemBatch
+from verifiers.poetry.helpers.text_analysis import TextAnalysis
 
 class LimerickVerifier(BaseVerifier):
+    # 2: syllable ranges and rhymes consider every pronunciation
+    VERSION = "2"
+    RHYME_SCHEME = "AABBA"
+
     def __init__(self):
         super().__init__(
             name="limerick_verifier",
@@ -56,10 +41,14 @@ class LimerickVerifier(BaseVerifier):
             }
         )
 
+    def warm_up(self):
+        preload_lexicon()
+
     def verify(self, text: str,
                line_count_required: int = 5,
                long_line_range: list = None,
                short_line_range: list = None,
+               analysis: TextAnalysis = None,
                **kwargs) -> float:
         """
         Return a partial-credit score in [0, 1].
@@ -70,20 +59,86 @@ class LimerickVerifier(BaseVerifier):
           4) syllable counts (lines 1,2,5 + lines 3,4)
 
         So a poem passing all checks yields 1.0, partial compliance might be 0.75, 0.5, etc.
+
+        Score-only path: each rhyme ending is computed once and no per-word
+        syllable breakdowns or rhyme suggestions are built for feedback.
+        Pass a precomputed TextAnalysis of 'text' as 'analysis' to reuse its
+        lexicon lookups.
         """
-        result = self.verify_with_feedback(
-            text,
-            line_count_required=line_count_required,
-            long_line_range=long_line_range,
-            short_line_range=short_line_range,
-            **kwargs
-        )
-        return result["score"]
+        if long_line_range is None:
+            long_line_range = [7, 11]
+        if short_line_range is None:
+            short_line_range = [4, 8]
+
+        if analysis is not None:
+            lines = analysis.lines
+        else:
+            lines = [ln for ln in text.strip().split('\n') if ln.strip()]
+        num_lines = len(lines)
+        checks_passed = 0
+
+        # 1) Line count
+        if num_lines == line_count_required:
+            checks_passed += 1
+
+        # 2) + 3) A-rhyme (lines 1,2,5) and B-rhyme (lines 3,4)
+        scheme = check_scheme(lines, self.RHYME_SCHEME)
+        checks_passed += scheme.group("A").ok + scheme.group("B").ok
+
+        # 4) Syllable ranges
+        if num_lines >= 5:
+            l1, l2, l3, l4, l5 = lines[:5]
+            min_long, max_long = long_line_range
+            min_short, max_short = short_line_range
+            if (all(syllables_within(ln, min_long, max_long) for ln in (l1, l2, l5))
+                    and all(syllables_within(ln, min_short, max_short) for ln in (l3, l4))):
+                checks_passed += 1
+
+        return checks_passed / 4
+
+    def verify_batch(self, texts: list,
+                     line_count_required: int = 5,
+                     long_line_range: list = None,
+                     short_line_range: list = None,
+                     batch: PoemBatch = None,
+                     **kwargs) -> list:
+        """
+        Scores many poems at once with the same 4 checks as verify(),
+        evaluated as array comparisons over the whole batch. Pass a
+        PoemBatch of 'texts' as 'batch' to share it with other verifiers.
+        """
+        if long_line_range is None:
+            long_line_range = [7, 11]
+        if short_line_range is None:
+            short_line_range = [4, 8]
+        batch = PoemBatch.of(texts, batch, max_lines=5)
+        num_lines = batch.line_counts
+
+        # 1) Line count
+        checks_passed = (num_lines == line_count_required).astype(np.int64)
+
+        # 2) + 3) A-rhyme (lines 1,2,5) and B-rhyme (lines 3,4); -1 marks "no ending"
+        rhymes = batch.first_lines(batch.line_rhymes, 5, fill=-1)
+        checks_passed += (num_lines >= 5) \
+            & batch.rhyme(rhymes[:, 0], rhymes[:, 1]) & batch.rhyme(rhymes[:, 0], rhymes[:, 4])
+        checks_passed += (num_lines >= 4) & batch.rhyme(rhymes[:, 2], rhymes[:, 3])
+
+        # 4) Syllable ranges: some reading of each line falls in its range
+        low = batch.first_lines(batch.line_min_syllables, 5)
+        high = batch.first_lines(batch.line_max_syllables, 5)
+        min_long, max_long = long_line_range
+        min_short, max_short = short_line_range
+        long_ok = ((low[:, [0, 1, 4]] <= max_long) & (min_long <= high[:, [0, 1, 4]])).all(axis=1)
+        short_ok = ((low[:, [2, 3]] <= max_short) & (min_short <= high[:, [2, 3]])).all(axis=1)
+        checks_passed += (num_lines >= 5) & long_ok & short_ok
+
+        return (checks_passed / 4).tolist()
 
     def verify_with_feedback(self, text: str,
                              line_count_required: int = 5,
                              long_line_range: list = None,
                              short_line_range: list = None,
+                             analysis: TextAnalysis = None,
                              **kwargs) -> dict:
         """
         Returns a dict with:
@@ -107,8 +162,8 @@ class LimerickVerifier(BaseVerifier):
         checks_passed = 0
         total_checks = 4
 
-        # Split text into non-empty lines
-        lines = [ln for ln in text.strip().split('\n') if ln.strip()]
+        # Split text into non-empty lines, each analyzed once
+        lines = TextAnalysis.of(text, analysis).lines
         num_lines = len(lines)
 
         # 1) LINE COUNT CHECK
@@ -121,50 +176,51 @@ class LimerickVerifier(BaseVerifier):
                 f"Expected {line_count_required}, got {num_lines}."
             )
 
+        # 2) + 3) RHYME CHECKS on the AABBA scheme, one rhyme key per line
+        scheme = check_scheme(lines, self.RHYME_SCHEME)
+
         # 2) A-RHYME CHECK => lines[0], lines[1], lines[4]
         # (Only possible if we have >=5 lines)
-        a_rhyme_ok = False
-        if num_lines >= 5:
-            a_rhyme_ok = (
-                lines_rhyme(lines[0], lines[1]) and
-                lines_rhyme(lines[0], lines[4])
-            )
+        a_group = scheme.group("A")
+        a_rhyme_ok = a_group.ok
         if a_rhyme_ok:
             checks_passed += 1
             feedback.append("A-rhyme check passed (lines 1,2,5).")
         else:
             feedback.append("A-rhyme check failed (lines 1,2,5).")
 
+        # Suggest replacements for the lines that miss line 1's rhyme
+        for number, ref_number in a_group.misses():
+            feedback.append(rhyme_suggestion(lines[number - 1], number, lines[ref_number - 1], ref_number))
+
         # 3) B-RHYME CHECK => lines[2], lines[3]
         # (Only possible if we have >=4 lines)
-        b_rhyme_ok = False
-        if num_lines >= 4:
-            b_rhyme_ok = lines_rhyme(lines[2], lines[3])
+        b_group = scheme.group("B")
+        b_rhyme_ok = b_group.ok
         if b_rhyme_ok:
             checks_passed += 1
             feedback.append("B-rhyme check passed (lines 3,4).")
         else:
             feedback.append("B-rhyme check failed (lines 3,4).")
 
+        for number, ref_number in b_group.misses():
+            feedback.append(rhyme_suggestion(lines[number - 1], number, lines[ref_number - 1], ref_number))
+
         # 4) SYLLABLE CHECKS (only if we have >=5 lines)
         if num_lines >= 5:
-            # Count syllables for the first 5 lines
-            sylls = [count_syllables(ln) for ln in lines[:5]]
-            l1, l2, l3, l4, l5 = sylls
+            # Syllables of the first 5 lines, as a range across pronunciations
+            l1, l2, l3, l4, l5 = [self._syllable_label(ln) for ln in lines[:5]]
 
             min_long, max_long = long_line_range
             min_short, max_short = short_line_range
 
             # lines 1,2,5 => "long" lines
-            lines_1_2_5_ok = (
-                min_long <= l1 <= max_long and
-                min_long <= l2 <= max_long and
-                min_long <= l5 <= max_long
+            lines_1_2_5_ok = all(
+                syllables_within(ln, min_long, max_long) for ln in (lines[0], lines[1], lines[4])
             )
             # lines 3,4 => "short" lines
-            lines_3_4_ok = (
-                min_short <= l3 <= max_short and
-                min_short <= l4 <= max_short
+            lines_3_4_ok = all(
+                syllables_within(ln, min_short, max_short) for ln in (lines[2], lines[3])
             )
 
             if lines_1_2_5_ok and lines_3_4_ok:
@@ -189,43 +245,35 @@ class LimerickVerifier(BaseVerifier):
         # -- ADDITIONAL PER-LINE SYLLABLE DETAILS --
         # This mirrors the haiku style of feedback, giving a breakdown for each line:
         for i, line in enumerate(lines):
-            words = line.strip().split()
-            total_syl_count = count_syllables(line)
-            word_syl_counts = [count_syllables(w) for w in words]
             word_syll_breakdowns = [
-                f"{w} ({'-'.join(breakdown_syllables(w))})"
-                for w in words
+                f"{w} ({'-'.join(chunks)})"
+                for w, chunks in zip(line.words, line.word_breakdowns())
             ]
             feedback.append(
-                f"Line {i+1} (\"{line}\"): {total_syl_count} syllables.\n"
-                f"  Words: {', '.join(words)}\n"
-                f"  Syllables per word: {word_syl_counts}\n"
+                f"Line {i+1} (\"{line.text}\"): {describe_syllables(line)}.\n"
+                f"  Words: {', '.join(line.words)}\n"
+                f"  Syllables per word: {line.word_syllables}\n"
                 f"  Syllable breakdown: {', '.join(word_syll_breakdowns)}"
             )
 
         # -- ADDITIONAL RHYME BREAKDOWN --
-        # Show the last word and phonetic representations for lines that matter.
+        # Show the last word, its rhyming tail and stress pattern for lines that matter.
         # A-rhyme lines: 1, 2, 5 => indices 0, 1, 4
         if num_lines >= 5:
-            lw0, phones0 = _get_last_word_and_phones(lines[0])
-            lw1, phones1 = _get_last_word_and_phones(lines[1])
-            lw4, phones4 = _get_last_word_and_phones(lines[4])
             feedback.append(
                 "A-rhyme detail (lines 1,2,5):\n"
-                f"  - Line 1 last word: '{lw0}' | Phones: {phones0}\n"
-                f"  - Line 2 last word: '{lw1}' | Phones: {phones1}\n"
-                f"  - Line 5 last word: '{lw4}' | Phones: {phones4}\n"
+                f"  - Line 1 last word: '{lines[0].last_word}' | Rhyme: {lines[0].rhyme_ending} | Stress: {lines[0].last_word_stress}\n"
+                f"  - Line 2 last word: '{lines[1].last_word}' | Rhyme: {lines[1].rhyme_ending} | Stress: {lines[1].last_word_stress}\n"
+                f"  - Line 5 last word: '{lines[4].last_word}' | Rhyme: {lines[4].rhyme_ending} | Stress: {lines[4].last_word_stress}\n"
                 f"  => PASS? {a_rhyme_ok}"
             )
 
         # B-rhyme lines: 3, 4 => indices 2, 3
         if num_lines >= 4:
-            lw2, phones2 = _get_last_word_and_phones(lines[2])
-            lw3, phones3 = _get_last_word_and_phones(lines[3])
             feedback.append(
                 "B-rhyme detail (lines 3,4):\n"
-                f"  - Line 3 last word: '{lw2}' | Phones: {phones2}\n"
-                f"  - Line 4 last word: '{lw3}' | Phones: {phones3}\n"
+                f"  - Line 3 last word: '{lines[2].last_word}' | Rhyme: {lines[2].rhyme_ending} | Stress: {lines[2].last_word_stress}\n"
+                f"  - Line 4 last word: '{lines[3].last_word}' | Rhyme: {lines[3].rhyme_ending} | Stress: {lines[3].last_word_stress}\n"
                 f"  => PASS? {b_rhyme_ok}"
             )
 
@@ -236,3 +284,9 @@ class LimerickVerifier(BaseVerifier):
             "score": score,
             "feedback": feedback
         }
+
+    @staticmethod
+    def _syllable_label(line) -> str:
+        """The line's syllable count, or its range ("7-8") if pronunciations differ."""
+        low, high = syllable_range(line)
+        return f"{line.syllables}" if low == high else f"{low}-{high}"
@@ -0,0 +1,126 @@
+# poetry/meter_verifier.py
+import numpy as np
+
+from verifiers.base_verifier import BaseVerifier
+from verifiers.poetry.helpers.meter import FEET, line_meter, meter_distance, meter_pattern
+from verifiers.poetry.helpers.poem_batch import PoemBatch
+from verifiers.poetry.helpers.syllable_utils import preload_lexicon
+from verifiers.poetry.helpers.text_analysis import TextAnalysis
+
+class MeterVerifier(BaseVerifier):
+    def __init__(self):
+        super().__init__(
+            name="meter_verifier",
+            description=("Checks each line's stress pattern against a meter (e.g. iambic pentameter), "
+                         "with partial credit per line."),
+            parameters={
+                "meter": {
+                    "type": "string",
+                    "default": "iambic",
+                    "description": (f"Foot name ({', '.join(FEET)}) or an explicit pattern of "
+                                    "'0' (unstressed), '1' (stressed) and 'x' (either).")
+                },
+                "feet": {
+                    "type": "integer",
+                    "default": 5,
+                    "description": "Feet per line when 'meter' is a foot name (5 => pentameter)."
+                },
+                "tolerance": {
+                    "type": "integer",
+                    "default": 2,
+                    "description": "Allowed edits (misplaced stresses, extra or missing syllables) per line."
+                }
+            }
+        )
+
+    def warm_up(self):
+        preload_lexicon()
+
+    def verify(self, text: str, meter: str = "iambic", feet: int = 5, tolerance: int = 2,
+               analysis: TextAnalysis = None, **kwargs) -> float:
+        """
+        Returns the fraction of non-empty lines whose stress pattern is
+        within 'tolerance' edits of the target meter (0.0 if there are no
+        lines).
+
+        Each word's stress pattern is precomputed (monosyllables and
+        secondary stress match either stress), so a line is scored by
+        joining its words' patterns and one bounded edit distance.
+        Pass a precomputed TextAnalysis of 'text' as 'analysis' to reuse
+        its lexicon lookups.
+        """
+        pattern = meter_pattern(meter, feet)
+        if analysis is not None:
+            lines = analysis.lines
+        else:
+            lines = [l for l in text.strip().split('\n') if l.strip()]
+        if not lines:
+            return 0.0
+
+        on_meter = sum(meter_distance(line_meter(line), pattern, tolerance) <= tolerance for line in lines)
+        return on_meter / len(lines)
+
+    def verify_batch(self, texts: list, meter: str = "iambic", feet: int = 5, tolerance: int = 2,
+                     batch: PoemBatch = None, **kwargs) -> list:
+        """
+        Scores many poems at once with the same rules as verify(). Each
+        distinct line pattern is measured once. Pass a PoemBatch of 'texts'
+        as 'batch' to share it with other verifiers; it must keep every
+        line (max_lines=None), otherwise a fresh one is built.
+        """
+        pattern = meter_pattern(meter, feet)
+        if batch is None or batch.max_lines is not None:
+            batch = PoemBatch(texts)
+
+        # 1) One distance per distinct line pattern
+        meters, line_meter_ids = batch.distinct_line_meters()
+        ok = np.array([meter_distance(m, pattern, tolerance) <= tolerance for m in meters], dtype=np.float64)
+
+        # 2) Lines on meter per poem
+        per_poem = np.bincount(batch.line_poems, weights=ok[line_meter_ids], minlength=len(batch))
+        counts = batch.line_counts
+        return np.where(counts > 0, per_poem / np.maximum(counts, 1), 0.0).tolist()
+
+    def verify_with_feedback(self, text: str, meter: str = "iambic", feet: int = 5, tolerance: int = 2,
+                             analysis: TextAnalysis = None, **kwargs) -> dict:
+        """
+        Returns a dict with:
+          - "score": fraction of lines on meter
+          - "feedback": the target pattern, then each line's stress pattern
+            and its edit distance from the target
+
+        Stress patterns use "1" stressed, "0" unstressed and "x" either
+        (monosyllables, secondary stress, words not in the lexicon).
+        """
+        pattern = meter_pattern(meter, feet)
+        lines = TextAnalysis.of(text, analysis).lines
+        feedback = []
+
+        if not lines:
+            feedback.append("No lines found.")
+            return {
+                "score": 0.0,
+                "feedback": feedback
+            }
+
+        name = meter.strip().lower()
+        target = f"{name} x{feet}" if name in FEET else "pattern"
+        feedback.append(f"Target {target}: {pattern} (allowing {tolerance} edit(s) per line).")
+
+        on_meter = 0
+        for i, line in enumerate(lines, start=1):
+            stresses = line.meter
+            distance = meter_distance(stresses, pattern, tolerance)
+            if distance <= tolerance:
+                on_meter += 1
+                feedback.append(f"Line {i} (\"{line.text}\"): Good ({stresses}, {distance} edit(s)).")
+            else:
+                feedback.append(
+                    f"Line {i} (\"{line.text}\"): {stresses} is more than {tolerance} edit(s) from {pattern} "
+                    f"({len(stresses)} syllables, expected {len(pattern)})."
+                )
+
+        return {
+            "score": on_meter / len(lines),
+            "feedback": feedback
+        }
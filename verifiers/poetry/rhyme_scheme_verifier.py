@@ -0,0 +1,174 @@
+# poetry/rhyme_scheme_verifier.py
+from verifiers.base_verifier import BaseVerifier
+from verifiers.poetry.helpers.rhyme_scheme import check_scheme, parse_scheme
+from verifiers.poetry.helpers.rhyme_utils import rhyme_suggestion
+from verifiers.poetry.helpers.syllable_utils import describe_syllables, preload_lexicon, syllables_within
+from verifiers.poetry.helpers.text_analysis import TextAnalysis
+
+class RhymeSchemeVerifier(BaseVerifier):
+    """
+    Checks a poem against any rhyme scheme, e.g. "AABBA" or "ABAB CDCD EFEF GG".
+
+    Partial credit:
+      1) line_count_fraction = min(num_lines, L) / max(num_lines, L), L = len(scheme)
+      2) rhyme_fraction:       scheme agreement (lines that rhyme with their group's first line)
+      3) syllable_fraction:    lines within 'tolerance' of their syllable target (if the form has targets)
+
+    final_score = line_count_weight * line_count_fraction
+                + rhyme_weight * rhyme_fraction
+                + syllable_weight * syllable_fraction
+
+    Fixed forms subclass this and set the class constants below; the
+    weights passed to verify() default to them.
+    """
+    # 2: rhymes and syllable targets consider every pronunciation
+    VERSION = "2"
+    SCHEME = "ABAB"
+    SYLLABLE_TARGETS = None  # per-line syllable targets, or None to skip the check
+    LINE_COUNT_WEIGHT = 0.2
+    RHYME_WEIGHT = 0.8
+    SYLLABLE_WEIGHT = 0.0
+
+    def __init__(self, name: str = "rhyme_scheme_verifier",
+                 description: str = "Checks if a poem follows a given rhyme scheme, with partial credit.",
+                 parameters: dict = None):
+        super().__init__(
+            name=name,
+            description=description,
+            parameters=parameters if parameters is not None else {
+                "scheme": {
+                    "type": "string",
+                    "default": self.SCHEME,
+                    "description": "Rhyme scheme, one letter per line; spaces separate stanzas (e.g. 'ABAB CDCD EFEF GG')."
+                },
+                **self._weight_parameters()
+            }
+        )
+
+    def _weight_parameters(self) -> dict:
+        return {
+            "line_count_weight": {
+                "type": "float",
+                "default": self.LINE_COUNT_WEIGHT,
+                "description": "Weight for scoring the (partial) line count requirement."
+            },
+            "rhyme_weight": {
+                "type": "float",
+                "default": self.RHYME_WEIGHT,
+                "description": "Weight for scoring the rhyme scheme requirement."
+            },
+        }
+
+    def warm_up(self):
+        preload_lexicon()
+
+    def scheme(self, **kwargs) -> str:
+        """The rhyme scheme to check; the generic verifier takes it as 'scheme='."""
+        return kwargs.get("scheme") or self.SCHEME
+
+    def syllable_targets(self, letters: str, **kwargs) -> list:
+        """Per-line syllable targets for the parsed scheme 'letters', or None."""
+        return self.SYLLABLE_TARGETS
+
+    def _lines(self, text: str, analysis: TextAnalysis):
+        return analysis.lines if analysis is not None else TextAnalysis(text).lines
+
+    def _weights(self, line_count_weight, rhyme_weight, syllable_weight) -> tuple:
+        return (
+            self.LINE_COUNT_WEIGHT if line_count_weight is None else line_count_weight,
+            self.RHYME_WEIGHT if rhyme_weight is None else rhyme_weight,
+            self.SYLLABLE_WEIGHT if syllable_weight is None else syllable_weight,
+        )
+
+    def verify(self, text: str,
+               line_count_weight: float = None,
+               rhyme_weight: float = None,
+               syllable_weight: float = None,
+               tolerance: int = 1,
+               analysis: TextAnalysis = None,
+               **kwargs) -> float:
+        """
+        Returns only the final float score.
+
+        Score-only path: same checks as verify_with_feedback, without the
+        feedback strings or rhyme suggestions.
+        """
+        return self._check(text, line_count_weight, rhyme_weight, syllable_weight,
+                           tolerance, analysis, feedback=None, **kwargs)
+
+    def verify_with_feedback(self, text: str,
+                             line_count_weight: float = None,
+                             rhyme_weight: float = None,
+                             syllable_weight: float = None,
+                             tolerance: int = 1,
+                             analysis: TextAnalysis = None,
+                             **kwargs) -> dict:
+        """
+        Returns a dict with:
+          - "score": float (weighted sum of the three fractions)
+          - "feedback": line count, one message per rhyme group, suggested
+            rhymes for the lines that miss, and off-target syllable counts
+        """
+        feedback = []
+        score = self._check(text, line_count_weight, rhyme_weight, syllable_weight,
+                            tolerance, analysis, feedback=feedback, **kwargs)
+        return {
+            "score": score,
+            "feedback": feedback
+        }
+
+    def _check(self, text, line_count_weight, rhyme_weight, syllable_weight,
+               tolerance, analysis, feedback=None, **kwargs) -> float:
+        line_count_weight, rhyme_weight, syllable_weight = self._weights(
+            line_count_weight, rhyme_weight, syllable_weight
+        )
+        scheme_text = self.scheme(**kwargs)
+        letters = parse_scheme(scheme_text)
+        lines = self._lines(text, analysis)
+        num_lines = len(lines)
+        expected = len(letters)
+
+        # 1) Line count
+        line_count_fraction = min(num_lines, expected) / max(num_lines, expected, 1)
+        if feedback is not None:
+            feedback.append(
+                f"Line count fraction: {line_count_fraction:.2f} "
+                f"(found {num_lines} lines, scheme {scheme_text} needs {expected})."
+            )
+
+        # 2) Rhyme scheme: one rhyme key per line, grouped by scheme letter
+        scheme = check_scheme(lines, letters)
+        rhyme_fraction = scheme.agreement
+        if feedback is not None:
+            feedback.append(f"Rhyme fraction: {rhyme_fraction:.2f} ({scheme.matches}/{scheme.total} lines match).")
+            for group in scheme.rhyme_groups:
+                numbers = ",".join(str(n) for n in group.line_numbers)
+                status = "passed" if group.ok else "failed"
+                feedback.append(
+                    f"{group.letter}-rhyme check {status} (lines {numbers}): "
+                    f"{group.matches}/{len(group.line_numbers)} match."
+                )
+            for number, ref_number in scheme.misses():
+                feedback.append(rhyme_suggestion(lines[number - 1], number, lines[ref_number - 1], ref_number))
+
+        # 3) Syllables per line
+        syllable_fraction = 0.0
+        targets = self.syllable_targets(letters, **kwargs)
+        if targets:
+            on_target = 0
+            for i, (line, target) in enumerate(zip(lines, targets), start=1):
+                if syllables_within(line, target - tolerance, target + tolerance):
+                    on_target += 1
+                elif feedback is not None:
+                    feedback.append(f"Line {i} has {describe_syllables(line)} (expected {target} ± {tolerance}).")
+            syllable_fraction = on_target / len(targets)
+            if feedback is not None:
+                feedback.append(
+                    f"Syllable fraction: {syllable_fraction:.2f} ({on_target}/{len(targets)} lines on target)."
+                )
+
+        return (
+            line_count_weight * line_count_fraction
+            + rhyme_weight * rhyme_fraction
+            + syllable_weight * syllable_fraction
+        )
@@ -1,15 +1,21 @@
 # verifiers/poetry/rhyme_verifier.py
-import re
-import pronouncing
-
 from verifiers.base_verifier import BaseVerifier
 from verifiers.poetry.helpers.syllable_utils import (
-    count_syllables,
-    breakdown_syllables
+    describe_syllables,
+    preload_lexicon
+)
+from verifiers.poetry.helpers.rhyme_utils import (
+    get_rhyme_ending,
+    get_rhyme_tails,
+    rhyme_suggestion,
+    shared_rhyme_tail
 )
-from verifiers.poetry.helpers.rhyme_utils import get_rhyme_ending
+from verifiers.poetry.helpers.text_analysis import TextAnalysis
 
 class RhymeVerifier(BaseVerifier):
+    # 2: rhymes consider every pronunciation of the last words
+    VERSION = "2"
+
     def __init__(self):
         super().__init__(
             name="rhyme_verifier",
@@ -33,24 +39,45 @@ class RhymeVerifier(BaseVerifier):
             }
         )
 
+    def warm_up(self):
+        preload_lexicon()
+
     def verify(self, text: str,
                partial_threshold: float = 0.5,
                fallback_credit: float = 0.5,
+               analysis: TextAnalysis = None,
                **kwargs) -> float:
         """
-        Calls verify_with_feedback, returning only the numeric score.
+        Returns only the numeric score, using the same rules as
+        verify_with_feedback but skipping the per-line syllable breakdowns.
+        Pass a precomputed TextAnalysis of 'text' as 'analysis' to reuse its
+        lexicon lookups.
         """
-        result = self.verify_with_feedback(
-            text,
-            partial_threshold=partial_threshold,
-            fallback_credit=fallback_credit,
-            **kwargs
-        )
-        return result["score"]
+        if analysis is not None:
+            lines = analysis.lines
+        else:
+            lines = [l for l in text.strip().split('\n') if l.strip()]
+        if len(lines) < 2:
+            return 0.0
+
+        line1, line2 = lines[0], lines[1]
+        end1 = get_rhyme_ending(line1)
+        end2 = get_rhyme_ending(line2)
+        if not end1 or not end2:
+            return 0.0
+        if shared_rhyme_tail(line1, line2):
+            return 1.0
+
+        overlap_ratio = self._best_overlap_ratio(line1, line2)
+        if overlap_ratio is not None and overlap_ratio >= partial_threshold:
+            return overlap_ratio
+        score, _ = self._check_last_letter_fallback(str(line1), str(line2), fallback_credit)
+        return score
 
     def verify_with_feedback(self, text: str,
                              partial_threshold: float = 0.5,
                              fallback_credit: float = 0.5,
+                             analysis: TextAnalysis = None,
                              **kwargs) -> dict:
         """
         Returns:
@@ -68,7 +95,7 @@ class RhymeVerifier(BaseVerifier):
             - If partial overlap >= partial_threshold => overlap ratio
             - Else fallback to last-letter check => fallback_credit or 0.0
         """
-        lines = [l for l in text.strip().split('\n') if l.strip()]
+        lines = TextAnalysis.of(text, analysis).lines
         feedback = []
 
         # ---- 1) Check that we have at least 2 lines ----
@@ -79,17 +106,14 @@ class RhymeVerifier(BaseVerifier):
         # ---- 2) Per-line breakdown feedback ----
         # Provide the same style as Haiku/Limerick: total syllables, words, breakdowns.
         for i, line in enumerate(lines):
-            words = line.strip().split()
-            total_syl_count = count_syllables(line)
-            word_syl_counts = [count_syllables(w) for w in words]
             word_syll_breakdowns = [
-                f"{w} ({'-'.join(breakdown_syllables(w))})"
-                for w in words
+                f"{w} ({'-'.join(chunks)})"
+                for w, chunks in zip(line.words, line.word_breakdowns())
             ]
             feedback.append(
-                f"Line {i+1} (\"{line}\"): {total_syl_count} syllables.\n"
-                f"  Words: {', '.join(words)}\n"
-                f"  Syllables per word: {word_syl_counts}\n"
+                f"Line {i+1} (\"{line.text}\"): {describe_syllables(line)}.\n"
+                f"  Words: {', '.join(line.words)}\n"
+                f"  Syllables per word: {line.word_syllables}\n"
                 f"  Syllable breakdown: {', '.join(word_syll_breakdowns)}"
             )
 
@@ -107,30 +131,23 @@ class RhymeVerifier(BaseVerifier):
         feedback.append(f"Line 1 rhyme ending: {end1}")
         feedback.append(f"Line 2 rhyme ending: {end2}")
 
-        # Perfect rhyme check
-        if end1 == end2:
-            feedback.append(f"Perfect rhyme: both lines share '{end1}'.")
+        # Perfect rhyme check (any pronunciation of either last word)
+        shared = shared_rhyme_tail(line1, line2)
+        if shared:
+            feedback.append(f"Perfect rhyme: both lines share '{shared}'.")
             return {"score": 1.0, "feedback": feedback}
 
+        # Not a perfect rhyme: suggest words that would be
+        feedback.append(rhyme_suggestion(line2, 2, line1, 1))
+
         # Compute phoneme overlap ratio
-        tail1 = end1.split('-')
-        tail2 = end2.split('-')
-        overlap_count = 0
-        i1, i2 = len(tail1) - 1, len(tail2) - 1
-        
-        while i1 >= 0 and i2 >= 0 and tail1[i1] == tail2[i2]:
-            overlap_count += 1
-            i1 -= 1
-            i2 -= 1
-        
-        max_possible = min(len(tail1), len(tail2))
-        if max_possible == 0:
+        overlap_ratio = self._best_overlap_ratio(line1, line2)
+        if overlap_ratio is None:
             # fallback last letter
-            score, fallback_msg = self._check_last_letter_fallback(line1, line2, fallback_credit)
+            score, fallback_msg = self._check_last_letter_fallback(line1.text, line2.text, fallback_credit)
             feedback.append(fallback_msg)
             return {"score": score, "feedback": feedback}
 
-        overlap_ratio = overlap_count / max_possible
         feedback.append(f"Overlap ratio: {overlap_ratio:.2f} (threshold={partial_threshold}).")
 
         # Compare overlap ratio to threshold
@@ -140,10 +157,40 @@ class RhymeVerifier(BaseVerifier):
             return {"score": overlap_ratio, "feedback": feedback}
         
         # fallback letter
-        score, fallback_msg = self._check_last_letter_fallback(line1, line2, fallback_credit)
+        score, fallback_msg = self._check_last_letter_fallback(line1.text, line2.text, fallback_credit)
         feedback.append(fallback_msg)
         return {"score": score, "feedback": feedback}
 
+    def _best_overlap_ratio(self, line1, line2):
+        """Highest _overlap_ratio over the pronunciations of both last words."""
+        ratios = [
+            self._overlap_ratio(end1, end2)
+            for end1 in get_rhyme_tails(line1) for end2 in get_rhyme_tails(line2)
+        ]
+        ratios = [r for r in ratios if r is not None]
+        return max(ratios) if ratios else None
+
+    @staticmethod
+    def _overlap_ratio(end1: str, end2: str):
+        """
+        Fraction of phonemes shared at the end of two rhyme tails
+        (e.g. 'AE1-T' vs 'AH1-T' => 0.5), or None if either tail is empty.
+        """
+        tail1 = end1.split('-')
+        tail2 = end2.split('-')
+        overlap_count = 0
+        i1, i2 = len(tail1) - 1, len(tail2) - 1
+
+        while i1 >= 0 and i2 >= 0 and tail1[i1] == tail2[i2]:
+            overlap_count += 1
+            i1 -= 1
+            i2 -= 1
+
+        max_possible = min(len(tail1), len(tail2))
+        if max_possible == 0:
+            return None
+        return overlap_count / max_possible
+
     def _check_last_letter_fallback(self, line1: str, line2: str, fallback_credit: float) -> tuple:
         """
         If the last letters match, return (fallback_credit, message), else (0.0, msg).
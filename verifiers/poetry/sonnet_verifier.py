@@ -0,0 +1,36 @@
+# poetry/sonnet_verifier.py
+from verifiers.poetry.rhyme_scheme_verifier import RhymeSchemeVerifier
+
+class SonnetVerifier(RhymeSchemeVerifier):
+    """
+    A Shakespearean sonnet: three quatrains and a couplet rhyming
+    ABAB CDCD EFEF GG, with ~10 syllables (iambic pentameter) per line.
+    """
+    SCHEME = "ABAB CDCD EFEF GG"
+    SYLLABLE_TARGETS = [10] * 14
+    LINE_COUNT_WEIGHT = 0.2
+    RHYME_WEIGHT = 0.5
+    SYLLABLE_WEIGHT = 0.3
+
+    def __init__(self):
+        super().__init__(
+            name="sonnet_verifier",
+            description=("Checks if a poem is a Shakespearean sonnet with partial credit: "
+                         "14 lines, ABAB CDCD EFEF GG rhyme scheme, ~10 syllables per line."),
+            parameters={
+                **self._weight_parameters(),
+                "syllable_weight": {
+                    "type": "float",
+                    "default": self.SYLLABLE_WEIGHT,
+                    "description": "Weight for scoring the syllables-per-line requirement."
+                },
+                "tolerance": {
+                    "type": "integer",
+                    "default": 1,
+                    "description": "Allowed +/- deviation from 10 syllables per line."
+                }
+            }
+        )
+
+    def scheme(self, **kwargs) -> str:
+        return self.SCHEME
@@ -1,8 +1,13 @@
 # poetry/tanka_verifier.py
 from verifiers.base_verifier import BaseVerifier
-from verifiers.poetry.helpers.syllable_utils import count_syllables
+from verifiers.poetry.helpers.syllable_utils import describe_syllables, preload_lexicon, syllables_within
+from verifiers.poetry.helpers.poem_batch import PoemBatch
+from verifiers.poetry.helpers.text_analysis import TextAnalysis
 
 class TankaVerifier(BaseVerifier):
+    # 2: a line passes if any pronunciation of its words is on target
+    VERSION = "2"
+
     def __init__(self):
         super().__init__(
             name="tanka_verifier",
@@ -16,17 +21,40 @@ class TankaVerifier(BaseVerifier):
             }
         )
 
-    def verify(self, text: str, tolerance: int = 1, **kwargs) -> float:
+    def warm_up(self):
+        preload_lexicon()
+
+    def verify(self, text: str, tolerance: int = 1, analysis: TextAnalysis = None, **kwargs) -> float:
         """
         Returns a partial-credit score in [0,1].
         If there aren't exactly 5 lines, we return 0.0 immediately (like a strict approach).
         Otherwise, each line that meets its target (5 or 7 ± tolerance) yields 1 point.
         final_score = correct_lines / 5
+
+        Score-only path: no feedback strings are built. Pass a precomputed
+        TextAnalysis of 'text' as 'analysis' to reuse its lexicon lookups.
+        """
+        if analysis is not None:
+            lines = analysis.lines
+        else:
+            lines = [ln for ln in text.strip().split('\n') if ln.strip()]
+        if len(lines) != 5:
+            return 0.0
+
+        correct_lines = 0
+        for line, target in zip(lines, (5, 7, 5, 7, 7)):
+            if syllables_within(line, target - tolerance, target + tolerance):
+                correct_lines += 1
+        return correct_lines / 5.0
+
+    def verify_batch(self, texts: list, tolerance: int = 1, batch: PoemBatch = None, **kwargs) -> list:
+        """
+        Scores many poems at once with the same rules as verify(). Pass a
+        PoemBatch of 'texts' as 'batch' to share it with other verifiers.
         """
-        result = self.verify_with_feedback(text, tolerance=tolerance, **kwargs)
-        return result["score"]
+        return PoemBatch.of(texts, batch, max_lines=5).score_line_targets((5, 7, 5, 7, 7), tolerance)
 
-    def verify_with_feedback(self, text: str, tolerance: int = 1, **kwargs) -> dict:
+    def verify_with_feedback(self, text: str, tolerance: int = 1, analysis: TextAnalysis = None, **kwargs) -> dict:
         """
         Returns a dict with:
           - "score": float in [0,1]
@@ -34,7 +62,10 @@ class TankaVerifier(BaseVerifier):
 
         Tanka: 5 lines => 5,7,5,7,7 each (± tolerance).
         """
-        lines = [ln for ln in text.strip().split('\n') if ln.strip()]
+        if analysis is not None:
+            lines = analysis.lines
+        else:
+            lines = [ln for ln in text.strip().split('\n') if ln.strip()]
         feedback = []
         
         # Must have exactly 5 lines for a standard tanka
@@ -50,19 +81,19 @@ class TankaVerifier(BaseVerifier):
         line_feedback = []
 
         for i, line in enumerate(lines):
-            syl_count = count_syllables(line)
+            syl_count = describe_syllables(line)
             target = desired_syllables[i]
             low = target - tolerance
             high = target + tolerance
 
-            if low <= syl_count <= high:
+            if syllables_within(line, low, high):
                 correct_lines += 1
                 line_feedback.append(
-                    f"Line {i+1}: Good ({syl_count} syllables, expected ~{target})."
+                    f"Line {i+1}: Good ({syl_count}, expected ~{target})."
                 )
             else:
                 line_feedback.append(
-                    f"Line {i+1}: {syl_count} syllables (expected ~{target})."
+                    f"Line {i+1}: {syl_count} (expected ~{target})."
                 )
 
         # partial-credit score
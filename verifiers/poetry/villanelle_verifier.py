@@ -1,14 +1,34 @@
 # villanelle_verifier.py
+import string
+
 from verifiers.base_verifier import BaseVerifier
-from verifiers.poetry.helpers.rhyme_utils import lines_rhyme
+from verifiers.helpers.alignment import align, edit_distance, format_diff
+from verifiers.poetry.helpers.rhyme_scheme import check_scheme
+from verifiers.poetry.helpers.rhyme_utils import rhyme_suggestion
+from verifiers.poetry.helpers.syllable_utils import preload_lexicon
+from verifiers.poetry.helpers.text_analysis import TextAnalysis
 
 class VillanelleVerifier(BaseVerifier):
+    # 2: rhymes consider every pronunciation
+    # 3: near-miss refrains get partial credit (word edit distance)
+    VERSION = "3"
+
+    # Refrains: (source line, line that must repeat it), 1-based
+    REQUIRED_REPETITIONS = [
+        (1, 6), (1, 12), (1, 18),
+        (3, 9), (3, 15), (3, 19),
+    ]
+    # Five tercets and a quatrain on two rhymes:
+    # A lines => 1,3,4,6,7,9,10,12,13,15,16,18,19, B lines => 2,5,8,11,14,17
+    RHYME_SCHEME = "ABA ABA ABA ABA ABA ABAA"
+
     def __init__(self):
         """
         A naive villanelle checker with partial-credit approach:
 
          1) line_count_fraction = min(num_lines,19) / 19
-         2) repetition_fraction: among the 6 required refrain lines, how many exist & match?
+         2) repetition_fraction: among the 6 required refrain lines, how closely does each
+            existing one repeat its source line? (word-level similarity, 1.0 = exact)
          3) rhyme_fraction: among the A/B lines, how many exist & match?
 
         Weighted sum:
@@ -39,27 +59,69 @@ class VillanelleVerifier(BaseVerifier):
             }
         )
     
+    def warm_up(self):
+        preload_lexicon()
+
+    @staticmethod
+    def _refrain_words(line) -> list:
+        """Lowercase words of a line, without surrounding punctuation ("night." == "night")."""
+        words = (w.strip(string.punctuation) for w in str(line).lower().split())
+        return [w for w in words if w]
+
+    @classmethod
+    def _refrain_similarity(cls, source, repeat) -> tuple:
+        """
+        (similarity, source words, repeat words): 1 - word edit distance /
+        longer line, so one changed word in an 8-word refrain scores 0.875
+        instead of 0.
+        """
+        src_words, dest_words = cls._refrain_words(source), cls._refrain_words(repeat)
+        longest = max(len(src_words), len(dest_words))
+        if not longest:
+            return 1.0, src_words, dest_words
+        return 1.0 - edit_distance(src_words, dest_words) / longest, src_words, dest_words
+
     def verify(self, text: str,
                repetition_weight: float = 0.4,
                rhyme_weight: float = 0.4,
                line_count_weight: float = 0.2,
+               analysis: TextAnalysis = None,
                **kwargs) -> float:
         """
         Returns only the final float score in [0,1].
+
+        Score-only path: same checks as verify_with_feedback, without the
+        feedback strings. Pass a precomputed TextAnalysis of 'text' as
+        'analysis' to reuse its lexicon lookups.
         """
-        result = self.verify_with_feedback(
-            text,
-            repetition_weight=repetition_weight,
-            rhyme_weight=rhyme_weight,
-            line_count_weight=line_count_weight,
-            **kwargs
+        if analysis is not None:
+            analyzed = analysis.lines
+            lines = [l.text for l in analyzed]
+        else:
+            lines = analyzed = [l for l in text.strip().split('\n') if l.strip()]
+        num_lines = len(lines)
+
+        line_count_fraction = min(num_lines, 19) / 19.0
+
+        repetition_credit = 0.0
+        for (src, dest) in self.REQUIRED_REPETITIONS:
+            if dest <= num_lines:
+                repetition_credit += self._refrain_similarity(lines[src - 1], lines[dest - 1])[0]
+        repetition_fraction = repetition_credit / len(self.REQUIRED_REPETITIONS)
+
+        rhyme_fraction = check_scheme(analyzed, self.RHYME_SCHEME).agreement
+
+        return (
+            line_count_weight * line_count_fraction
+            + repetition_weight * repetition_fraction
+            + rhyme_weight * rhyme_fraction
         )
-        return result["score"]
 
     def verify_with_feedback(self, text: str,
                              repetition_weight: float = 0.4,
                              rhyme_weight: float = 0.4,
                              line_count_weight: float = 0.2,
+                             analysis: TextAnalysis = None,
                              **kwargs) -> dict:
         """
         Returns a dict: {
@@ -69,7 +131,8 @@ class VillanelleVerifier(BaseVerifier):
 
         PARTIAL CREDIT:
           - line_count_fraction = min(num_lines,19)/19
-          - repetition_fraction = (correct_repetitions)/(6)
+          - repetition_fraction = (sum of refrain similarities)/(6), where an
+            exact repeat is 1.0 and a near miss loses 1/len per word edit
           - rhyme_fraction = (correct A + correct B) / (total A + total B)
 
         final_score = line_count_weight*line_count_fraction
@@ -78,7 +141,8 @@ class VillanelleVerifier(BaseVerifier):
         (capped at 1.0 if the sum goes above 1? Or let it exceed 1 if weights sum >1. 
         We'll keep it unbounded by default, or you can clamp if desired.)
         """
-        lines = [l for l in text.strip().split('\n') if l.strip()]
+        analyzed = TextAnalysis.of(text, analysis).lines
+        lines = [l.text for l in analyzed]
         feedback = []
         num_lines = len(lines)
 
@@ -90,59 +154,50 @@ class VillanelleVerifier(BaseVerifier):
 
         # 2) Repetition fraction
         #    (1,6), (1,12), (1,18), (3,9), (3,15), (3,19)
-        required_repetitions = [
-            (1, 6), (1, 12), (1, 18),
-            (3, 9), (3, 15), (3, 19),
-        ]
+        required_repetitions = self.REQUIRED_REPETITIONS
         correct_repetitions = 0
+        repetition_credit = 0.0
+        refrain_feedback = []
         valid_checks = 0  # how many repetition checks we can actually perform
 
         for (src, dest) in required_repetitions:
             if src <= num_lines and dest <= num_lines:
                 valid_checks += 1
-                line_src = lines[src - 1].strip().lower()
-                line_dest = lines[dest - 1].strip().lower()
-                if line_src == line_dest:
+                similarity, src_words, dest_words = self._refrain_similarity(lines[src - 1], lines[dest - 1])
+                repetition_credit += similarity
+                if similarity == 1.0:
                     correct_repetitions += 1
+                else:
+                    refrain_feedback.append(
+                        f"Refrain at line {dest} differs from line {src} ({similarity:.2f} similar): "
+                        f"{format_diff(align(src_words, dest_words))}"
+                    )
 
         # If the poem doesn't have lines 6, 12, 18, etc., those checks can't pass => remain 0.
         # fraction = correct / 6 if we do a strict approach 
         # or fraction = correct / valid_checks if we only hold the poem responsible for lines that do exist. 
         # We'll do the strict approach: each missing line is an automatic fail.
-        repetition_fraction = correct_repetitions / len(required_repetitions)
+        repetition_fraction = repetition_credit / len(required_repetitions)
         feedback.append(
             f"Repetition fraction: {repetition_fraction:.2f} "
             f"({correct_repetitions} matched out of 6 total checks)."
         )
+        feedback.extend(refrain_feedback)
 
         # 3) Rhyme fraction
-        #    A lines => 1,3,4,6,7,9,10,12,13,15,16,18,19
-        #    B lines => 2,5,8,11,14,17
-        a_indices = [1,3,4,6,7,9,10,12,13,15,16,18,19]
-        b_indices = [2,5,8,11,14,17]
-        
-        a_correct = 0
-        b_correct = 0
-        for idx in a_indices:
-            # If line doesn't exist, can't pass
-            if idx <= num_lines:
-                if lines_rhyme(lines[0], lines[idx - 1]):
-                    a_correct += 1
-        
-        for idx in b_indices:
-            if idx <= num_lines:
-                if lines_rhyme(lines[1], lines[idx - 1]):
-                    b_correct += 1
-        
-        total_a = len(a_indices)
-        total_b = len(b_indices)
-        # fraction = (a_correct + b_correct) / (total_a + total_b) 
-        # missing lines => no partial
-        rhyme_fraction = (a_correct + b_correct) / (total_a + total_b)
+        #    Each line's rhyme key is computed once; A lines must rhyme with
+        #    line 1 and B lines with line 2. Missing lines => no partial.
+        scheme = check_scheme(analyzed, self.RHYME_SCHEME)
+        a_group, b_group = scheme.group("A"), scheme.group("B")
+        rhyme_fraction = scheme.agreement
         feedback.append(
             f"Rhyme fraction: {rhyme_fraction:.2f} "
-            f"(A matches={a_correct}/{total_a}, B matches={b_correct}/{total_b})."
+            f"(A matches={a_group.matches}/{len(a_group.line_numbers)}, "
+            f"B matches={b_group.matches}/{len(b_group.line_numbers)})."
         )
+        # Suggest replacements for the lines that miss their rhyme
+        for number, ref_number in scheme.misses():
+            feedback.append(rhyme_suggestion(analyzed[number - 1], number, analyzed[ref_number - 1], ref_number))
 
         # Weighted sum
         final_score = (
@@ -1,11 +1,16 @@
 # verifiers/reasoning/answer_satisfaction_verifier.py
-import re
+import asyncio
 import json
 import logging
+from typing import List
+
 from ollama import chat
-from pydantic import BaseModel
+from pydantic import BaseModel, RootModel
 
 from verifiers.base_verifier import BaseVerifier
+from verifiers.reasoning.helpers.judge_cache import JudgeCache, default_judge_cache
+from verifiers.reasoning.helpers.judge_client import JudgeClient, default_judge_client
+from verifiers.reasoning.helpers.tag_scanner import describe_missing, find_section, scan_tags
 
 
 class AnswerEvaluation(BaseModel):
@@ -13,6 +18,22 @@ class AnswerEvaluation(BaseModel):
     feedback: str
 
 
+class IndexedAnswerEvaluation(AnswerEvaluation):
+    """One verdict of a batched judge call; 'index' is the answer's position in the prompt."""
+    index: int
+
+
+class AnswerEvaluations(RootModel[List[IndexedAnswerEvaluation]]):
+    """The structured output of a batched judge call: a JSON array of verdicts."""
+
+
+SCORING_CRITERIA = """### SCORING CRITERIA
+1. If the answer is correct, start from 1.0.
+2. Deduct up to 0.1 if clarity, grammar, or style are significantly lacking.
+3. Deduct up to 0.1 if the answer doesn't reference the key part of the question (like the numbers or statement).
+4. Never reduce the score below 0.0."""
+
+
 class AnswerSatisfactionVerifier(BaseVerifier):
     """
     A verifier that:
@@ -25,13 +46,30 @@ class AnswerSatisfactionVerifier(BaseVerifier):
          }
       4) Returns 0.0 if there's any error or parsing issue.
 
+    averify_with_feedback() makes the same call through the pooled async
+    JudgeClient, so the server does not hold a thread per judge call.
+
+    Verdicts are looked up in, and saved to, the persistent JudgeCache
+    (if one is configured), keyed by model, PROMPT_VERSION, answer,
+    question and gold answer; only successful verdicts are cached.
+
+    verify_batch() / averify_batch() judge the answers to one question
+    (e.g. a GRPO group) together: up to MAX_BATCH_ANSWERS distinct
+    answers per structured-output call, returning a JSON array of
+    {index, score, feedback}. Answers the judge's output does not cover,
+    or a whole batch whose output does not parse, fall back to one call
+    per answer.
+
     Additional nuance:
       - Penalizes slightly if the user's answer does NOT restate the question in some form.
     """
+    # Identifies the judge prompts in cached verdicts; bump it whenever either prompt changes
+    PROMPT_VERSION = "1"
+    # Distinct answers packed into one batched judge call
+    MAX_BATCH_ANSWERS = 16
 
-    ANSWER_PATTERN = re.compile(r"<answer>(.*?)</answer>", re.DOTALL | re.IGNORECASE)
-
-    def __init__(self, name="satisfaction_verifier", default_model="granite3.1-dense"):
+    def __init__(self, name="satisfaction_verifier", default_model="granite3.1-dense",
+                 judge: JudgeClient = None, cache: JudgeCache = None):
         super().__init__(
             name=name,
             description=(
@@ -42,35 +80,251 @@ class AnswerSatisfactionVerifier(BaseVerifier):
         )
         self.logger = logging.getLogger(name)
         self.default_model = default_model
+        self._judge = judge
+        self._cache = cache
 
     def verify(self, text: str, **kwargs) -> float:
         """Returns only the numeric score."""
         result = self.verify_with_feedback(text, **kwargs)
         return result["score"]
 
+    @property
+    def judge(self) -> JudgeClient:
+        """The async judge client: the one passed in, else the process-wide default."""
+        return self._judge or default_judge_client()
+
+    @property
+    def cache(self):
+        """The verdict cache: the one passed in, else the process-wide one from the environment (or None)."""
+        return self._cache if self._cache is not None else default_judge_cache()
+
     def verify_with_feedback(self, text: str, **kwargs) -> dict:
         """
         Returns a dict with {"score": float, "feedback": [str, ...]}.
         Expects 'question' and 'gold_answer' in kwargs.
+
+        Calls the judge synchronously; the server uses averify_with_feedback.
         """
         feedback = []
-        question = kwargs.get("question", "No question provided")
-        gold_answer = kwargs.get("gold_answer", "No gold answer provided")
+        answer = self._extract_answer(text, feedback)
+        if answer is None:
+            return {"score": 0.0, "feedback": feedback}
 
-        # 1) Extract the user's <answer>
-        answer_match = self.ANSWER_PATTERN.search(text)
-        if not answer_match:
-            feedback.append("No <answer>...</answer> found => score=0.0.")
+        key, cached = self._cached_verdict(answer, kwargs, feedback)
+        if cached is not None:
+            return cached
+        return self._call_judge(key, answer, feedback)
+
+    async def averify(self, text: str, **kwargs) -> float:
+        """Async verify(): awaits the judge without blocking a thread."""
+        result = await self.averify_with_feedback(text, **kwargs)
+        return result["score"]
+
+    async def averify_with_feedback(self, text: str, **kwargs) -> dict:
+        """
+        Same as verify_with_feedback, but the judge call goes through the
+        pooled async JudgeClient (concurrency limit, timeout, retries).
+        """
+        feedback = []
+        answer = self._extract_answer(text, feedback)
+        if answer is None:
             return {"score": 0.0, "feedback": feedback}
 
-        answer = answer_match.group(1).strip()
+        key, cached = await self._acached_verdict(answer, kwargs, feedback)
+        if cached is not None:
+            return cached
+        return await self._acall_judge(key, answer, feedback)
+
+    def verify_batch(self, texts: list, **kwargs) -> list:
+        """Scores many answers to the same question with batched judge calls."""
+        return [result["score"] for result in self.verify_batch_with_feedback(texts, **kwargs)]
+
+    def verify_batch_with_feedback(self, texts: list, **kwargs) -> list:
+        """
+        verify_with_feedback() for many answers to the same question: one
+        judge call per MAX_BATCH_ANSWERS distinct uncached answers.
+        """
+        results, pending = self._start_batch(texts, kwargs)
+        for chunk in self._chunks(pending):
+            if len(chunk) == 1:
+                verdicts = {}
+            else:
+                try:
+                    response = chat(
+                        model=self.default_model,
+                        messages=[{"role": "system", "content": self._build_batch_prompt([a for a, _ in chunk])}],
+                        format=AnswerEvaluations.model_json_schema(),
+                    )
+                    verdicts = self._parse_batch(response.message.content, len(chunk))
+                except Exception as e:
+                    verdicts = self._batch_failed(e, len(chunk))
+            for i, (answer, key) in enumerate(chunk):
+                result = verdicts.get(i)
+                if result is None:
+                    result = self._call_judge(key, answer, [])
+                else:
+                    self._save_verdict(key, result)
+                self._fill(results, pending[answer], result)
+        return results
+
+    async def averify_batch(self, texts: list, **kwargs) -> list:
+        """Async verify_batch(): the batched judge calls run concurrently."""
+        return [result["score"] for result in await self.averify_batch_with_feedback(texts, **kwargs)]
+
+    async def averify_batch_with_feedback(self, texts: list, **kwargs) -> list:
+        """Async verify_batch_with_feedback(), through the pooled JudgeClient."""
+        results, pending = await self._astart_batch(texts, kwargs)
+
+        async def judge_chunk(chunk: list):
+            verdicts = {}
+            if len(chunk) > 1:
+                try:
+                    llm_output = await self.judge.chat(
+                        model=self.default_model,
+                        messages=[{"role": "system", "content": self._build_batch_prompt([a for a, _ in chunk])}],
+                        format=AnswerEvaluations.model_json_schema(),
+                    )
+                    verdicts = self._parse_batch(llm_output, len(chunk))
+                except Exception as e:
+                    verdicts = self._batch_failed(e, len(chunk))
+            fallbacks = []
+            for i, (answer, key) in enumerate(chunk):
+                if i in verdicts:
+                    await self._asave_verdict(key, verdicts[i])
+                    self._fill(results, pending[answer], verdicts[i])
+                else:
+                    fallbacks.append((answer, key))
+            individual = await asyncio.gather(*[self._acall_judge(key, answer, []) for answer, key in fallbacks])
+            for (answer, _), result in zip(fallbacks, individual):
+                self._fill(results, pending[answer], result)
+
+        await asyncio.gather(*[judge_chunk(chunk) for chunk in self._chunks(pending)])
+        return results
+
+    @staticmethod
+    def _extract_answer(text: str, feedback: list):
+        """1) The stripped <answer> content, or None (with the reason added to 'feedback')."""
+        tags = scan_tags(text)
+        section = find_section(text, "answer", tags)
+        if section is None:
+            feedback.append("No <answer>...</answer> found => score=0.0.")
+            feedback.append(describe_missing(text, "answer", tags))
+            return None
+
+        answer = section.content.strip()
         if not answer:
             feedback.append("No <answer>...</answer> found => score=0.0.")
-            return {"score": 0.0, "feedback": feedback}
+            return None
+        return answer
+
+    def _cached_verdict(self, answer: str, kwargs: dict, feedback: list) -> tuple:
+        """
+        (cache key, cached result or None). The key is None when no cache
+        is configured.
+        """
+        cache = self.cache
+        if cache is None:
+            return None, None
+        key = cache.make_key(self.default_model, self.PROMPT_VERSION, answer,
+                             kwargs.get("question"), kwargs.get("gold_answer"))
+        verdict = cache.get(key)
+        if verdict is None:
+            return key, None
+        feedback.extend(verdict["feedback"])
+        return key, {"score": verdict["score"], "feedback": feedback}
+
+    async def _acached_verdict(self, answer: str, kwargs: dict, feedback: list) -> tuple:
+        """_cached_verdict() on a worker thread, so the SQLite lookup does not block the event loop."""
+        if self.cache is None:
+            return None, None
+        return await asyncio.to_thread(self._cached_verdict, answer, kwargs, feedback)
+
+    def _save_verdict(self, key: str, result: dict):
+        if key is not None:
+            self.cache.put(key, result)
+
+    async def _asave_verdict(self, key: str, result: dict):
+        """_save_verdict() on a worker thread, so the disk write does not block the event loop."""
+        if key is not None:
+            await asyncio.to_thread(self.cache.put, key, result)
+
+    def _call_judge(self, key: str, answer: str, feedback: list) -> dict:
+        """3) One synchronous judge call for 'answer'; saves the verdict under 'key'."""
+        try:
+            # 3) Call Ollama with the structured output format
+            response = chat(
+                model=self.default_model,
+                messages=[{"role": "system", "content": self._build_prompt(answer)}],
+                format=AnswerEvaluation.model_json_schema(),
+            )
+            result = self._parse_evaluation(response.message.content, feedback)
+        except Exception as e:
+            return self._error_result(e, feedback)
+        self._save_verdict(key, result)
+        return result
 
-        # 2) Build the system prompt
-        #    Include instructions to penalize if the question isn't referenced at all.
-        prompt = f"""
+    async def _acall_judge(self, key: str, answer: str, feedback: list) -> dict:
+        """3) _call_judge() through the async JudgeClient."""
+        try:
+            # 3) Call Ollama with the structured output format
+            llm_output = await self.judge.chat(
+                model=self.default_model,
+                messages=[{"role": "system", "content": self._build_prompt(answer)}],
+                format=AnswerEvaluation.model_json_schema(),
+            )
+            result = self._parse_evaluation(llm_output, feedback)
+        except Exception as e:
+            return self._error_result(e, feedback)
+        await self._asave_verdict(key, result)
+        return result
+
+    def _start_batch(self, texts: list, kwargs: dict) -> tuple:
+        """
+        The batch's results so far (answerless texts and cached verdicts
+        filled in, None elsewhere) and the answers left to judge:
+        {answer: (cache key, [indices of the texts giving that answer])}.
+        """
+        results = [None] * len(texts)
+        pending = {}
+        for idx, text in enumerate(texts):
+            feedback = []
+            answer = self._extract_answer(text, feedback)
+            if answer is None:
+                results[idx] = {"score": 0.0, "feedback": feedback}
+            elif answer in pending:
+                pending[answer][1].append(idx)
+            else:
+                key, cached = self._cached_verdict(answer, kwargs, feedback)
+                if cached is not None:
+                    results[idx] = cached
+                else:
+                    pending[answer] = (key, [idx])
+        return results, pending
+
+    async def _astart_batch(self, texts: list, kwargs: dict) -> tuple:
+        """_start_batch() on a worker thread when there is a cache, for the same reason."""
+        if self.cache is None:
+            return self._start_batch(texts, kwargs)
+        return await asyncio.to_thread(self._start_batch, texts, kwargs)
+
+    def _chunks(self, pending: dict) -> list:
+        """The pending answers as lists of (answer, cache key), MAX_BATCH_ANSWERS at a time."""
+        items = [(answer, key) for answer, (key, _) in pending.items()]
+        return [items[i:i + self.MAX_BATCH_ANSWERS] for i in range(0, len(items), self.MAX_BATCH_ANSWERS)]
+
+    @staticmethod
+    def _fill(results: list, entry: tuple, result: dict):
+        """Gives every text with the same answer its own copy of the result."""
+        for idx in entry[1]:
+            results[idx] = {"score": result["score"], "feedback": list(result["feedback"])}
+
+    @staticmethod
+    def _build_prompt(answer: str) -> str:
+        """
+        2) The system prompt. Includes instructions to penalize if the
+        question isn't referenced at all.
+        """
+        return f"""
 You are an AI scoring engine. Return valid JSON:
 
 {{
@@ -78,11 +332,7 @@ You are an AI scoring engine. Return valid JSON:
   "feedback": "<short explanation>"
 }}
 
-### SCORING CRITERIA
-1. If the answer is correct, start from 1.0.
-2. Deduct up to 0.1 if clarity, grammar, or style are significantly lacking.
-3. Deduct up to 0.1 if the answer doesn't reference the key part of the question (like the numbers or statement).
-4. Never reduce the score below 0.0.
+{SCORING_CRITERIA}
 
 ### USER’S ANSWER
 {answer}
@@ -96,29 +346,75 @@ You are an AI scoring engine. Return valid JSON:
 }}
 """
 
-        try:
-            # 3) Call Ollama with the structured output format
-            response = chat(
-                model=self.default_model,
-                messages=[{"role": "system", "content": prompt}],
-                format=AnswerEvaluation.model_json_schema(),
-            )
-            llm_output = response.message.content.strip()
-            self.logger.debug(f"Raw LLM output: {llm_output}")
+    @staticmethod
+    def _build_batch_prompt(answers: list) -> str:
+        """2) The system prompt for judging several answers in one call, each scored on its own."""
+        listed = "\n\n".join(f"### ANSWER {index}\n{answer}" for index, answer in enumerate(answers))
+        return f"""
+You are an AI scoring engine. Score each of the {len(answers)} answers below independently.
+Return a valid JSON array with exactly one object per answer:
 
-            # 4) Parse JSON into our Pydantic model
-            evaluation = AnswerEvaluation.model_validate_json(llm_output)
+[
+  {{"index": <answer number>, "score": <float in [0.0, 1.0]>, "feedback": "<short explanation>"}},
+  ...
+]
 
-            # 5) Clamp score
-            clamped_score = max(0.0, min(evaluation.score, 1.0))
+{SCORING_CRITERIA}
 
-            if evaluation.feedback:
-                feedback.append(f"LLM feedback: {evaluation.feedback}")
+### USER’S ANSWERS
+{listed}
 
-            return {"score": clamped_score, "feedback": feedback}
+### INSTRUCTIONS
+- Provide a final JSON array with "index", "score" and "feedback" for answers 0 to {len(answers) - 1}.
+- Example:
+[
+  {{"index": 0, "score": 1.0, "feedback": "Perfectly addresses the question and is written clearly."}},
+  {{"index": 1, "score": 0.0, "feedback": "The answer is wrong."}}
+]
+"""
 
-        except Exception as e:
-            msg = f"Error calling LLM or parsing JSON => {e} => score=0.0."
-            feedback.append(msg)
-            self.logger.error(msg)
-            return {"score": 0.0, "feedback": feedback}
+    def _parse_evaluation(self, llm_output: str, feedback: list) -> dict:
+        """4) and 5): validates the judge's JSON and clamps its score. Raises on invalid JSON."""
+        llm_output = llm_output.strip()
+        self.logger.debug(f"Raw LLM output: {llm_output}")
+
+        # 4) Parse JSON into our Pydantic model
+        evaluation = AnswerEvaluation.model_validate_json(llm_output)
+
+        # 5) Clamp score
+        clamped_score = max(0.0, min(evaluation.score, 1.0))
+
+        if evaluation.feedback:
+            feedback.append(f"LLM feedback: {evaluation.feedback}")
+
+        return {"score": clamped_score, "feedback": feedback}
+
+    def _parse_batch(self, llm_output: str, size: int) -> dict:
+        """
+        4) and 5) for a batched call: {index: result} for each answer index
+        in range(size) the output covers (the first verdict wins if an
+        index repeats). Raises on output that is not a valid array.
+        """
+        llm_output = llm_output.strip()
+        self.logger.debug(f"Raw batched LLM output: {llm_output}")
+
+        verdicts = {}
+        for evaluation in AnswerEvaluations.model_validate_json(llm_output).root:
+            if 0 <= evaluation.index < size and evaluation.index not in verdicts:
+                feedback = [f"LLM feedback: {evaluation.feedback}"] if evaluation.feedback else []
+                verdicts[evaluation.index] = {"score": max(0.0, min(evaluation.score, 1.0)), "feedback": feedback}
+        if len(verdicts) < size:
+            self.logger.warning(f"Batched judge output covers {len(verdicts)} of {size} answers; "
+                                "judging the rest one by one.")
+        return verdicts
+
+    def _batch_failed(self, error: Exception, size: int) -> dict:
+        self.logger.warning(f"Batched judge call for {size} answers failed => {error}; "
+                            "judging them one by one.")
+        return {}
+
+    def _error_result(self, error: Exception, feedback: list) -> dict:
+        msg = f"Error calling LLM or parsing JSON => {error} => score=0.0."
+        feedback.append(msg)
+        self.logger.error(msg)
+        return {"score": 0.0, "feedback": feedback}
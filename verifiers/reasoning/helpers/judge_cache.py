@@ -0,0 +1,183 @@
+# helpers/judge_cache.py
+"""
+Persistent SQLite cache of LLM judge verdicts.
+
+Judge calls are the most expensive reward we compute, and re-running an
+eval used to pay for every one again. Verdicts are stored on disk, keyed
+by a hash of (model, prompt template version, answer, question, gold
+answer), so a rerun over the same dataset makes no judge calls at all.
+
+The cache keeps at most 'max_entries' verdicts, evicting the least
+recently used. Rows are counted in SQLite, so workers sharing one file
+evict correctly. The last_used times of hits are kept in memory and
+written with the next put(), or on every TOUCH_BATCH_SIZE-th hit, so
+most lookups only read. Async callers run lookups and writes on a worker
+thread (asyncio.to_thread), never on the event loop.
+
+In read-only mode the database is opened with mode=ro and never
+written: misses still go to the judge but are not stored, so a fixed
+cache gives reproducible evals.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_MAX_ENTRIES = 100_000
+# Hits whose last_used update is held back before it is written
+TOUCH_BATCH_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verdicts_last_used ON verdicts (last_used);
+"""
+
+
+class JudgeCache:
+    """
+    A verdict cache in one SQLite file, shared by every thread of the
+    process (calls are serialized by a lock; each is a single indexed
+    statement). Results are stored as the verifier returns them:
+    {"score": float, "feedback": [str, ...]}.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES, read_only: bool = False):
+        self.path = path
+        self.max_entries = max_entries
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key => time of its latest hit, not yet written
+        self._touched = {}
+        if read_only:
+            # Fails if the file does not exist: a read-only cache must be prepared beforehand
+            self._db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+            self._db.commit()
+
+    @classmethod
+    def from_env(cls):
+        """
+        Builds a cache from the environment, or returns None when it is disabled:
+          JUDGE_CACHE_PATH         SQLite file (unset => no cache)
+          JUDGE_CACHE_MAX_ENTRIES  verdicts kept (default 100000)
+          JUDGE_CACHE_READ_ONLY    "1" to only read the file (default "0")
+        """
+        path = os.environ.get("JUDGE_CACHE_PATH")
+        if not path:
+            return None
+        return cls(
+            path,
+            max_entries=int(os.environ.get("JUDGE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            read_only=os.environ.get("JUDGE_CACHE_READ_ONLY", "0") == "1",
+        )
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, answer: str, question: str, gold_answer: str) -> str:
+        payload = json.dumps([model, prompt_version, answer, question, gold_answer], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Returns the cached verdict for 'key', or None on a miss."""
+        with self._lock:
+            row = self._db.execute("SELECT result FROM verdicts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if not self.read_only:
+                self._touched[key] = time.time()
+                if len(self._touched) >= TOUCH_BATCH_SIZE:
+                    self._write_touches()
+                    self._db.commit()
+        return json.loads(row[0])
+
+    def _write_touches(self):
+        """Writes the held-back last_used times (caller holds the lock and commits)."""
+        if self._touched:
+            self._db.executemany(
+                "UPDATE verdicts SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def put(self, key: str, result: dict):
+        """Stores a verdict, evicting the least recently used beyond max_entries (no-op if read-only)."""
+        if self.read_only:
+            return
+        with self._lock:
+            self._write_touches()
+            inserted = self._db.execute(
+                "INSERT OR IGNORE INTO verdicts (key, result, last_used) VALUES (?, ?, ?)",
+                (key, json.dumps(result, ensure_ascii=False), time.time()),
+            ).rowcount
+            if inserted:
+                # Counted inside the write transaction, so other processes' rows are included
+                excess = self._count() - self.max_entries
+                if excess > 0:
+                    self._db.execute(
+                        "DELETE FROM verdicts WHERE key IN "
+                        "(SELECT key FROM verdicts ORDER BY last_used LIMIT ?)",
+                        (excess,),
+                    )
+                    self.evictions += excess
+            self._db.commit()
+
+    def _count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def clear(self):
+        if self.read_only:
+            return
+        with self._lock:
+            self._touched.clear()
+            self._db.execute("DELETE FROM verdicts")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            if not self.read_only:
+                self._write_touches()
+                self._db.commit()
+            self._db.close()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        with self._lock:
+            size = self._count()
+        return {
+            "path": self.path,
+            "read_only": self.read_only,
+            "size": size,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_default_cache = None
+_default_cache_loaded = False
+_default_cache_lock = threading.Lock()
+
+def default_judge_cache():
+    """The process-wide JudgeCache from the environment (None if JUDGE_CACHE_PATH is unset)."""
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        with _default_cache_lock:
+            if not _default_cache_loaded:
+                _default_cache = JudgeCache.from_env()
+                _default_cache_loaded = True
+    return _default_cache
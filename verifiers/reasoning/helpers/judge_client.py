@@ -0,0 +1,172 @@
+# helpers/judge_client.py
+"""
+Non-blocking client for the LLM judge (ollama's /api/chat with a
+structured-output schema).
+
+The synchronous ollama.chat() holds a server thread for the whole
+round-trip. Here pooled keep-alive ollama.AsyncClient sessions are
+shared by every judge call on the event loop, so the server can have
+hundreds of calls in flight without a thread each.
+
+httpcore's connection pool does work proportional to (waiting requests
+x connections) on every request, so one pool of hundreds of connections
+spends more CPU on bookkeeping than on the calls. The connections are
+therefore split into pools of POOL_SHARD_SIZE, and each call goes to the
+least busy one.
+
+Each call is bounded by a timeout, the number of calls in flight by a
+semaphore, and transient failures (timeouts, connection errors, 429 and
+5xx responses) are retried with exponential backoff and full jitter, so
+retries from many callers do not arrive in lockstep.
+"""
+import asyncio
+import logging
+import os
+import random
+
+import httpx
+from ollama import AsyncClient, ResponseError
+
+# Judge calls in flight at once (and pooled connections kept open)
+DEFAULT_MAX_CONCURRENCY = 64
+# Keep-alive connections per httpx pool; larger limits are split into several pools
+POOL_SHARD_SIZE = 8
+# Seconds allowed for one judge call, per attempt
+DEFAULT_TIMEOUT = 60.0
+# Retries after the first attempt fails with a transient error
+DEFAULT_RETRIES = 2
+# Backoff before retry n is uniform in [0, min(MAX_BACKOFF, BACKOFF * 2**n)] seconds
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 8.0
+
+# HTTP statuses worth retrying: the judge is overloaded or restarting
+RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+logger = logging.getLogger("judge_client")
+
+
+def is_transient(error: Exception) -> bool:
+    """True for failures a retry may fix: timeouts, connection errors, 429 and 5xx responses."""
+    if isinstance(error, ResponseError):
+        return error.status_code in RETRY_STATUS_CODES
+    return isinstance(error, (asyncio.TimeoutError, ConnectionError, httpx.TransportError))
+
+
+class JudgeClient:
+    """
+    A pooled, concurrency-limited async client for judge calls.
+
+    The HTTP sessions and the semaphore belong to the event loop they are
+    first used on; if the client is used from another loop (e.g. one
+    asyncio.run() per test), it opens a new session for that loop.
+    """
+
+    def __init__(self, host: str = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF):
+        self.host = host
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._loop = None
+        self._clients = []
+        self._shard_load = []
+        self._semaphore = None
+        self._counters = {"calls": 0, "retries": 0, "failures": 0}
+        self._in_flight = 0
+
+    @classmethod
+    def from_env(cls):
+        """
+        Builds a client from the environment:
+          JUDGE_HOST             ollama host (default: OLLAMA_HOST, then localhost:11434)
+          JUDGE_MAX_CONCURRENCY  judge calls in flight at once (default 64)
+          JUDGE_TIMEOUT          seconds per attempt (default 60)
+          JUDGE_RETRIES          retries of transient failures (default 2)
+        """
+        return cls(
+            host=os.environ.get("JUDGE_HOST") or None,
+            max_concurrency=int(os.environ.get("JUDGE_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+            timeout=float(os.environ.get("JUDGE_TIMEOUT", DEFAULT_TIMEOUT)),
+            retries=int(os.environ.get("JUDGE_RETRIES", DEFAULT_RETRIES)),
+        )
+
+    def _session(self):
+        """The (AsyncClients, semaphore) of the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            shards = -(-self.max_concurrency // POOL_SHARD_SIZE)
+            size = -(-self.max_concurrency // shards)
+            limits = httpx.Limits(max_connections=size, max_keepalive_connections=size)
+            self._clients = [AsyncClient(host=self.host, limits=limits) for _ in range(shards)]
+            self._shard_load = [0] * shards
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._clients, self._semaphore
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number 'attempt' (0-based): full jitter."""
+        return random.uniform(0, min(MAX_BACKOFF, self.backoff * 2 ** attempt))
+
+    async def chat(self, model: str, messages: list, format: dict = None) -> str:
+        """
+        Sends one chat request and returns the message content. Raises the
+        last error once the retries are used up, or at once for errors that
+        are not transient (e.g. a 404 for an unknown model).
+        """
+        clients, semaphore = self._session()
+        for attempt in range(self.retries + 1):
+            try:
+                async with semaphore:
+                    shard = min(range(len(clients)), key=self._shard_load.__getitem__)
+                    self._shard_load[shard] += 1
+                    self._in_flight += 1
+                    try:
+                        response = await asyncio.wait_for(
+                            clients[shard].chat(model=model, messages=messages, format=format),
+                            self.timeout,
+                        )
+                    finally:
+                        self._shard_load[shard] -= 1
+                        self._in_flight -= 1
+                self._counters["calls"] += 1
+                return response.message.content
+            except Exception as e:
+                if attempt == self.retries or not is_transient(e):
+                    self._counters["failures"] += 1
+                    raise
+                self._counters["retries"] += 1
+                delay = self.backoff_delay(attempt)
+                logger.warning(f"Judge call failed ({type(e).__name__}: {e}); retrying in {delay:.2f}s.")
+                # Sleep outside the semaphore so waiting retries do not hold a slot
+                await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        """Counters of completed calls, retries and failures, and the calls in flight."""
+        return {**self._counters, "in_flight": self._in_flight, "max_concurrency": self.max_concurrency}
+
+    async def aclose(self):
+        """Closes the pooled sessions (if they were opened on the running loop)."""
+        if self._loop is asyncio.get_running_loop():
+            for client in self._clients:
+                await client.close()
+        self._clients, self._shard_load = [], []
+        self._semaphore = self._loop = None
+
+
+_default_client = None
+
+def default_judge_client() -> JudgeClient:
+    """The process-wide JudgeClient, built from the environment on first use."""
+    global _default_client
+    if _default_client is None:
+        _default_client = JudgeClient.from_env()
+    return _default_client
+
+async def close_default_judge_client():
+    """Closes the process-wide client's session, if one was created."""
+    if _default_client is not None:
+        await _default_client.aclose()
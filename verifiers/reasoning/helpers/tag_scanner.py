@@ -0,0 +1,180 @@
+# helpers/tag_scanner.py
+"""
+Single-pass scanner for the <think>, <answer> and <verifier_answer> tags
+of a completion, shared by the reasoning verifiers.
+
+The verifiers used to match anchored regexes with lazy (.*?) groups,
+which backtrack over the whole text for each candidate closing tag: a
+long completion with a missing </answer> cost quadratic time. Here the
+text is tokenized once (the tag pattern is a set of literals, so the
+regex engine never backtracks), and the layouts are checked on the tag
+list, so every check is linear in the length of the text.
+"""
+import re
+from typing import NamedTuple
+
+TAG_NAMES = ("think", "answer", "verifier_answer")
+
+TAG_PATTERN = re.compile(r"<(/?)(think|answer|verifier_answer)>", re.IGNORECASE)
+
+
+class Tag(NamedTuple):
+    """One tag occurrence; 'exact' is False for case variants such as <ANSWER>."""
+    name: str
+    closing: bool
+    start: int
+    end: int
+    exact: bool
+
+
+class Section(NamedTuple):
+    """A tagged section: 'content' lies between the tags, at text[start:end]."""
+    name: str
+    content: str
+    start: int
+    end: int
+
+
+class Layout(NamedTuple):
+    """
+    The result of match_layout(): the sections in order when the text has
+    the layout ('ok'), otherwise the first structural error and the
+    offset it was found at.
+    """
+    sections: list
+    error: str = None
+    offset: int = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def describe_error(self) -> str:
+        return f"Format error at offset {self.offset}: {self.error}"
+
+
+def scan_tags(text: str) -> list:
+    """All tag occurrences in 'text', in order, found in one pass."""
+    tags = []
+    for match in TAG_PATTERN.finditer(text):
+        closing, name = match.groups()
+        lowered = name.lower()
+        tags.append(Tag(lowered, bool(closing), match.start(), match.end(), name == lowered))
+    return tags
+
+def _is_blank(text: str, start: int, end: int) -> bool:
+    return start >= end or text[start:end].isspace()
+
+def _first_nonblank(text: str, start: int = 0) -> int:
+    """Offset of the first non-whitespace character at or after 'start' (len(text) if none)."""
+    stripped = text[start:].lstrip()
+    return len(text) - len(stripped)
+
+def _found(text: str, offset: int) -> str:
+    snippet = text[offset:offset + 20]
+    return f"found {snippet!r}" if snippet else "found end of text"
+
+def match_layout(text: str, names: tuple = ("think", "answer"), tags: list = None) -> Layout:
+    """
+    Checks that 'text' is exactly <n1>...</n1><n2>...</n2>... for the tag
+    names in 'names' (lowercase tags, whitespace allowed around and between
+    the sections), as the anchored pattern
+
+        ^\\s*<n1>(.*?)</n1>\\s*<n2>(.*?)</n2> ... \\s*$   (re.DOTALL)
+
+    would, including its choice of boundaries when a section's content
+    itself contains tags: each section ends at the first closing tag that
+    is followed (after whitespace) by the next section's opening tag.
+
+    Pass 'tags' if scan_tags(text) has already been run.
+    """
+    if tags is None:
+        tags = scan_tags(text)
+    first, last = names[0], names[-1]
+
+    # 1) The text starts with <n1>
+    start = _first_nonblank(text)
+    if not tags or tags[0].start != start or not (tags[0].name == first and not tags[0].closing and tags[0].exact):
+        return Layout([], f"expected <{first}>, {_found(text, start)}.", start)
+
+    # 2) ... and ends with </nk>
+    final = len(tags) - 1
+    tail = tags[final]
+    ends_ok = tail.name == last and tail.closing and tail.exact and _is_blank(text, tail.end, len(text))
+
+    # 3) Each boundary is the first </n_i> followed by <n_i+1>, before the final </nk>
+    limit = final if ends_ok else len(tags)
+    opens = [tags[0]]
+    closes = []
+    i = 1
+    for name, following in zip(names, names[1:]):
+        while i + 1 < limit:
+            close, opening = tags[i], tags[i + 1]
+            if (close.name == name and close.closing and close.exact
+                    and opening.name == following and not opening.closing and opening.exact
+                    and _is_blank(text, close.end, opening.start)):
+                break
+            i += 1
+        else:
+            return Layout([], *_boundary_error(text, tags, opens[-1], name, following))
+        closes.append(tags[i])
+        opens.append(tags[i + 1])
+        i += 2
+
+    if not ends_ok:
+        return Layout([], *_ending_error(text, tags, opens[-1], last))
+    closes.append(tail)
+
+    sections = [
+        Section(opening.name, text[opening.end:close.start], opening.end, close.start)
+        for opening, close in zip(opens, closes)
+    ]
+    return Layout(sections)
+
+def _boundary_error(text: str, tags: list, opening: Tag, name: str, following: str) -> tuple:
+    for tag in tags:
+        if tag.start > opening.start and tag.name == name and tag.closing and tag.exact:
+            after = _first_nonblank(text, tag.end)
+            return f"expected <{following}> after </{name}>, {_found(text, after)}.", after
+    return f"<{name}> opened at offset {opening.start} is never closed.", len(text)
+
+def _ending_error(text: str, tags: list, opening: Tag, name: str) -> tuple:
+    close = None
+    for tag in reversed(tags):
+        if tag.start <= opening.start:
+            break
+        if tag.name == name and tag.closing and tag.exact:
+            close = tag
+            break
+    if close is None:
+        return f"<{name}> opened at offset {opening.start} is never closed.", len(text)
+    after = _first_nonblank(text, close.end)
+    return f"unexpected text after </{name}>, {_found(text, after)}.", after
+
+def find_section(text: str, name: str, tags: list = None):
+    """
+    The first <name>...</name> section, tags matched case-insensitively:
+    the first opening tag that has a closing tag after it, up to the first
+    such closing tag (what re.search(r"<name>(.*?)</name>", re.I | re.S)
+    finds). Returns a Section, or None.
+    """
+    if tags is None:
+        tags = scan_tags(text)
+    opening = None
+    for tag in tags:
+        if tag.name != name:
+            continue
+        if not tag.closing and opening is None:
+            opening = tag
+        elif tag.closing and opening is not None:
+            return Section(name, text[opening.end:tag.start], opening.end, tag.start)
+    return None
+
+def describe_missing(text: str, name: str, tags: list = None) -> str:
+    """Why find_section() found nothing: a tag that is never closed, or no tag at all."""
+    if tags is None:
+        tags = scan_tags(text)
+    for tag in tags:
+        if tag.name == name and not tag.closing:
+            return f"Format error at offset {tag.start}: <{name}> is never closed."
+    return f"Format error: no <{name}> tag found."
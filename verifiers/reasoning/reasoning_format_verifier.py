@@ -1,6 +1,6 @@
 # verifiers/reasoning/reasoning_format_verifier.py
-import re
 from verifiers.base_verifier import BaseVerifier
+from verifiers.reasoning.helpers.tag_scanner import match_layout
 
 class ReasoningFormatVerifier(BaseVerifier):
     """
@@ -11,10 +11,8 @@ class ReasoningFormatVerifier(BaseVerifier):
       => Returns score=1.0 if strictly matched, else 0.0
     """
 
-    STRICT_PATTERN = re.compile(
-        r"^\s*<think>(.*?)</think>\s*<answer>(.*?)</answer>\s*$",
-        re.DOTALL
-    )
+    # Required sections, in order (checked by a linear-time tag scan)
+    LAYOUT = ("think", "answer")
 
     def __init__(self):
         super().__init__(
@@ -26,23 +24,27 @@ class ReasoningFormatVerifier(BaseVerifier):
         )
 
     def verify(self, text: str, **kwargs) -> float:
-        result = self.verify_with_feedback(text, **kwargs)
-        return result["score"]
+        """Score-only path: 1.0 if strictly matched with non-empty tags, else 0.0."""
+        layout = match_layout(text, self.LAYOUT)
+        if not layout.ok:
+            return 0.0
+        return 1.0 if all(section.content.strip() for section in layout.sections) else 0.0
 
     def verify_with_feedback(self, text: str, **kwargs) -> dict:
         feedback = []
-        match = self.STRICT_PATTERN.match(text)
+        layout = match_layout(text, self.LAYOUT)
 
-        if not match:
+        if not layout.ok:
             # Entire text must match <think>...</think><answer>...</answer> pattern
             feedback.append("Text does not conform to the required format.")
             feedback.append(
                 "Ensure it follows: <think>reasoning...</think><answer>final answer...</answer>."
             )
+            feedback.append(layout.describe_error())
             return {"score": 0.0, "feedback": feedback}
 
-        # Pattern matched => extract the think and answer contents
-        think_content, answer_content = match.groups()
+        # Layout matched => extract the think and answer contents
+        think_content, answer_content = (section.content for section in layout.sections)
 
         # Check for empty <think> section
         if not think_content.strip():
@@ -1,6 +1,6 @@
 # reasoning/reasoning_format_with_verifier_answer_verifier.py
-import re
 from verifiers.base_verifier import BaseVerifier
+from verifiers.reasoning.helpers.tag_scanner import match_layout
 
 class ReasoningFormatWithVerifierAnswerVerifier(BaseVerifier):
     """
@@ -10,10 +10,8 @@ class ReasoningFormatWithVerifierAnswerVerifier(BaseVerifier):
       => Returns 1.0 if strictly matched, else 0.0
     """
 
-    STRICT_PATTERN = re.compile(
-        r"^\s*<think>(.*?)</think>\s*<answer>(.*?)</answer>\s*<verifier_answer>(.*?)</verifier_answer>\s*$",
-        re.DOTALL
-    )
+    # Tag names of the three sections, in order
+    LAYOUT = ("think", "answer", "verifier_answer")
 
     def __init__(self):
         super().__init__(
@@ -26,15 +24,18 @@ class ReasoningFormatWithVerifierAnswerVerifier(BaseVerifier):
         )
 
     def verify(self, text: str, **kwargs) -> float:
-        result = self.verify_with_feedback(text, **kwargs)
-        return result["score"]
+        """Score-only path: 1.0 if strictly matched with all tags non-empty, else 0.0."""
+        layout = match_layout(text, self.LAYOUT)
+        if not layout.ok:
+            return 0.0
+        return 1.0 if all(section.content.strip() for section in layout.sections) else 0.0
 
     def verify_with_feedback(self, text: str, **kwargs) -> dict:
         feedback = []
-        match = self.STRICT_PATTERN.match(text)
+        layout = match_layout(text, self.LAYOUT)
 
-        if match:
-            think_content, answer_content, verifier_answer_content = match.groups()
+        if layout.ok:
+            think_content, answer_content, verifier_answer_content = (section.content for section in layout.sections)
             # Check all are non-empty after trimming whitespace
             if think_content.strip() and answer_content.strip() and verifier_answer_content.strip():
                 feedback.append("Strict match for <think>, <answer>, <verifier_answer> => score=1.0.")
@@ -46,4 +47,5 @@ class ReasoningFormatWithVerifierAnswerVerifier(BaseVerifier):
             feedback.append(
                 "Does not strictly match <think>...</think><answer>...</answer><verifier_answer>...</verifier_answer> => score=0.0."
             )
+            feedback.append(layout.describe_error())
             return {"score": 0.0, "feedback": feedback}
@@ -1,18 +1,17 @@
 # verifiers/reasoning/verifier_answer_verifier.py
-import re
 import logging
 from verifiers.base_verifier import BaseVerifier
+from verifiers.math.helpers.normalize import compare_answers, normalize_gold
+from verifiers.reasoning.helpers.tag_scanner import describe_missing, find_section, scan_tags
 
 class VerifierAnswerVerifier(BaseVerifier):
     """
     Checks if the final answer is within <verifier_answer>...</verifier_answer> 
-    and matches the provided 'gold_solution' (a plain string).
+    and matches the provided 'gold_solution' (a plain string), either
+    exactly or after normalization ("1,400", "1.4E+3" and "1400" match).
     """
-
-    VERIFIER_ANSWER_PATTERN = re.compile(
-        r"<verifier_answer>\s*(.*?)\s*</verifier_answer>",
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    # 2: answers with the same canonical number also match
+    VERSION = "2"
 
     def __init__(self, name="verifier_answer_verifier"):
         super().__init__(
@@ -30,8 +29,14 @@ class VerifierAnswerVerifier(BaseVerifier):
         If 'gold_solution' is present, compare it.
         Otherwise, return 1.0 for 'no gold_solution provided' per the test expectations.
         """
-        result = self.verify_with_feedback(text, **kwargs)
-        return result["score"]
+        gold_solution = kwargs.get("gold_solution", None)
+        if gold_solution is None:
+            return 1.0
+
+        section = find_section(text, "verifier_answer")
+        if section is None:
+            return 0.0
+        return 1.0 if compare_answers(section.content, gold_solution) else 0.0
 
     def verify_with_feedback(self, text: str, **kwargs) -> dict:
         """
@@ -47,19 +52,28 @@ class VerifierAnswerVerifier(BaseVerifier):
             return {"score": 1.0, "feedback": feedback}
 
         # 2) Extract <verifier_answer> from model output
-        match = self.VERIFIER_ANSWER_PATTERN.search(text)
-        if not match:
+        tags = scan_tags(text)
+        section = find_section(text, "verifier_answer", tags)
+        if section is None:
             feedback.append("No <verifier_answer>...</verifier_answer> found in model output.")
+            feedback.append(describe_missing(text, "verifier_answer", tags))
             return {"score": 0.0, "feedback": feedback}
 
-        model_answer = match.group(1).strip()
+        model_answer = section.content.strip()
         gold_solution_stripped = gold_solution.strip()
 
-        # 3) Compare ignoring extra whitespace
-        if model_answer == gold_solution_stripped:
+        # 3) Compare ignoring extra whitespace, then the canonical forms
+        match = compare_answers(model_answer, gold_solution_stripped)
+        if match == "exact":
             # Must use lowercase "matches exactly =>" so the tests pass
             feedback.append(f"matches exactly => model: '{model_answer}', gold: '{gold_solution}' => score=1.0")
             return {"score": 1.0, "feedback": feedback}
+        elif match == "normalized":
+            feedback.append(
+                f"matches after normalization => model: '{model_answer}', gold: '{gold_solution}' "
+                f"(both '{normalize_gold(gold_solution_stripped)}') => score=1.0"
+            )
+            return {"score": 1.0, "feedback": feedback}
         else:
             # Must use lowercase "differs =>" so the tests pass
             feedback.append(f"differs => model: '{model_answer}', gold: '{gold_solution}' => score=0.0")